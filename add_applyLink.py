@@ -1,77 +1,177 @@
 import pandas as pd
-from selenium import webdriver
+import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import time
 from datetime import date
+import concurrent.futures
+import functools
 
-today = date.today()
-formatted_date = today.strftime("%Y-%m-%d")
+from browser_pool import WAIT_POLL_SECONDS, BrowserPool
+from perf_trace import STAGE_APPLY_CLICK, STAGE_FETCH, STAGE_READY_WAIT, PerfTrace
+from state_store import STAGE_APPLY_LINK, PipelineStateStore
+from table_store import load_table, save_table, table_path
+from zighang_resolver import get_posting_id, resolve_without_browser
 
-# 1. 엑셀 파일 읽기
-input_filename = f'sheets/list_in_major_corp_{formatted_date}.xlsx'
+# --- 사용자 설정 영역 ---
+BROWSER_POOL_SIZE = 3  # 동시에 띄울 headless Chrome 개수
+BROWSER_PAGE_BUDGET = 50  # 드라이버 하나가 처리할 최대 페이지 수 (초과 시 재시작)
+HTTP_WORKERS = 8  # 브라우저 없이 직행 공고 페이지를 동시에 요청할 스레드 수
+BROWSER_FAST_PROFILE = True  # 이미지/폰트/CSS/분석 스크립트를 막고 DOMContentLoaded까지만 기다림 (False면 전체 로드)
+STATE_DB_PATH = "cache/pipeline_state.sqlite3"  # 공고별 단계 완료 기록 (중단 후 재실행 시 이어서 처리)
+TRACE_DIR = "cache/traces"  # 브라우저로 처리한 공고별 단계 소요 시간 기록 (JSON-lines)
+# -----------------------
 
-try:
-    df = pd.read_excel(input_filename)
-except FileNotFoundError:
-    print(f"'{input_filename}' 파일을 찾을 수 없습니다. 파일 이름을 확인해주세요.")
-    exit()
 
-# 지원 링크 결과를 저장할 데이터프레임 생성
-result_df = pd.DataFrame({"링크": df["링크"], "지원 링크": ["추출 실패"] * len(df)})
+def resolve_apply_link(driver, original_link, trace=None, profile=None):
+    """
+    직행 공고 페이지에서 '지원하기' 버튼을 눌러 열리는 원본 공고의 주소를 반환합니다.
+    (페이지 마크업에서 주소를 찾지 못한 경우에만 사용하는 대체 경로입니다.)
 
+    고정된 시간만큼 쉬지 않고 버튼이 나타날 때, 새 창이 열릴 때, 새 창이 원본 공고 주소로
+    이동했을 때를 기다립니다. trace(PerfTrace)를 주면 단계별 시간을 profile(BrowserPool.profile_name)과
+    함께 기록합니다.
+    """
+    start = time.time()
+    driver.get(original_link)
+    loaded = time.time()
+    wait = WebDriverWait(driver, 20, poll_frequency=WAIT_POLL_SECONDS)
+    apply_button = wait.until(
+        EC.presence_of_element_located(
+            (
+                By.XPATH,
+                "//button[contains(@class, 'bg-primary') and contains(., '지원하기')]",
+            )
+        )
+    )
+    button_found = time.time()
 
-driver = webdriver.Chrome()
-for index, row in df.iterrows():
+    original_window = driver.current_window_handle
+    handles_before = driver.window_handles
+    driver.execute_script("arguments[0].click();", apply_button)
+    wait.until(EC.new_window_is_opened(handles_before))
 
-    original_link = row["링크"]
-    print(f"처리 중 ({index + 1}/{len(df)}): {original_link}")
+    for window_handle in driver.window_handles:
+        if window_handle != original_window:
+            driver.switch_to.window(window_handle)
+            break
 
     try:
-        driver.get(original_link)
-        wait = WebDriverWait(driver, 20)
+        # 새 창은 about:blank로 열린 뒤 이동하므로, 원본 공고 문서가 열릴 때까지 기다림
+        # (HTTP 리다이렉트는 문서가 열리기 전에 끝나므로 최종 주소를 얻음)
         wait.until(
-            lambda driver: driver.execute_script(
-                "return document.readyState === 'complete'"
-            )
-        )
-        apply_button = wait.until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//button[contains(@class, 'bg-primary') and contains(., '지원하기')]",
-                )
-            )
+            lambda d: d.current_url not in ("", "about:blank")
+            and d.execute_script("return document.readyState") != "loading"
         )
+        apply_page_url = driver.current_url
+    finally:
+        # 다음 공고를 위해 드라이버를 원래 창 하나만 남은 상태로 되돌림
+        driver.close()
+        driver.switch_to.window(original_window)
+    if trace is not None:
+        trace.record(original_link, STAGE_FETCH, loaded - start, mode="browser", profile=profile)
+        trace.record(original_link, STAGE_READY_WAIT, button_found - loaded, profile=profile)
+        trace.record(original_link, STAGE_APPLY_CLICK, time.time() - button_found, profile=profile)
+    return apply_page_url
 
-        original_window = driver.current_window_handle
-        driver.execute_script("arguments[0].click();", apply_button)
-        wait.until(EC.number_of_windows_to_be(2))
 
-        for window_handle in driver.window_handles:
-            if window_handle != original_window:
-                driver.switch_to.window(window_handle)
-                break
+def main():
+    today = date.today()
+    formatted_date = today.strftime("%Y-%m-%d")
 
-        time.sleep(1)
-        apply_page_url = driver.current_url
-        result_df.at[index, "지원 링크"] = apply_page_url
-        print(f"  -> 지원 링크: {apply_page_url}")
+    # 1. 이전 단계 결과 읽기
+    input_name = f'list_in_major_corp_{formatted_date}'
 
-        driver.close()
-        driver.switch_to.window(original_window)
+    try:
+        df = load_table(input_name)
+    except FileNotFoundError:
+        print(f"'{table_path(input_name)}' 파일을 찾을 수 없습니다. 파일 이름을 확인해주세요.")
+        return
+
+    # 지원 링크 결과를 저장할 데이터프레임 생성
+    result_df = pd.DataFrame({"링크": df["링크"], "지원 링크": ["추출 실패"] * len(df)})
+
+    # 2. 이전 실행 기록 → 페이지 마크업 순서로 브라우저 없이 해석
+    # 결과는 직행 공고 ID 단위로 해석되는 즉시 상태 저장소에 커밋되므로,
+    # 중간에 중단되어도 다시 실행하면 남은 공고만 처리합니다.
+    state = PipelineStateStore(STATE_DB_PATH)
+    session = requests.Session()
+    unresolved = []
+
+    # 같은 공고 ID가 여러 행에 있어도 한 번만 해석
+    posting_ids = [get_posting_id(link) for link in df["링크"]]
+    resolved = state.get_many(posting_ids, STAGE_APPLY_LINK)
+    pending = {}
+    for posting_id, original_link in zip(posting_ids, df["링크"]):
+        if posting_id not in resolved:
+            pending.setdefault(posting_id, original_link)
+    pending = list(pending.values())
+    print(f"전체 {len(df)}건 중 새로 해석할 공고: {len(pending)}건 (나머지는 이전 실행 결과 사용)")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=HTTP_WORKERS) as executor:
+        futures = [
+            executor.submit(resolve_without_browser, original_link, session)
+            for original_link in pending
+        ]
+        for future, original_link in zip(futures, pending):
+            try:
+                apply_page_url = future.result()
+            except Exception as e:
+                print(f"  -> 페이지 요청 실패: {original_link} ({type(e).__name__})")
+                apply_page_url = None
+
+            if apply_page_url:
+                state.mark_done(get_posting_id(original_link), STAGE_APPLY_LINK, apply_page_url)
+                print(f"  -> 지원 링크 (HTML): {apply_page_url}")
+            else:
+                unresolved.append(original_link)
+
+    # 3. 마크업에서 찾지 못한 공고만 브라우저 풀로 '지원하기'를 눌러 처리
+    pool = BrowserPool(
+        size=BROWSER_POOL_SIZE,
+        page_budget=BROWSER_PAGE_BUDGET,
+        fast_profile=BROWSER_FAST_PROFILE,
+    )
+    trace = PerfTrace(
+        f"{TRACE_DIR}/apply_link_{time.strftime('%Y%m%d_%H%M%S')}.jsonl" if unresolved else None
+    )
+    for done, (original_link, apply_page_url, error) in enumerate(
+        pool.imap_unordered(
+            functools.partial(resolve_apply_link, trace=trace, profile=pool.profile_name),
+            unresolved,
+        )
+    ):
+        print(f"처리 완료 ({done + 1}/{len(unresolved)}): {original_link}")
+
+        posting_id = get_posting_id(original_link)
+        if error is None:
+            state.mark_done(posting_id, STAGE_APPLY_LINK, apply_page_url)
+            print(f"  -> 지원 링크: {apply_page_url}")
+        elif isinstance(error, TimeoutException):
+            state.mark_failed(posting_id, STAGE_APPLY_LINK, error)
+            print(f"  -> '지원하기' 버튼을 찾을 수 없거나 시간 초과.")
+        else:
+            state.mark_failed(posting_id, STAGE_APPLY_LINK, error)
+            print(f"  -> 처리 중 예상치 못한 오류 발생: {type(error).__name__} - {error}")
+
+    if unresolved:
+        print(f"--- 브라우저 처리 단계별 소요 시간 (공고 한 건 기준, 초, 프로필: {pool.profile_name}) ---")
+        trace.print_summary()
+        print(f"  -> 공고별 기록: '{trace.path}'")
+    trace.close()
+
+    resolved = state.get_many(posting_ids, STAGE_APPLY_LINK)
+    for index, posting_id in zip(df.index, posting_ids):
+        if posting_id in resolved:
+            result_df.at[index, "지원 링크"] = resolved[posting_id]
 
-    except TimeoutException:
-        print(f"  -> '지원하기' 버튼을 찾을 수 없거나 시간 초과.")
-    except Exception as e:
-        print(f"  -> 처리 중 예상치 못한 오류 발생: {type(e).__name__} - {e}")
+    # 4. 결과 저장
+    final_df = df.merge(result_df, on="링크", how="left")
+    output_filename = save_table(final_df, f'list_with_applyLink_{formatted_date}')
+    print(f"\n작업 완료! 결과가 '{output_filename}' 파일에 저장되었습니다.")
 
-driver.quit()
 
-# 4. 결과 저장
-final_df = df.merge(result_df, on="링크", how="left")
-output_filename = f'sheets/list_with_applyLink_{formatted_date}.xlsx'
-final_df.to_excel(output_filename, index=False)
-print(f"\n작업 완료! 결과가 '{output_filename}' 파일에 저장되었습니다.")
+if __name__ == "__main__":
+    main()
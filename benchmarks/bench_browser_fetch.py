@@ -0,0 +1,177 @@
+"""
+브라우저 수집 방식(이전 방식 / 기본 / 빠른 수집)별 페이지당 소요 시간을 비교합니다. headless Chrome이 필요합니다.
+
+    python -m benchmarks.bench_browser_fetch                       # 페이지 30개, 리소스 지연 0.2초
+    python -m benchmarks.bench_browser_fetch --pages 60 --asset-latency 0.5 --pool-size 3
+
+가짜 웹 서버가 이미지/폰트/CSS를 asset_latency초씩 늦게 돌려주는 지원 페이지와,
+JS로 '지원하기' 버튼을 그린 뒤 누르면 새 창으로 지원 페이지를 여는 직행 공고 페이지를 제공합니다.
+두 프로필로 llm_qual_spec_par.collect_page_html(본문 수집)과
+add_applyLink.resolve_apply_link('지원하기' 클릭)을 돌려 단계별 시간을 출력합니다.
+기준으로 이벤트 대기 도입 전의 방식(readyState 'complete'까지 기다리고, 새 창이 열리면
+1초 쉰 뒤 주소를 읽음)도 기본 프로필 브라우저로 함께 잽니다.
+"""
+
+import argparse
+import functools
+import random
+import time
+
+import add_applyLink
+import llm_qual_spec_par
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks.fixtures import make_apply_page
+from benchmarks.stub_servers import StubSiteServer
+from browser_pool import BrowserPool
+from perf_trace import STAGE_APPLY_CLICK, STAGE_FETCH, STAGE_READY_WAIT, PerfTrace
+
+LEGACY_PROFILE = "legacy"
+
+IMAGES_PER_PAGE = 12
+ASSET_TAGS = (
+    '<link rel="stylesheet" href="/static/site.css">'
+    '<link rel="preload" as="font" href="/static/font.woff2" crossorigin>'
+    + "".join(f'<img src="/static/img{i}.png" alt="">' for i in range(IMAGES_PER_PAGE))
+)
+# 직행 공고 페이지처럼 본문과 '지원하기' 버튼을 JS로 늦게 그림
+ZIGHANG_PAGE = (
+    '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">{assets}</head><body>'
+    '<div id="app"></div><script>'
+    "document.addEventListener('DOMContentLoaded', () => setTimeout(() => {{"
+    "  const button = document.createElement('button');"
+    "  button.className = 'bg-primary';"
+    "  button.textContent = '지원하기';"
+    "  button.onclick = () => window.open('{target}', '_blank');"
+    "  document.getElementById('app').appendChild(button);"
+    "}}, 100));"
+    "</script></body></html>"
+)
+
+
+def make_site(count, target_chars, seed=0):
+    rng = random.Random(seed)
+    pages = {}
+    for i in range(count):
+        html = make_apply_page(rng, target_chars)
+        pages[f"/apply/{i}"] = html.replace("</head>", ASSET_TAGS + "</head>", 1)
+        pages[f"/recruitment/{i}"] = ZIGHANG_PAGE.format(assets=ASSET_TAGS, target=f"/apply/{i}")
+    assets = {"/static/site.css": ("text/css", b"body { font-family: Pretendard; }")}
+    assets["/static/font.woff2"] = ("font/woff2", bytes(20_000))
+    for i in range(IMAGES_PER_PAGE):
+        assets[f"/static/img{i}.png"] = ("image/png", bytes(50_000))
+    return pages, assets
+
+
+def wait_for_load(driver, timeout):
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState === 'complete'")
+    )
+
+
+def legacy_collect_page_html(driver, apply_link, trace=None, profile=LEGACY_PROFILE):
+    """
+    이벤트 대기 도입 전의 본문 수집: 모든 리소스를 받을 때까지(readyState 'complete') 기다림
+    """
+    start = time.time()
+    driver.get(apply_link)
+    loaded = time.time()
+    wait_for_load(driver, 10)
+    if trace is not None:
+        trace.record(apply_link, STAGE_FETCH, loaded - start, mode="browser", profile=profile)
+        trace.record(apply_link, STAGE_READY_WAIT, time.time() - loaded, profile=profile)
+    return driver.page_source
+
+
+def legacy_resolve_apply_link(driver, original_link, trace=None, profile=LEGACY_PROFILE):
+    """
+    이벤트 대기 도입 전의 '지원하기' 클릭: 전체 로드를 기다린 뒤 버튼을 누르고, 새 창이 열리면 1초 쉼
+    """
+    start = time.time()
+    driver.get(original_link)
+    loaded = time.time()
+    wait = WebDriverWait(driver, 20)
+    wait_for_load(driver, 20)
+    apply_button = wait.until(
+        EC.presence_of_element_located(
+            (By.XPATH, "//button[contains(@class, 'bg-primary') and contains(., '지원하기')]")
+        )
+    )
+    button_found = time.time()
+
+    original_window = driver.current_window_handle
+    driver.execute_script("arguments[0].click();", apply_button)
+    wait.until(EC.number_of_windows_to_be(2))
+    for window_handle in driver.window_handles:
+        if window_handle != original_window:
+            driver.switch_to.window(window_handle)
+            break
+    try:
+        time.sleep(1)
+        apply_page_url = driver.current_url
+    finally:
+        driver.close()
+        driver.switch_to.window(original_window)
+    if trace is not None:
+        trace.record(original_link, STAGE_FETCH, loaded - start, mode="browser", profile=profile)
+        trace.record(original_link, STAGE_READY_WAIT, button_found - loaded, profile=profile)
+        trace.record(original_link, STAGE_APPLY_CLICK, time.time() - button_found, profile=profile)
+    return apply_page_url
+
+
+def run_profile(fast_profile, pool_size, apply_links, zighang_links, legacy=False):
+    pool = BrowserPool(size=pool_size, page_budget=len(apply_links) + 1, fast_profile=fast_profile)
+    if legacy:
+        profile = LEGACY_PROFILE
+        tasks = (legacy_collect_page_html, legacy_resolve_apply_link)
+    else:
+        profile = pool.profile_name
+        tasks = (llm_qual_spec_par.collect_page_html, add_applyLink.resolve_apply_link)
+
+    results = {}
+    for label, task, links in zip(("본문 수집", "지원하기 클릭"), tasks, (apply_links, zighang_links)):
+        trace = PerfTrace()
+        errors = 0
+        start = time.perf_counter()
+        for _, _, error in pool.imap_unordered(
+            functools.partial(task, trace=trace, profile=profile), links
+        ):
+            errors += error is not None
+        elapsed = time.perf_counter() - start
+        print(f"\n[{profile}] {label}: {len(links)}건 {elapsed:.2f}s (실패 {errors}건)")
+        trace.print_summary()
+        results[label] = elapsed
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=30)
+    parser.add_argument("--chars", type=int, default=20_000, help="지원 페이지 HTML 크기")
+    parser.add_argument("--latency", type=float, default=0.05, help="HTML 응답 지연(초)")
+    parser.add_argument("--asset-latency", type=float, default=0.2, help="이미지/폰트/CSS 응답 지연(초)")
+    parser.add_argument("--pool-size", type=int, default=3)
+    args = parser.parse_args()
+
+    pages, assets = make_site(args.pages, args.chars)
+    with StubSiteServer(
+        pages, latency=args.latency, assets=assets, asset_latency=args.asset_latency
+    ) as site:
+        apply_links = [site.url_for(f"/apply/{i}") for i in range(args.pages)]
+        zighang_links = [site.url_for(f"/recruitment/{i}") for i in range(args.pages)]
+        legacy = run_profile(False, args.pool_size, apply_links, zighang_links, legacy=True)
+        default = run_profile(False, args.pool_size, apply_links, zighang_links)
+        fast = run_profile(True, args.pool_size, apply_links, zighang_links)
+
+    print("\n=== 방식 비교 (전체 시간) ===")
+    for label in legacy:
+        print(
+            f"  {label:<10} 이전 방식 {legacy[label]:7.2f}s → 기본 {default[label]:7.2f}s "
+            f"→ 빠른 수집 {fast[label]:7.2f}s (이전 방식 대비 {legacy[label] / fast[label]:.1f}배)"
+        )
+
+
+if __name__ == "__main__":
+    main()
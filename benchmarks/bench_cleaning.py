@@ -0,0 +1,123 @@
+"""
+지원 페이지 HTML 정리(reduce_content)의 페이지당 시간을 html.parser와 lxml 백엔드로 비교합니다.
+
+    python -m benchmarks.bench_cleaning                # 10만 자 안팎의 페이지 200개
+    python -m benchmarks.bench_cleaning --pages 500 --workers 4
+
+실제 채용 페이지처럼 스크립트/내비게이션/반복 카드가 많은 가짜 페이지를 만들어
+두 백엔드의 결과가 같은지 확인하고, ReducerPool(프로세스 풀)로 돌렸을 때의 처리량도 측정합니다.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from content_reducer import reduce_content
+from reducer_pool import ReducerPool
+
+REQUIREMENTS = [
+    "Python 또는 Go 언어 개발 경험 3년 이상",
+    "PyTorch, TensorFlow 등 딥러닝 프레임워크 활용 경험",
+    "대규모 분산 학습 환경 구축 경험",
+    "Experience with Kubernetes &amp; Docker",
+    "컴퓨터공학 또는 관련 전공 학사 이상",
+]
+PREFERRED = [
+    "LLM 파인튜닝 및 서빙 경험",
+    "오픈소스 기여 경험",
+    "Top-tier 학회 논문 게재 경험",
+    "MLOps 파이프라인 운영 경험",
+]
+
+
+def make_page(rng, target_chars):
+    head = (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\"><title>채용 공고</title>"
+        + "".join(
+            f"<script>window.__chunk{i}=function(a){{return a<{i}&&\"</div>\";}};</script>"
+            for i in range(20)
+        )
+        + "<style>.card>p{margin:0}</style></head><body>"
+    )
+    nav = "<header><nav>" + "".join(
+        f'<a href="/menu/{i}">메뉴 {i}</a>' for i in range(30)
+    ) + "</nav></header>"
+    posting = (
+        "<main><article><h1>AI 엔지니어 채용</h1><h2>주요 업무</h2><ul>"
+        + "".join(f"<li>업무 설명 {i}</li>" for i in range(5))
+        + "</ul><h2>자격요건</h2><ul>"
+        + "".join(f"<li>{item}</li>" for item in rng.sample(REQUIREMENTS, 4))
+        + "</ul><h3>우대사항</h3><ul>"
+        + "".join(f"<li>{item}</li>" for item in rng.sample(PREFERRED, 3))
+        + "</ul><h2>복리후생</h2><p>유연 근무<br>점심 제공</p></article>"
+    )
+    cards = []
+    size = len(head) + len(nav) + len(posting)
+    while size < target_chars:
+        card = (
+            f'<div class="card" data-id="{rng.randint(0, 10**9)}"><svg><path d="M0 0h24v24"/></svg>'
+            f"<p>다른 공고 {rng.randint(0, 9999)}</p><span>서울 · 정규직</span>"
+            "<button>지원하기</button></div>"
+        )
+        cards.append(card)
+        size += len(card)
+    footer = "<footer><p>© 2025 Example Corp. All rights reserved.</p></footer></main></body></html>"
+    return head + nav + posting + "".join(cards) + footer
+
+
+def per_page_latencies(pages, fast_parser):
+    latencies = []
+    results = []
+    for page in pages:
+        start = time.perf_counter()
+        results.append(reduce_content(page, fast_parser=fast_parser)[0])
+        latencies.append(time.perf_counter() - start)
+    return latencies, results
+
+
+def print_latencies(label, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"{label:<22}중앙값 {statistics.median(latencies) * 1000:7.1f}ms"
+        f"  p95 {p95 * 1000:7.1f}ms  합계 {sum(latencies):6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--chars", type=int, default=120_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pages = [make_page(rng, args.chars) for _ in range(args.pages)]
+    print(f"페이지 {len(pages)}개, 평균 {statistics.mean(map(len, pages)):,.0f}자")
+
+    before, expected = per_page_latencies(pages, fast_parser=False)
+    after, actual = per_page_latencies(pages, fast_parser=True)
+    print_latencies("html.parser (기존)", before)
+    print_latencies("lxml", after)
+    print(f"-> 페이지당 {statistics.median(before) / statistics.median(after):.1f}배 빠름")
+    print(f"-> 결과 불일치: {sum(1 for a, b in zip(expected, actual) if a != b)}건")
+
+    reducer = ReducerPool(workers=args.workers)
+    start = time.perf_counter()
+    pooled = {
+        index: reduced[0]
+        for index, reduced, _ in reducer.imap_unordered(
+            (index, page, None) for index, page in enumerate(pages)
+        )
+    }
+    elapsed = time.perf_counter() - start
+    reducer.close()
+    print(
+        f"ReducerPool             {len(pages) / elapsed:,.1f}페이지/초 "
+        f"(결과 불일치: {sum(1 for i, text in pooled.items() if text != expected[i])}건)"
+    )
+
+
+if __name__ == "__main__":
+    main()
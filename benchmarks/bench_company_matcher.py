@@ -0,0 +1,119 @@
+"""
+대기업 목록으로 공고를 거르는 회사 이름 매칭 속도를 측정합니다.
+
+    python -m benchmarks.bench_company_matcher                          # 회사 3천 개, 공고 20만 건
+    python -m benchmarks.bench_company_matcher --companies 5000 --postings 500000
+
+가짜 회사 목록과, 그 회사들을 "(주)", 띄어쓰기, 자회사 이름, 영문 법인 표기로 바꿔 쓴 공고 및
+목록에 없는 회사의 공고를 섞어 만들고, 공백만 지운 isin 필터 / 모든 회사와 하나씩 비교하는
+difflib 유사도 (일부 이름으로 측정해 전체 시간을 추정) / CompanyMatcher를 비교합니다.
+"""
+
+import argparse
+import difflib
+import random
+import time
+
+import pandas as pd
+
+from company_matcher import CompanyMatcher, normalize_company
+
+SYLLABLES = "가나다라마바사아자차카타파하한국대우성진영동서남북신세계일미래기술전자화학"
+SUFFIXES = ["", "테크", "솔루션", "랩스", "AI", "시스템즈", "네트웍스", "바이오"]
+SUBSIDIARY_SUFFIXES = ["에너지솔루션", " AI연구원", "클라우드", " 디지털", "이노텍"]
+
+
+def make_company(rng):
+    if rng.random() < 0.3:
+        return "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(rng.randint(2, 6))) + rng.choice(SUFFIXES)
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) + rng.choice(SUFFIXES)
+
+
+def variant(rng, company):
+    kind = rng.randrange(5)
+    if kind == 0:
+        return company, company
+    if kind == 1:
+        return rng.choice(["(주)", "㈜", "주식회사 "]) + company, company
+    if kind == 2:
+        return " ".join(company), company
+    if kind == 3:
+        return company + rng.choice(SUBSIDIARY_SUFFIXES), company
+    return company + " Co., Ltd.", company
+
+
+def make_data(companies, postings, seed=0):
+    rng = random.Random(seed)
+    corp_list = sorted({make_company(rng) for _ in range(companies)})
+    # 공고의 회사 이름 종류는 공고 수보다 훨씬 적음 (같은 회사가 공고를 여러 개 냄)
+    names = []
+    expected = {}
+    for _ in range(max(postings // 10, 1)):
+        if rng.random() < 0.4:
+            name, company = variant(rng, rng.choice(corp_list))
+        else:
+            name, company = make_company(rng) + rng.choice(["", "코리아", "파트너스"]), None
+        names.append(name)
+        expected[name] = company
+    listings = pd.Series([rng.choice(names) for _ in range(postings)], name="회사")
+    return corp_list, listings, expected
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--companies", type=int, default=3_000)
+    parser.add_argument("--postings", type=int, default=200_000)
+    parser.add_argument("--difflib-sample", type=int, default=50, help="difflib 방식을 직접 재는 이름 수")
+    args = parser.parse_args()
+
+    corp_list, listings, expected = make_data(args.companies, args.postings)
+    should_match = sum(expected[name] is not None for name in listings)
+    print(f"회사 목록 {len(corp_list):,}개, 공고 {len(listings):,}건 (서로 다른 회사 이름 {listings.nunique():,}개)")
+    print(f"목록 회사의 공고: {should_match:,}건\n")
+
+    stripped = set(name.replace(" ", "") for name in corp_list)
+    elapsed, mask = timed(lambda: listings.str.replace(" ", "", regex=False).isin(stripped))
+    print(f"{'공백 제거 + isin':<22}{elapsed:>8.2f}s  찾은 공고 {mask.sum():>9,}건")
+
+    sample = list(pd.unique(listings))[: args.difflib_sample]
+    normalized_corps = [normalize_company(c) for c in corp_list]
+
+    def difflib_match():
+        for name in sample:
+            key = normalize_company(name)
+            max(normalized_corps, key=lambda c: difflib.SequenceMatcher(None, key, c).ratio())
+
+    elapsed, _ = timed(difflib_match)
+    estimate = elapsed / len(sample) * listings.nunique()
+    print(f"{'difflib 전체 비교(추정)':<22}{estimate:>8.1f}s  (이름 {len(sample)}개에 {elapsed:.2f}s)")
+
+    build, matcher = timed(lambda: CompanyMatcher(corp_list))
+    elapsed, matched = timed(lambda: matcher.match_series(listings))
+    found = matched["매칭 회사"].notna()
+    correct = sum(
+        matched_company == expected[name]
+        for name, matched_company in zip(listings[found], matched.loc[found, "매칭 회사"])
+    )
+    # 목록에 없는 회사의 공고를 목록 회사로 보거나 다른 회사로 잘못 찾은 경우
+    false_positives = found.sum() - correct
+    print(
+        f"{'CompanyMatcher':<22}{elapsed:>8.2f}s  찾은 공고 {found.sum():>9,}건 "
+        f"(정답 {correct:,}건, 오탐 {false_positives:,}건, 색인 생성 {build:.2f}s)"
+    )
+    print(
+        f"  -> 정밀도 {correct / max(found.sum(), 1):.1%}, "
+        f"재현율 {correct / max(should_match, 1):.1%}"
+    )
+    print("  -> 매칭 방식: " + ", ".join(
+        f"{kind} {count:,}건" for kind, count in matched["매칭 방식"].value_counts().items()
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+직행 공고 카드 파서의 처리량을 BeautifulSoup 구현(get_job_info)과 비교합니다.
+
+    python -m benchmarks.bench_listing_parser              # 카드 5만 장
+    python -m benchmarks.bench_listing_parser --cards 200000 --workers 8
+
+listly로 수집한 실제 카드와 같은 구조의 가짜 카드를 만들어, 기존 구현 / lxml 단일 프로세스 /
+lxml 프로세스 풀의 처리량을 측정하고 세 결과가 모두 같은지 확인합니다.
+"""
+
+import argparse
+import concurrent.futures
+import random
+import time
+
+from listing_parser import get_job_info, get_job_info_fast, parse_chunk
+
+CARD_TEMPLATE = (
+    '<a target="_blank" class="flex flex-[1_0_0] items-center gap-2 rounded-[24px]" '
+    'href="https://zighang.com/recruitment/{uid}" style="cursor: crosshair;">'
+    '<div class="flex flex-1 flex-row items-center gap-2.5 md:gap-6">'
+    "{logo}"
+    '<div class="flex flex-col gap-[6px] md:gap-3">'
+    '<div class="flex flex-wrap items-center gap-[0px] text-[#71717A] ds-web-summary">'
+    '<span listly-xywh="797,371,78,22">{company}</span><span></span><span class="ml-2.5"></span></div>'
+    '<div class="flex items-center gap-2 text-wrap break-all font-bold text-black opacity-40">'
+    '<p class="max-w-[240px] md:max-w-[356px] ds-web-title2" style="line-height: 140%;">{title}</p></div>'
+    '<div class="flex flex-col gap-1 text-[12px] text-[#71717A] md:text-sm">'
+    '<div class="flex flex-wrap items-center gap-[1px] md:gap-1 ds-web-summary">{summary}'
+    '<span><div data-orientation="vertical" role="none" class="shrink-0 ml-2 mr-0 h-4 w-[1px] bg-line"></div></span>'
+    '<span><div class="mx-0 flex gap-0 text-[15px] text-[#71717A] md:mx-2">'
+    '<img alt="조회수 아이콘" loading="lazy" width="0" height="0" src="https://zighang.com/icon/visibility.svg">'
+    '<div class="mx-[1px] flex items-center text-[11px]">{views}</div></div></span>'
+    "</div></div></div></div>"
+    '<div class="flex h-full flex-row items-center justify-center border-l border-[#EDEDED] pl-0">'
+    '<div class="flex h-full w-full flex-col"><div class="flex h-1/2 cursor-pointer items-center justify-center">'
+    '<button class="text-40px flex h-9 w-9 items-center justify-center p-1">'
+    '<img alt="북마크 border 아이콘" loading="lazy" src="https://zighang.com/icon/bookmark_off.svg"></button></div>'
+    '<div class="h-[1px] w-full bg-[#EDEDED]"></div><div class="flex h-1/2 items-center justify-center">'
+    '<div class="mx-2 flex items-center"><div class="break-keep text-center ds-web-subtitle1">{deadline}</div>'
+    "</div></div></div></div></a>"
+)
+LOGO_TEMPLATE = (
+    '<section class="relative flex aspect-[1/1] flex-shrink-0 items-center justify-center rounded-xl">'
+    '<span class="font-bold text-white text-[11px] whitespace-pre-line">{company}</span></section>'
+)
+COMPANIES = ["LGAI연구원", "업스테이지", "네이버", "ABLY", "라인플러스", "셀렉트스타", "R&amp;D센터"]
+TITLES = [
+    "Software Engineer Internship (Business Intelligence AI)",
+    "AI Research Engineer - LLM Eval 인턴십 모집",
+    "머신 러닝 엔지니어 인턴",
+    "  데이터 엔지니어 채용  ",
+    "[ 경력 ] Data Manager &lt;AI&gt;",
+]
+SUMMARY_VALUES = [
+    ["경력 무관", "신입~1년차", "1년차 이상"],
+    ["정규직", "체험형 인턴", "전환형 인턴<!-- -->정규직", "계약직"],
+    ["학력 무관", "학사", "학사석사"],
+    ["서울", "경기", "기타"],
+]
+
+
+def make_card(rng, i):
+    company = rng.choice(COMPANIES)
+    # 일부 카드는 로고가 없어 회사명을 요약줄에서 찾아야 하고, 일부는 요약 항목이 빠져 있음
+    logo = LOGO_TEMPLATE.format(company=company) if rng.random() > 0.2 else ""
+    values = [rng.choice(options) for options in SUMMARY_VALUES]
+    values = values[: rng.choice([2, 3, 4, 4, 4])]
+    spans = []
+    for index, value in enumerate(values):
+        if index == 3:
+            value = f'<div class="text-8px flex w-full"><span class="break-keep">{value}</span></div>'
+        spans.append(f"<span>{value}</span>")
+    return CARD_TEMPLATE.format(
+        uid=f"{i:08x}-7b30-48fe-9d76-5da6d6ceca16",
+        logo=logo,
+        company=company,
+        title=rng.choice(TITLES),
+        summary="<span>·</span>".join(spans),
+        views=rng.randint(10, 5000),
+        deadline=rng.choice(["상시", "D-7", "D-30"]),
+    )
+
+
+def timed(label, cards, func):
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{elapsed:>9.2f}s{len(cards) / elapsed:>12,.0f}장/초")
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cards = [make_card(rng, i) for i in range(args.cards)]
+    chunks = [cards[i : i + args.chunk_size] for i in range(0, len(cards), args.chunk_size)]
+
+    def run_pool():
+        results = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
+            for part in executor.map(parse_chunk, chunks):
+                results.extend(part)
+        return results
+
+    print(f"카드 {len(cards):,}장")
+    baseline, expected = timed(
+        "BeautifulSoup(기존)", cards, lambda: [get_job_info(card) for card in cards]
+    )
+    single, fast = timed(
+        "lxml 단일 프로세스", cards, lambda: [get_job_info_fast(card) for card in cards]
+    )
+    pooled, pooled_results = timed("lxml 프로세스 풀", cards, run_pool)
+    print(f"-> 기존 대비 {baseline / single:.1f}배 (단일), {baseline / pooled:.1f}배 (풀)")
+
+    mismatches = sum(
+        1 for a, b, c in zip(expected, fast, pooled_results) if not (a == b == c)
+    )
+    print(f"-> 결과 불일치: {mismatches}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+라이브 Ollama와 실제 채용 사이트 없이 단계별/전체 파이프라인의 소요 시간을 측정합니다.
+
+    python -m benchmarks.bench_pipeline                          # 지원 페이지 120개, 모든 단계
+    python -m benchmarks.bench_pipeline --stages crawl clean     # 일부 단계만
+    python -m benchmarks.bench_pipeline --ttft 2 --tokens-per-second 30 --slots 4 --failure-rate 0.05
+
+녹화된(또는 생성한) 페이지를 가짜 웹 서버로, 가짜 OpenAI 호환 서버를 LLM으로 띄운 뒤
+공고 카드 파싱 → 정적 수집 → HTML 정리 → LLM 호출 → 전체 파이프라인(llm_qual_spec_par.main)을 돌려
+단계별 소요 시간, 처리량, p50/p95/p99 지연시간을 출력합니다.
+LLM 단계와 전체 파이프라인은 규칙 기반 추출과 캐시를 끄고(--use-rules로 켬) 모든 공고를 LLM에 보냅니다.
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import io
+import json
+import os
+import tempfile
+import time
+from datetime import date
+
+import pandas as pd
+
+import table_store
+from benchmarks.fixtures import load_apply_pages, load_listing_cards
+from benchmarks.stub_servers import StubLLMServer, StubSiteServer
+from concurrency import AdaptiveConcurrencyController
+from listing_parser import get_job_info_fast
+from perf_trace import PerfTrace
+from structured_output import ParseStats
+from llm_cache import LLMCache
+from llm_balancer import LLMBalancer
+from reducer_pool import ReducerPool
+from static_fetcher import StaticFetcher
+
+STAGES = ["listing", "crawl", "clean", "llm", "pipeline"]
+GOAL_PAGES = 120  # README 목표: 공고 120개 분석을 10분 이내로
+GOAL_SECONDS = 600
+
+
+def percentile(values, q):
+    values = sorted(values)
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(len(values) * q / 100))]
+
+
+def report(label, count, elapsed, latencies=None, unit="건"):
+    line = f"{label:<10}{count:>6}{unit} {elapsed:8.2f}s {count / elapsed:9.1f}{unit}/초"
+    if latencies:
+        line += "  " + "  ".join(
+            f"p{q} {percentile(latencies, q) * 1000:8.1f}ms" for q in (50, 95, 99)
+        )
+    print(line)
+
+
+class TimedFetcher(StaticFetcher):
+    """
+    요청별 소요 시간을 기록하는 StaticFetcher입니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+
+    async def _fetch(self, session, url, conditional=True):
+        start = time.perf_counter()
+        try:
+            return await super()._fetch(session, url, conditional)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+
+def configure_pipeline(workdir, llm_urls, use_rules):
+    """
+    llm_qual_spec_par의 설정과 모듈 객체를 임시 디렉터리와 가짜 LLM 서버들로 바꿔 끼운 모듈을 반환합니다.
+    """
+    import llm_qual_spec_par as pipeline
+
+    table_store.SHEETS_DIR = os.path.join(workdir, "sheets")
+    pipeline.STATE_DB_PATH = os.path.join(workdir, "pipeline_state.sqlite3")
+    pipeline.FETCH_MODE_PATH = os.path.join(workdir, "fetch_modes.json")
+    pipeline.SNAPSHOT_DIR = os.path.join(workdir, "snapshots")
+    pipeline.TRACE_DIR = os.path.join(workdir, "traces")
+    pipeline.EXPORT_EXCEL = False
+    if not use_rules:
+        pipeline.RULE_CONFIDENCE_THRESHOLD = float("inf")
+    pipeline.parse_stats = ParseStats()
+    pipeline.structured_output_enabled = pipeline.LLM_STRUCTURED_OUTPUT
+    pipeline.llm_cache = LLMCache(os.path.join(workdir, "llm_cache.sqlite3"))
+    pipeline.llm_client = LLMBalancer(
+        [{"url": url} for url in llm_urls], pool_size=pipeline.LLM_MAX_CONCURRENCY, timeout=60
+    )
+    pipeline.llm_concurrency = AdaptiveConcurrencyController(
+        initial_limit=pipeline.LLM_INITIAL_CONCURRENCY,
+        min_limit=pipeline.LLM_MIN_CONCURRENCY,
+        max_limit=pipeline.LLM_MAX_CONCURRENCY,
+        verbose=False,
+    )
+    return pipeline
+
+
+def bench_listing(cards):
+    latencies = []
+    start = time.perf_counter()
+    for card in cards:
+        card_start = time.perf_counter()
+        get_job_info_fast(card)
+        latencies.append(time.perf_counter() - card_start)
+    report("카드 파싱", len(cards), time.perf_counter() - start, latencies, unit="장")
+
+
+def bench_crawl(site, paths):
+    fetcher = TimedFetcher()
+    start = time.perf_counter()
+    pages = {url: html for url, html, _ in fetcher.imap_unordered(map(site.url_for, paths))}
+    elapsed = time.perf_counter() - start
+    failures = sum(1 for html in pages.values() if html is None)
+    report("정적 수집", len(pages), elapsed, fetcher.latencies)
+    if failures:
+        print(f"          -> 실패 {failures}건")
+
+
+def bench_clean(pages, workers):
+    reducer = ReducerPool(workers=workers)
+    start = time.perf_counter()
+    texts = [
+        reduced[0]
+        for _, reduced, _ in reducer.imap_unordered(
+            (index, html, None) for index, html in enumerate(pages)
+        )
+    ]
+    elapsed = time.perf_counter() - start
+    reducer.close()
+    report("HTML 정리", len(texts), elapsed, reducer.latencies)
+    return texts
+
+
+def bench_llm(pipeline, texts):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with concurrent.futures.ThreadPoolExecutor(pipeline.LLM_MAX_CONCURRENCY) as executor:
+            results = list(executor.map(pipeline.extract_job_info, texts))
+    elapsed = time.perf_counter() - start
+    metrics = pipeline.llm_client.metrics
+    report("LLM 호출", len(texts), elapsed, [m["elapsed"] for m in metrics])
+    ttfts = [m["ttft"] for m in metrics if m["ttft"] is not None]
+    if ttfts:
+        print(
+            f"          -> 첫 토큰 p50 {percentile(ttfts, 50) * 1000:.0f}ms, "
+            f"p95 {percentile(ttfts, 95) * 1000:.0f}ms, "
+            f"최종 동시 요청 수 {pipeline.llm_concurrency.limit}"
+        )
+    failures = sum(1 for info, _ in results if info is None)
+    if failures:
+        print(f"          -> 실패 {failures}건 / {len(texts)}건")
+    print_parse_stats(pipeline)
+    print_endpoints(pipeline.llm_client)
+
+
+def print_parse_stats(pipeline):
+    report = pipeline.parse_stats.report()
+    if report["requests"]:
+        print(
+            f"          -> 응답 JSON: 바로 읽음 {report['strict']}건, 고쳐 읽음 {report['repaired']}건, "
+            f"잘림 {report['truncated']}건, 실패 {report['failed']}건 (첫 시도 성공률 {report['success_rate']:.1%}, "
+            f"스키마 제약 {report['constrained']}건)"
+        )
+
+
+def print_endpoints(balancer):
+    if len(balancer.endpoints) < 2:
+        return
+    for url, requests_sent, errors, _ in balancer.endpoint_summary():
+        print(f"          -> {url}: 요청 {requests_sent}건, 오류 {errors}건")
+    print(f"          -> 다른 서버로 옮긴 요청 {balancer.failovers}건")
+
+
+def bench_pipeline(pipeline, site, paths):
+    links = [site.url_for(path) for path in paths]
+    df = pd.DataFrame(
+        {
+            "회사": [f"회사{i}" for i in range(len(links))],
+            "제목": [f"공고 {i}" for i in range(len(links))],
+            "지원 링크": links,
+        }
+    )
+    table_store.save_table(df, f"list_with_applyLink_{date.today():%Y-%m-%d}")
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pipeline.main()
+    elapsed = time.perf_counter() - start
+    report("전체", len(links), elapsed)
+
+    result = table_store.load_table(f"ai_jobs_final_results_{date.today():%Y-%m-%d}")
+    paths_count = result["추출 경로"].value_counts()
+    print("          -> 처리 경로: " + ", ".join(f"{p} {c}건" for p, c in paths_count.items()))
+    # 파이프라인이 남긴 공고별 기록으로 어느 단계가 시간을 차지했는지 보여줌
+    trace = PerfTrace()
+    for path in glob.glob(os.path.join(pipeline.TRACE_DIR, "*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                trace.record(event.pop("link"), event.pop("stage"), event.pop("seconds"), **event)
+    trace.print_summary()
+    print_parse_stats(pipeline)
+    print_endpoints(pipeline.llm_client)
+
+    projected = elapsed / len(links) * GOAL_PAGES
+    verdict = "달성" if projected <= GOAL_SECONDS else "미달"
+    print(
+        f"          -> 공고 {GOAL_PAGES}개 환산 {projected:.1f}초 "
+        f"(목표 {GOAL_SECONDS // 60}분 이내: {verdict})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=GOAL_PAGES)
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--chars", type=int, default=60_000, help="생성하는 지원 페이지의 크기")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--site-latency", type=float, default=0.05, help="웹 서버 응답 지연(초)")
+    parser.add_argument("--ttft", type=float, default=0.5, help="LLM 첫 토큰까지의 지연(초)")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--slots", type=int, default=4, help="LLM 서버가 동시에 생성하는 요청 수")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="LLM 요청이 503으로 실패할 확률")
+    parser.add_argument(
+        "--malformed-rate", type=float, default=0.0, help="형식 제약 없는 응답이 깨진 JSON일 확률"
+    )
+    parser.add_argument(
+        "--no-structured-output", action="store_true", help="LLM 서버가 response_format을 거부하게 함"
+    )
+    parser.add_argument("--endpoints", type=int, default=1, help="띄울 가짜 LLM 서버 수 (부하 분산)")
+    parser.add_argument(
+        "--failing-endpoints", type=int, default=0, help="그중 항상 503으로 실패하는 서버 수"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="HTML 정리 프로세스 수")
+    parser.add_argument("--use-rules", action="store_true", help="규칙 기반 추출을 켜 둠")
+    args = parser.parse_args()
+
+    pages, recorded = load_apply_pages(args.pages, target_chars=args.chars)
+    paths = [f"/jobs/{i}" for i in range(len(pages))]
+    print(
+        f"지원 페이지 {len(pages)}개 (녹화본 {recorded}개), "
+        f"LLM: 첫 토큰 {args.ttft}s, {args.tokens_per_second:g}토큰/초, "
+        f"슬롯 {args.slots}개 x 서버 {args.endpoints}대, 실패율 {args.failure_rate:.0%}"
+    )
+    print(f"{'단계':<10}{'처리':>7} {'소요':>9} {'처리량':>12}  지연시간")
+
+    with tempfile.TemporaryDirectory() as workdir, StubSiteServer(
+        dict(zip(paths, pages)), latency=args.site_latency
+    ) as site:
+        if "listing" in args.stages:
+            cards, _ = load_listing_cards(args.cards)
+            bench_listing(cards)
+        if "crawl" in args.stages:
+            bench_crawl(site, paths)
+        texts = None
+        if "clean" in args.stages or "llm" in args.stages:
+            texts = bench_clean(pages, args.workers)
+        for stage in ("llm", "pipeline"):
+            if stage not in args.stages:
+                continue
+            # 단계마다 새 LLM 서버와 빈 캐시/상태로 시작
+            stage_dir = os.path.join(workdir, stage)
+            servers = [
+                StubLLMServer(
+                    ttft=args.ttft,
+                    tokens_per_second=args.tokens_per_second,
+                    slots=args.slots,
+                    failure_rate=1.0 if i < args.failing_endpoints else args.failure_rate,
+                    malformed_rate=args.malformed_rate,
+                    structured_output=not args.no_structured_output,
+                    seed=i,
+                ).start()
+                for i in range(args.endpoints)
+            ]
+            try:
+                pipeline = configure_pipeline(
+                    stage_dir, [server.url for server in servers], args.use_rules
+                )
+                if stage == "llm":
+                    bench_llm(pipeline, texts)
+                else:
+                    bench_pipeline(pipeline, site, paths)
+                pipeline.llm_cache.close()
+            finally:
+                for server in servers:
+                    server.stop()
+
+
+if __name__ == "__main__":
+    main()
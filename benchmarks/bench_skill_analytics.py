@@ -0,0 +1,143 @@
+"""
+결과 시트의 자격요건/우대사항에서 기술을 찾아 집계하는 속도를 측정합니다.
+
+    python -m benchmarks.bench_skill_analytics                       # 10만 건, 30일
+    python -m benchmarks.bench_skill_analytics --postings 300000 --days 60
+
+날짜별 결과 시트(sheets/ai_jobs_final_results_<날짜>.parquet)를 가짜 공고로 만들고,
+1) 별칭마다 정규식으로 검색하는 방식과 Aho-Corasick 한 번 훑기의 줄 단위 속도,
+2) 처음 전체 집계, 3) 바뀐 것이 없을 때 다시 실행, 4) 하루치 시트가 추가됐을 때 다시 실행
+하는 시간을 비교합니다.
+"""
+
+import argparse
+import datetime
+import os
+import random
+import re
+import tempfile
+import time
+
+import pandas as pd
+
+import skill_analytics
+import table_store
+from benchmarks.fixtures import make_extraction
+
+
+def make_result_table(day, start, size, rng):
+    rows = []
+    for i in range(start, start + size):
+        requirements, preferred = make_extraction(rng)
+        rows.append(
+            {
+                "회사": f"회사{rng.randint(1, 500)}",
+                "지원 링크": f"https://careers.example.com/jobs/{i}",
+                "자격요건": requirements,
+                "우대사항": preferred,
+            }
+        )
+    name = f"ai_jobs_final_results_{day}"
+    table_store.save_table(pd.DataFrame(rows), name)
+    return name
+
+
+def regex_find(patterns, text):
+    # 비교용: 별칭마다 텍스트를 한 번씩 검색
+    lowered = text.lower()
+    return {skill for skill, pattern in patterns if pattern.search(lowered)}
+
+
+def bench_matching(matcher, lines):
+    patterns = [
+        (
+            skill,
+            re.compile(
+                "|".join(
+                    rf"(?<![a-z0-9]){re.escape(alias.lower())}(?![a-z0-9])" for alias in aliases
+                )
+            ),
+        )
+        for skill, aliases in matcher.taxonomy.items()
+    ]
+    start = time.perf_counter()
+    for line in lines:
+        regex_find(patterns, line)
+    regex_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for line in lines:
+        matcher._scan(line)
+    automaton_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for line in lines:
+        matcher.find(line)
+    cached_elapsed = time.perf_counter() - start
+    return regex_elapsed, automaton_elapsed, cached_elapsed
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def ingest_all(store):
+    return sum(store.ingest_table(name) for name in skill_analytics.result_table_names())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--postings", type=int, default=100_000, help="전체 공고 수")
+    parser.add_argument("--days", type=int, default=30, help="결과 시트(날짜) 수")
+    parser.add_argument("--match-lines", type=int, default=20_000, help="검색 방식 비교에 쓰는 줄 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        table_store.SHEETS_DIR = os.path.join(directory, "sheets")
+        db_path = os.path.join(directory, "skill_analytics.sqlite3")
+
+        first_day = datetime.date(2025, 9, 1)
+        per_day = args.postings // args.days
+        print(f"결과 시트 {args.days}개 × 공고 {per_day:,}건 생성 중...")
+        for day in range(args.days):
+            date = (first_day + datetime.timedelta(days=day)).isoformat()
+            make_result_table(date, day * per_day, per_day, rng)
+
+        matcher = skill_analytics.SkillMatcher()
+        lines = [
+            line
+            for _ in range(args.match_lines // 10)
+            for text in make_extraction(rng)
+            for line in text.split("\n")
+        ][: args.match_lines]
+        regex_elapsed, automaton_elapsed, cached_elapsed = bench_matching(matcher, lines)
+        print(f"\n=== 기술 찾기 ({len(lines):,}줄, 기술 {len(matcher.taxonomy)}개) ===")
+        print(f"  별칭별 정규식 검색: {regex_elapsed:.2f}s ({len(lines) / regex_elapsed:,.0f}줄/초)")
+        print(f"  Aho-Corasick:       {automaton_elapsed:.2f}s ({len(lines) / automaton_elapsed:,.0f}줄/초)")
+        print(f"  + 줄 단위 캐시:     {cached_elapsed:.2f}s ({len(lines) / cached_elapsed:,.0f}줄/초)")
+
+        print(f"\n=== 집계 (공고 {per_day * args.days:,}건) ===")
+        store = skill_analytics.SkillAggregateStore(db_path, matcher=matcher)
+        elapsed, added = timed(lambda: ingest_all(store))
+        print(f"  처음 전체 집계:     {elapsed:.2f}s (공고 {added:,}건, {added / elapsed:,.0f}건/초)")
+        elapsed, added = timed(lambda: ingest_all(store))
+        print(f"  변경 없이 재실행:   {elapsed:.2f}s (새 공고 {added:,}건)")
+
+        date = (first_day + datetime.timedelta(days=args.days)).isoformat()
+        make_result_table(date, args.days * per_day, per_day, rng)
+        elapsed, added = timed(lambda: ingest_all(store))
+        print(f"  하루치 추가 후:     {elapsed:.2f}s (새 공고 {added:,}건)")
+
+        elapsed, top = timed(lambda: store.top_skills(limit=5))
+        print(f"  상위 기술 조회:     {elapsed * 1000:.1f}ms → " + ", ".join(s for s, _, _ in top))
+        elapsed, partners = timed(lambda: store.co_occurring(top[0][0], 5))
+        print(f"  함께 나온 기술 조회: {elapsed * 1000:.1f}ms → " + ", ".join(s for s, _ in partners))
+        store.close()
+        print(f"  집계 파일 크기:     {os.path.getsize(db_path) / 1024:,.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+단계 사이 저장 형식(엑셀 / parquet / feather)의 저장·읽기 시간을 비교합니다.
+
+    python -m benchmarks.bench_storage                 # 1천, 1만, 10만 건
+    python -m benchmarks.bench_storage --sizes 1000 10000
+
+listly의 SINGLE_*.xlsx처럼 첫 열에 HTML 조각이 들어 있는 시트와, 최종 결과 시트(자격요건/우대사항)를
+흉내 낸 가짜 공고 데이터를 만들어 측정합니다. 10만 건 엑셀 저장/읽기는 수 분이 걸립니다.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow.feather as feather
+
+import table_store
+
+HTML_TEMPLATE = (
+    '<div class="ds-web-summary"><a href="https://zighang.com/recruitment/{uid}">'
+    "<section><span>회사{company}</span></section><div><div><p>{title}</p></div></div>"
+    '<div class="ds-web-summary"><span>경력 {years}년 이상</span><span>·</span>'
+    "<span>정규직</span><span>·</span><span>학사</span><span>·</span><span>서울 강남구</span>"
+    "</div></a></div>"
+)
+TITLES = ["AI 엔지니어", "ML Engineer", "데이터 사이언티스트", "LLM 연구원", "MLOps 엔지니어"]
+REQUIREMENTS = [
+    "Python 개발 경험 3년 이상",
+    "PyTorch 또는 TensorFlow 활용 경험",
+    "대규모 언어 모델 파인튜닝 경험",
+    "Kubernetes 기반 서비스 운영 경험",
+    "컴퓨터공학 또는 관련 전공 학사 이상",
+    "영어 논문 독해 가능자",
+]
+
+
+def make_postings(size, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(size):
+        title = rng.choice(TITLES)
+        company = rng.randint(1, size // 10 + 1)
+        rows.append(
+            {
+                "html": HTML_TEMPLATE.format(
+                    uid=f"{i:08x}", company=company, title=title, years=rng.randint(1, 10)
+                ),
+                "회사": f"회사{company}",
+                "제목": title,
+                "링크": f"https://zighang.com/recruitment/{i:08x}",
+                "지원 링크": f"https://careers.example.com/jobs/{i}",
+                "자격요건": "\n".join(rng.sample(REQUIREMENTS, 3)),
+                "우대사항": "\n".join(rng.sample(REQUIREMENTS, 2)),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def bench_size(size, directory):
+    df = make_postings(size)
+    name = f"bench_{size}"
+    xlsx = os.path.join(directory, f"{name}.xlsx")
+    arrow = os.path.join(directory, f"{name}.feather")
+
+    rows = []
+    save, _ = timed(lambda: df.to_excel(xlsx, index=False))
+    load, _ = timed(lambda: pd.read_excel(xlsx))
+    rows.append(("엑셀(openpyxl)", save, load, os.path.getsize(xlsx)))
+
+    save, path = timed(lambda: table_store.save_table(df, name))
+    load, _ = timed(lambda: table_store.load_table(name))
+    rows.append(("parquet(zstd)", save, load, os.path.getsize(path)))
+
+    load, _ = timed(lambda: table_store.load_table(name, columns=["html"]))
+    rows.append(("parquet 한 열만", None, load, None))
+
+    load, _ = timed(lambda: sum(len(chunk) for chunk in table_store.iter_table(name)))
+    rows.append(("parquet 청크 읽기", None, load, None))
+
+    save, _ = timed(lambda: feather.write_feather(df, arrow))
+    load, _ = timed(lambda: feather.read_feather(arrow))
+    rows.append(("feather", save, load, os.path.getsize(arrow)))
+    return rows
+
+
+def format_seconds(value):
+    return "-" if value is None else f"{value:.3f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        table_store.SHEETS_DIR = directory
+        for size in args.sizes:
+            print(f"\n=== 공고 {size:,}건 ===")
+            print(f"{'형식':<16}{'저장':>10}{'읽기':>10}{'파일 크기':>14}")
+            for label, save, load, file_size in bench_size(size, directory):
+                size_text = "-" if file_size is None else f"{file_size / 1024:,.0f} KB"
+                print(
+                    f"{label:<16}{format_seconds(save):>10}"
+                    f"{format_seconds(load):>10}{size_text:>14}"
+                )
+
+
+if __name__ == "__main__":
+    main()
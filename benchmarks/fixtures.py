@@ -0,0 +1,170 @@
+"""
+벤치마크용 HTML 고정 자료(fixture)를 불러오거나 기록합니다.
+
+    python -m benchmarks.fixtures --record             # cache/snapshots 보관본을 benchmarks/fixtures/로 복사
+
+benchmarks/fixtures/apply/*.html(지원 페이지)과 benchmarks/fixtures/listing/*.html(직행 공고 카드)이
+있으면 그 녹화본을 쓰고, 없거나 부족하면 같은 구조의 가짜 페이지를 만들어 채웁니다.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import random
+
+from benchmarks.bench_listing_parser import make_card
+from snapshot_store import SnapshotStore
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+SNAPSHOT_DIR = "cache/snapshots"
+
+SKILLS = [
+    "Python", "Go", "C++", "Rust", "Java", "Scala", "PyTorch", "TensorFlow", "JAX",
+    "Kubernetes", "Docker", "Spark", "Airflow", "Kafka", "Triton", "vLLM", "CUDA",
+    "SQL", "BigQuery", "AWS", "GCP", "Ray", "ONNX", "LangChain", "Elasticsearch",
+]
+REQUIREMENT_PHRASES = [
+    "{skill} 기반 서비스 개발 경험 {years}년 이상",
+    "{skill}와 {other}를 활용한 {domain} 모델 학습 경험",
+    "{domain} 분야 {skill} 파이프라인 구축 및 운영 경험",
+    "Experience building {domain} systems with {skill} and {other}",
+    "{domain} 관련 전공 학사 이상 또는 {years}년 이상의 실무 경험",
+]
+PREFERRED_PHRASES = [
+    "{skill} 오픈소스 프로젝트 기여 경험",
+    "{domain} 분야 Top-tier 학회 논문 게재 경험",
+    "{skill}로 대규모 {domain} 서비스를 운영해 본 경험",
+    "Hands-on experience with {skill} in production {domain} workloads",
+]
+DOMAINS = ["추천", "검색", "자연어 처리", "컴퓨터 비전", "음성 인식", "LLM", "MLOps", "데이터 플랫폼"]
+
+
+def _bullets(rng, phrases, count):
+    items = []
+    for _ in range(count):
+        skill, other = rng.sample(SKILLS, 2)
+        items.append(
+            rng.choice(phrases).format(
+                skill=skill, other=other, domain=rng.choice(DOMAINS), years=rng.randint(1, 10)
+            )
+        )
+    return items
+
+
+def make_extraction(rng):
+    """
+    LLM 추출 결과처럼 줄바꿈으로 이은 (자격요건, 우대사항) 텍스트를 만듭니다.
+    """
+    return (
+        "\n".join(_bullets(rng, REQUIREMENT_PHRASES, rng.randint(4, 7))),
+        "\n".join(_bullets(rng, PREFERRED_PHRASES, rng.randint(3, 5))),
+    )
+
+
+def make_apply_page(rng, target_chars=60_000):
+    """
+    스크립트/내비게이션/반복 카드가 섞인 지원 페이지를 만듭니다. 공고마다 자격요건/우대사항이 달라
+    유사 공고 묶음이나 캐시에 걸리지 않습니다.
+    """
+    head = (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>채용 공고</title>'
+        + "".join(f"<script>window.__c{i}=function(a){{return a<{i};}};</script>" for i in range(10))
+        + "</head><body><header><nav>"
+        + "".join(f'<a href="/menu/{i}">메뉴 {i}</a>' for i in range(20))
+        + "</nav></header>"
+    )
+    posting = (
+        f"<main><article><h1>{rng.choice(DOMAINS)} 엔지니어 채용</h1><h2>주요 업무</h2><ul>"
+        + "".join(f"<li>{item}</li>" for item in _bullets(rng, REQUIREMENT_PHRASES, 3))
+        + "</ul><h2>자격요건</h2><ul>"
+        + "".join(f"<li>{item}</li>" for item in _bullets(rng, REQUIREMENT_PHRASES, rng.randint(4, 7)))
+        + "</ul><h2>우대사항</h2><ul>"
+        + "".join(f"<li>{item}</li>" for item in _bullets(rng, PREFERRED_PHRASES, rng.randint(3, 5)))
+        + "</ul><h2>복리후생</h2><p>유연 근무<br>점심 제공</p></article>"
+    )
+    cards = []
+    size = len(head) + len(posting)
+    while size < target_chars:
+        card = (
+            f'<div class="card" data-id="{rng.randint(0, 10**9)}">'
+            f"<p>다른 공고 {rng.randint(0, 9999)}</p><span>서울 · 정규직</span><button>지원하기</button></div>"
+        )
+        cards.append(card)
+        size += len(card)
+    return head + posting + "".join(cards) + "<footer><p>© 2025 Example Corp.</p></footer></main></body></html>"
+
+
+def _read_all(pattern):
+    pages = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def load_apply_pages(count, seed=0, target_chars=60_000):
+    """
+    지원 페이지 HTML count개를 반환합니다. 녹화본을 먼저 쓰고 모자라면 가짜 페이지로 채웁니다.
+    (페이지 목록, 녹화본 개수)를 반환합니다.
+    """
+    recorded = _read_all(os.path.join(FIXTURE_DIR, "apply", "*.html"))[:count]
+    rng = random.Random(seed)
+    generated = [make_apply_page(rng, target_chars) for _ in range(count - len(recorded))]
+    return recorded + generated, len(recorded)
+
+
+def load_listing_cards(count, seed=0):
+    """
+    직행 공고 카드 HTML count개와 녹화본 개수를 반환합니다.
+    녹화본 파일 하나에는 카드 하나(listly가 저장한 HTML 조각)가 들어 있습니다.
+    """
+    recorded = _read_all(os.path.join(FIXTURE_DIR, "listing", "*.html"))[:count]
+    rng = random.Random(seed)
+    generated = [make_card(rng, i) for i in range(len(recorded), count)]
+    return recorded + generated, len(recorded)
+
+
+def record_apply_pages(snapshot_dir=SNAPSHOT_DIR, limit=None):
+    """
+    스냅샷 저장소의 페이지(렌더링 결과 우선)를 fixtures/apply/<URL 해시>.html로 복사하고 개수를 반환합니다.
+    """
+    store = SnapshotStore(snapshot_dir)
+    target_dir = os.path.join(FIXTURE_DIR, "apply")
+    os.makedirs(target_dir, exist_ok=True)
+    written = 0
+    try:
+        for url in store.urls()[:limit]:
+            html = store.get(url)
+            if html is None:
+                continue
+            name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+            with open(os.path.join(target_dir, f"{name}.html"), "w", encoding="utf-8") as f:
+                f.write(html)
+            written += 1
+    finally:
+        store.close()
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--snapshot-dir", default=SNAPSHOT_DIR)
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.record:
+        if not os.path.exists(os.path.join(args.snapshot_dir, "index.sqlite3")):
+            print(f"'{args.snapshot_dir}'에 보관된 페이지가 없습니다.")
+            return
+        written = record_apply_pages(args.snapshot_dir, args.limit)
+        print(f"지원 페이지 {written}개를 '{os.path.join(FIXTURE_DIR, 'apply')}'에 저장했습니다.")
+    else:
+        apply_pages = len(glob.glob(os.path.join(FIXTURE_DIR, "apply", "*.html")))
+        listing_cards = len(glob.glob(os.path.join(FIXTURE_DIR, "listing", "*.html")))
+        print(f"녹화본: 지원 페이지 {apply_pages}개, 공고 카드 {listing_cards}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+오프라인 벤치마크용 가짜 서버들입니다.
+
+- StubLLMServer: OpenAI 호환 /v1/chat/completions 엔드포인트. 첫 토큰까지의 지연, 초당 토큰 수,
+  동시에 생성할 수 있는 슬롯 수, 실패 비율을 설정할 수 있고 스트리밍/비스트리밍 응답을 모두 지원합니다.
+  응답 내용은 프롬프트의 공고 텍스트를 규칙 기반 추출기로 정리한 JSON입니다.
+- StubSiteServer: 녹화된(또는 생성한) 지원 페이지 HTML을 ETag와 함께 돌려주는 웹 서버.
+  이미지/폰트/CSS 같은 리소스도 따로 지연을 두고 돌려줄 수 있습니다.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from content_reducer import estimate_tokens
+from rule_extractor import extract_by_rules
+
+POSTING_PATTERN = re.compile(
+    r"(?:\[공고 ID: (?P<id>\w+)\]\s*)?--- 공고 내용 시작 ---\n(?P<body>.*?)--- 공고 내용 끝 ---",
+    re.DOTALL,
+)
+
+
+def answer_for(text):
+    """
+    공고 텍스트에서 LLM이 줄 법한 {"자격요건": [...], "우대사항": [...]} 결과를 규칙 기반 추출기로 만듭니다.
+    """
+    return extract_by_rules(text)[0]
+
+
+def build_answer(prompt):
+    postings = list(POSTING_PATTERN.finditer(prompt))
+    if len(postings) == 1 and postings[0].group("id") is None:
+        return json.dumps(answer_for(postings[0].group("body")), ensure_ascii=False)
+    return json.dumps(
+        {match.group("id"): answer_for(match.group("body")) for match in postings},
+        ensure_ascii=False,
+    )
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _BackgroundServer:
+    def __init__(self, handler):
+        self._server = _Server(("127.0.0.1", 0), handler)
+        self._server.owner = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _LLMHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        # 헬스 체크용 모델 목록
+        if self.path != "/v1/models":
+            self.send_error(404)
+            return
+        body = json.dumps({"object": "list", "data": [{"id": "stub", "object": "model"}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server.owner
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if server.should_fail():
+            self.send_error(503, "stub failure")
+            return
+
+        if "response_format" in payload and not server.structured_output:
+            self.send_error(400, "response_format is not supported")
+            return
+
+        content = build_answer(payload["messages"][-1]["content"])
+        if "response_format" not in payload:
+            content = server.maybe_malform(content)
+        prompt_tokens = estimate_tokens(payload["messages"][-1]["content"])
+        with server.slots:
+            time.sleep(server.ttft)
+            if payload.get("stream"):
+                self._stream(server, content, prompt_tokens)
+            else:
+                time.sleep(estimate_tokens(content) / server.tokens_per_second)
+                self._respond_json(content, prompt_tokens)
+
+    def _usage(self, content, prompt_tokens):
+        completion_tokens = estimate_tokens(content)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def _respond_json(self, content, prompt_tokens):
+        body = json.dumps(
+            {
+                "choices": [{"message": {"role": "assistant", "content": content}}],
+                "usage": self._usage(content, prompt_tokens),
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, server, content, prompt_tokens):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        # 토큰 하나를 약 4자로 보고 초당 토큰 수에 맞춰 조각을 보냄
+        chunk_chars = 4
+        delay = 1 / server.tokens_per_second
+        try:
+            for i in range(0, len(content), chunk_chars):
+                event = {"choices": [{"delta": {"content": content[i : i + chunk_chars]}}]}
+                self.wfile.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode())
+                self.wfile.flush()
+                time.sleep(delay)
+            final = {"choices": [], "usage": self._usage(content, prompt_tokens)}
+            self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode())
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 JSON 완성 후 연결을 끊은 경우 (생성 중단)
+            pass
+        self.close_connection = True
+
+
+class StubLLMServer(_BackgroundServer):
+    """
+    malformed_rate는 응답 형식 제약(response_format) 없이 온 요청에 코드 블록/설명 문장/잘린 JSON/
+    마지막 쉼표 같은 흔한 형식 오류를 섞는 확률입니다. structured_output=False이면
+    response_format을 지원하지 않는 서버처럼 400을 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        ttft=0.5,
+        tokens_per_second=50.0,
+        slots=4,
+        failure_rate=0.0,
+        malformed_rate=0.0,
+        structured_output=True,
+        seed=0,
+    ):
+        super().__init__(_LLMHandler)
+        self.ttft = ttft
+        self.tokens_per_second = tokens_per_second
+        self.slots = threading.BoundedSemaphore(slots)
+        self.failure_rate = failure_rate
+        self.malformed_rate = malformed_rate
+        self.structured_output = structured_output
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"{self.base_url}/v1/chat/completions"
+
+    def should_fail(self):
+        with self._lock:
+            return self._random.random() < self.failure_rate
+
+    def maybe_malform(self, content):
+        with self._lock:
+            if self._random.random() >= self.malformed_rate:
+                return content
+            kind = self._random.choice(["fenced", "prose", "truncated", "trailing_comma"])
+        if kind == "fenced":
+            return f"```json\n{content}\n```"
+        if kind == "prose":
+            return f"다음은 추출 결과입니다.\n{content}\n추가로 궁금한 점이 있으면 말씀해 주세요."
+        if kind == "truncated":
+            return content[: int(len(content) * 0.7)]
+        return content.replace('"]', '",]', 1)
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server.owner
+        html = server.pages.get(self.path)
+        asset = server.assets.get(self.path)
+        time.sleep(server.asset_latency if asset is not None else server.latency)
+        if asset is not None:
+            content_type, body = asset
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if html is None:
+            self.send_error(404)
+            return
+        body = html.encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubSiteServer(_BackgroundServer):
+    """
+    {경로: html} 페이지를 latency초 지연 후 돌려줍니다.
+    assets({경로: (Content-Type, 바이트)})를 주면 이미지/폰트/CSS 같은 리소스를 asset_latency초 지연 후 돌려줍니다.
+    """
+
+    def __init__(self, pages, latency=0.05, assets=None, asset_latency=0.2):
+        super().__init__(_SiteHandler)
+        self.pages = pages
+        self.latency = latency
+        self.assets = assets or {}
+        self.asset_latency = asset_latency
+
+    def url_for(self, path):
+        return f"{self.base_url}{path}"
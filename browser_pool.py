@@ -0,0 +1,216 @@
+import queue
+import threading
+
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# 드라이버 프로세스가 죽었음을 뜻하는 오류 메시지 (이 경우 드라이버를 새로 띄움)
+CRASH_MESSAGES = ("disconnected", "chrome not reachable", "session deleted", "crashed")
+
+# 빠른 수집 프로필에서 받지 않는 요청 (DevTools 프로토콜 Network.setBlockedURLs의 와일드카드 패턴)
+# 본문 텍스트와 '지원하기' 버튼에 필요 없는 이미지/폰트/스타일시트/미디어와 분석·광고 스크립트
+BLOCKED_URL_PATTERNS = [
+    *(f"*.{ext}" for ext in ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico")),
+    *(f"*.{ext}" for ext in ("woff", "woff2", "ttf", "otf", "eot")),
+    *(f"*.{ext}" for ext in ("css", "mp4", "webm", "mp3")),
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*connect.facebook.net*",
+    "*analytics.tiktok.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*amplitude.com*",
+    "*mixpanel.com*",
+    "*wcs.naver.net*",
+]
+WAIT_POLL_SECONDS = 0.1  # 조건을 확인하는 간격 (WebDriverWait 기본값은 0.5초)
+
+# 키워드 중 하나가 화면 텍스트에 나왔거나 페이지 로드가 끝났으면 true
+CONTENT_READY_SCRIPT = """
+if (document.readyState === 'complete') return true;
+const text = document.body ? document.body.innerText.toLowerCase() : '';
+return arguments[0].some((keyword) => text.includes(keyword));
+"""
+
+
+def wait_for_content(driver, keywords, timeout=10):
+    """
+    keywords(소문자) 중 하나가 본문에 나타나거나 load 이벤트가 끝날 때까지 기다립니다.
+    빠른 수집 프로필(eager)에서는 driver.get()이 DOMContentLoaded에서 돌아오므로,
+    JS로 본문을 그리는 페이지도 필요한 내용이 보이는 즉시 진행할 수 있습니다.
+    """
+    WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_SECONDS).until(
+        lambda d: d.execute_script(CONTENT_READY_SCRIPT, list(keywords))
+    )
+
+
+class BrowserPool:
+    """
+    여러 개의 headless Chrome 드라이버를 재사용하며 URL 목록을 병렬로 처리하는 풀입니다.
+
+    각 작업 스레드는 자신만의 드라이버를 하나씩 소유하고 여러 URL에 재사용합니다.
+    드라이버가 죽거나(WebDriverException), page_budget만큼 페이지를 처리했거나,
+    JS 힙 사용량이 max_heap_mb를 넘으면 드라이버를 새로 띄웁니다.
+
+    fast_profile=True이면 BLOCKED_URL_PATTERNS의 요청을 막고 page load strategy를 'eager'로 둬서
+    driver.get()이 이미지/폰트/광고 로딩을 기다리지 않고 DOMContentLoaded에서 돌아옵니다.
+    이후의 대기는 wait_for_content()나 요소/창 조건으로 필요한 만큼만 합니다.
+    """
+
+    def __init__(self, size=3, page_budget=50, max_heap_mb=None, headless=True, fast_profile=True):
+        self.size = size
+        self.page_budget = page_budget
+        self.max_heap_mb = max_heap_mb
+        self.headless = headless
+        self.fast_profile = fast_profile
+        self.restarts = 0
+        self._lock = threading.Lock()
+
+    @property
+    def profile_name(self):
+        return "fast" if self.fast_profile else "default"
+
+    def _create_driver(self):
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--window-size=1280,1024")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        if self.fast_profile:
+            options.page_load_strategy = "eager"
+            # 확장자 없는 CDN 이미지 주소까지 막음
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        driver = webdriver.Chrome(options=options)
+        if self.fast_profile:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return driver
+
+    @staticmethod
+    def _is_crash(error):
+        if isinstance(error, InvalidSessionIdException):
+            return True
+        message = str(error).lower()
+        return any(keyword in message for keyword in CRASH_MESSAGES)
+
+    def _quit_driver(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _heap_exceeded(self, driver):
+        if self.max_heap_mb is None:
+            return False
+        try:
+            used = driver.execute_script(
+                "return performance.memory ? performance.memory.usedJSHeapSize : 0"
+            )
+        except WebDriverException:
+            return True
+        return used > self.max_heap_mb * 1024 * 1024
+
+    def _worker(self, task, task_queue, result_queue, stop_event):
+        driver = None
+        pages = 0
+        try:
+            while not stop_event.is_set():
+                try:
+                    item = task_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                result, error = None, None
+                # 드라이버가 죽었으면 한 번 새로 띄워서 같은 항목을 다시 시도
+                for _ in range(2):
+                    try:
+                        if driver is None:
+                            driver = self._create_driver()
+                            pages = 0
+                        result = task(driver, item)
+                        error = None
+                        break
+                    except WebDriverException as e:
+                        error = e
+                        if not self._is_crash(e):
+                            break
+                        if driver is not None:
+                            self._quit_driver(driver)
+                            driver = None
+                        with self._lock:
+                            self.restarts += 1
+                    except Exception as e:
+                        error = e
+                        break
+
+                pages += 1
+                if driver is not None and (
+                    pages >= self.page_budget or self._heap_exceeded(driver)
+                ):
+                    self._quit_driver(driver)
+                    driver = None
+                    with self._lock:
+                        self.restarts += 1
+
+                while not stop_event.is_set():
+                    try:
+                        result_queue.put((item, result, error), timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+        finally:
+            if driver is not None:
+                self._quit_driver(driver)
+            result_queue.put(None)
+
+    def imap_unordered(self, task, items):
+        """
+        items의 각 항목에 대해 task(driver, item)을 실행하고,
+        끝나는 순서대로 (item, result, error)를 yield합니다.
+
+        결과 대기열의 크기가 풀 크기로 제한되어 있으므로, 호출하는 쪽이 결과를
+        소비하지 않으면 작업자들도 다음 페이지를 열지 않고 기다립니다.
+        """
+        task_queue = queue.Queue()
+        for item in items:
+            task_queue.put(item)
+
+        worker_count = min(self.size, task_queue.qsize())
+        if worker_count == 0:
+            return
+
+        result_queue = queue.Queue(maxsize=self.size)
+        stop_event = threading.Event()
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(task, task_queue, result_queue, stop_event),
+                daemon=True,
+            )
+            for _ in range(worker_count)
+        ]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        try:
+            while finished < worker_count:
+                entry = result_queue.get()
+                if entry is None:
+                    finished += 1
+                    continue
+                yield entry
+        finally:
+            stop_event.set()
+            # 남은 결과를 비워서 작업자들이 종료 신호를 넣을 수 있게 함
+            while finished < worker_count:
+                if result_queue.get() is None:
+                    finished += 1
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,110 @@
+import difflib
+import re
+
+from content_reducer import TARGET_HEADINGS, estimate_tokens, heading_kind
+
+# 항목 비교 전에 지우는 글머리 기호/문장부호/공백
+NORMALIZE_PATTERN = re.compile(r"[\W_]+")
+NUMBER_PATTERN = re.compile(r"\d+")
+
+
+def _split_long_line(line, chunk_tokens):
+    """
+    한 줄이 chunk_tokens보다 길면 글자 수 기준으로 나눕니다.
+    """
+    tokens = estimate_tokens(line)
+    if tokens <= chunk_tokens:
+        return [line]
+    width = max(1, len(line) * chunk_tokens // tokens)
+    return [line[i : i + width] for i in range(0, len(line), width)]
+
+
+def split_into_chunks(text, chunk_tokens, overlap_tokens=0):
+    """
+    공고 텍스트를 줄 단위로 chunk_tokens(추정 토큰) 이하의 조각으로 나눕니다.
+
+    조각 경계에서 잘린 항목을 놓치지 않도록 앞 조각의 마지막 줄들(overlap_tokens 이내)을
+    다음 조각 앞에 다시 넣고, 조각이 섹션 중간에서 시작하면 그 섹션의 제목 줄을 맨 앞에 붙여
+    LLM이 어느 섹션의 항목인지 알 수 있게 합니다.
+    """
+    lines = [
+        part for line in text.split("\n") for part in _split_long_line(line, chunk_tokens)
+    ]
+    chunks = []
+    current, used = [], 0
+    heading = None  # 지금까지 마지막으로 나온 자격요건/우대사항 제목 줄
+    chunk_heading = None  # 현재 조각 앞에 붙인 제목 줄
+
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if current and used + cost > chunk_tokens:
+            chunks.append("\n".join(current))
+            # 겹치는 줄을 뒤에서부터 모음 (제목 줄은 따로 붙이므로 제외)
+            overlap, overlap_used = [], 0
+            for previous in reversed(current):
+                previous_cost = estimate_tokens(previous) + 1
+                if previous == chunk_heading or overlap_used + previous_cost > overlap_tokens:
+                    break
+                overlap.insert(0, previous)
+                overlap_used += previous_cost
+            # 겹치는 줄을 넣어도 이번 줄이 들어갈 자리는 남김
+            while overlap and overlap_used + cost > chunk_tokens:
+                overlap_used -= estimate_tokens(overlap.pop(0)) + 1
+            current, used = overlap, overlap_used
+            chunk_heading = None
+            if heading is not None and heading_kind(line) is None and heading not in current:
+                heading_cost = estimate_tokens(heading) + 1
+                if used + heading_cost + cost <= chunk_tokens:
+                    current.insert(0, heading)
+                    used += heading_cost
+                    chunk_heading = heading
+
+        kind = heading_kind(line)
+        if kind is not None:
+            heading = line if kind in TARGET_HEADINGS else None
+        current.append(line)
+        used += cost
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _normalize(item):
+    return NORMALIZE_PATTERN.sub("", item).lower()
+
+
+def merge_extractions(results, similarity=0.9):
+    """
+    조각별 추출 결과 [{"자격요건": [...], "우대사항": [...]}, ...]를 하나로 합칩니다.
+    겹치는 부분에서 두 번 나온 항목은 공백/문장부호를 무시하고 비교해
+    similarity 이상 비슷하면 하나만 남깁니다 (먼저 나온 항목을 남김). 숫자가 다른 항목은 남깁니다.
+    """
+    merged = {kind: [] for kind in TARGET_HEADINGS}
+    normalized = {kind: [] for kind in TARGET_HEADINGS}
+    for result in results:
+        for kind in TARGET_HEADINGS:
+            for item in result.get(kind) or []:
+                if not isinstance(item, str) or not item.strip():
+                    continue
+                key = _normalize(item)
+                if any(_is_similar(key, seen, similarity) for seen in normalized[kind]):
+                    continue
+                merged[kind].append(item.strip())
+                normalized[kind].append(key)
+    return merged
+
+
+def _is_similar(a, b, similarity):
+    if a == b:
+        return True
+    # "3년 이상"과 "5년 이상"처럼 숫자만 다른 항목은 다른 조건임
+    if NUMBER_PATTERN.findall(a) != NUMBER_PATTERN.findall(b):
+        return False
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    # 빠른 상한 검사로 확실히 다른 항목은 자세히 비교하지 않음
+    return (
+        matcher.real_quick_ratio() >= similarity
+        and matcher.quick_ratio() >= similarity
+        and matcher.ratio() >= similarity
+    )
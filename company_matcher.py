@@ -0,0 +1,267 @@
+import math
+import re
+import unicodedata
+
+import pandas as pd
+
+# 매칭 방식
+MATCH_EXACT = "exact"  # 정규화한 이름이 같음
+MATCH_ALIAS = "alias"  # 별칭 표의 이름과 같음
+MATCH_SUBSIDIARY = "subsidiary"  # 목록의 회사 이름으로 시작함 (예: "LG AI연구원" → "LG")
+MATCH_FUZZY = "fuzzy"  # 글자 n-gram이 충분히 겹침 (오타, 표기 차이)
+
+# 회사 이름 앞뒤에 붙는 법인 형태 표기 (정규화할 때 지움)
+LEGAL_FORM_PATTERN = re.compile(
+    r"\(\s*(주|유|사|재|株)\s*\)|㈜|㈲|주식회사|유한회사|유한책임회사|사단법인|재단법인"
+    r"|\b(co\.?,?\s*ltd\.?|ltd\.?|inc\.?|corp\.?|corporation|limited|llc|gmbh)(?=\W|$)",
+    re.IGNORECASE,
+)
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+# 단어 경계 없이 뒤에 글자가 이어지는 한글 회사 이름을 자회사로 볼 최소 길이
+# ("한국" → "한국타이어"처럼 짧은 이름은 우연히 겹치기 쉬우므로 별칭 표에 있을 때만 인정)
+MIN_HANGUL_PREFIX_LENGTH = 3
+
+# 정규화한 이름 기준 자주 쓰이는 다른 표기 → 회사 목록의 이름
+# (회사 목록 시트에 '별칭' 열을 두면 거기 적은 별칭도 함께 씁니다)
+COMPANY_ALIASES = {
+    "네이버": "NAVER",
+    "네이버클라우드": "NAVERCloud",
+    "엘지": "LG",
+    "엘지ai연구원": "LGAI연구원",
+    "lg인공지능연구원": "LGAI연구원",
+    "마이크로소프트": "Microsoft",
+    "한국마이크로소프트": "Microsoft",
+    "microsoftkorea": "Microsoft",
+    "에스케이": "SK",
+    "삼성": "삼성전자",
+    "samsung": "삼성전자",
+    "samsungelectronics": "삼성전자",
+    "카카오": "kakao",
+    "upstage": "업스테이지",
+    "씨제이대한통운": "CJ대한통운",
+    "cjlogistics": "CJ대한통운",
+    "doosan": "두산",
+    "hyundai": "현대자동차",
+    "현대차": "현대자동차",
+}
+
+
+def _is_ascii_letter(ch):
+    return ch.isascii() and ch.isalpha()
+
+
+def normalize_with_boundaries(name):
+    """
+    회사 이름을 정규화하고 (정규화한 이름, 원래 단어 경계 위치 집합)을 반환합니다.
+
+    전각/반각 통일(NFKC), 법인 형태 표기 제거, 소문자화 후 공백과 문장부호를 지웁니다.
+    경계는 지운 공백/문장부호 자리, 영문과 한글이 바뀌는 자리, 소문자 뒤 대문자(NaverCloud)입니다.
+    """
+    if not isinstance(name, str):
+        return "", set()
+    text = LEGAL_FORM_PATTERN.sub(" ", unicodedata.normalize("NFKC", name))
+    normalized = []
+    boundaries = set()
+    position = 0
+    for token in TOKEN_PATTERN.findall(text):
+        if position:
+            boundaries.add(position)
+        for previous, ch in zip(" " + token, token):
+            if previous != " " and (
+                _is_ascii_letter(previous) != _is_ascii_letter(ch)
+                or (previous.islower() and ch.isupper())
+            ):
+                boundaries.add(position)
+            position += 1
+        normalized.append(token)
+    return "".join(normalized).lower(), boundaries
+
+
+def normalize_company(name):
+    """
+    비교용으로 정규화한 회사 이름을 반환합니다. 예: "(주) LG AI 연구원" → "lgai연구원"
+    """
+    return normalize_with_boundaries(name)[0]
+
+
+def ngrams(text, n=2):
+    """
+    글자 n-gram 목록을 반환합니다. n보다 짧은 이름은 이름 전체를 하나로 봅니다.
+    """
+    if len(text) <= n:
+        return [text] if text else []
+    return [text[i : i + n] for i in range(len(text) - n + 1)]
+
+
+class CompanyMatcher:
+    """
+    공고의 회사 이름을 회사 목록(수천 개)의 이름에 대응시킵니다.
+
+    - 정규화한 이름과 별칭은 딕셔너리로 바로 찾습니다.
+    - 자회사/사업부("LG AI연구원", "네이버클라우드")는 목록 이름들로 만든 트라이를
+      공고 이름의 앞에서부터 한 번 따라가 가장 긴 목록 이름을 찾습니다.
+    - 나머지는 글자 n-gram 역색인으로 후보를 골라, 흔한 n-gram일수록 가볍게 센(IDF)
+      Dice 계수(2 × 공유 n-gram 가중치 / 두 이름의 n-gram 가중치 합)로 점수를 매깁니다.
+
+    목록 전체와 하나씩 비교하지 않으므로 공고 수 × 회사 수에 비례해 느려지지 않고,
+    같은 회사 이름은 한 번만 계산합니다.
+    """
+
+    def __init__(self, companies, aliases=None, ngram_size=2, min_score=0.85):
+        self.ngram_size = ngram_size
+        self.min_score = min_score
+        self._names = {}  # 정규화한 이름 → 회사 목록의 이름
+        self._aliases = {}  # 정규화한 별칭 → 회사 목록의 이름
+        self._trie = {}
+        self._index = {}  # n-gram → 그 n-gram을 가진 정규화한 이름들
+        self._grams = {}  # 정규화한 이름 → n-gram 집합
+        self._cache = {}
+
+        for company in companies:
+            key = normalize_company(company)
+            if key and key not in self._names:
+                self._names[key] = company
+        for alias, company in {**COMPANY_ALIASES, **(aliases or {})}.items():
+            key = normalize_company(alias)
+            target = self._names.get(normalize_company(company))
+            # 목록에 없는 회사의 별칭은 쓰지 않음
+            if key and target is not None and key not in self._names:
+                self._aliases[key] = target
+
+        keys = {**self._names, **self._aliases}
+        for key, company in keys.items():
+            node = self._trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[None] = (key, company)
+            self._grams[key] = frozenset(ngrams(key, ngram_size))
+            for gram in self._grams[key]:
+                self._index.setdefault(gram, []).append(key)
+        # 여러 이름에 흔히 들어가는 n-gram("솔루", "스템")은 가볍게 (IDF 가중치)
+        self._weights = {
+            gram: math.log(1 + len(keys) / len(entries)) for gram, entries in self._index.items()
+        }
+        self._unseen_weight = math.log(1 + len(keys))
+        self._name_weights = {
+            key: sum(self._weights[gram] for gram in grams) for key, grams in self._grams.items()
+        }
+
+    @classmethod
+    def from_table(cls, df, name_column="회사", alias_column="별칭", **kwargs):
+        """
+        회사 목록 시트로 만듭니다. alias_column 열이 있으면 쉼표로 나눈 별칭을 씁니다.
+        """
+        companies = [name for name in df[name_column] if isinstance(name, str)]
+        aliases = {}
+        if alias_column in df.columns:
+            for company, value in zip(df[name_column], df[alias_column]):
+                if isinstance(company, str) and isinstance(value, str):
+                    for alias in value.split(","):
+                        if alias.strip():
+                            aliases[alias.strip()] = company
+        return cls(companies, aliases, **kwargs)
+
+    def match(self, name):
+        """
+        (회사 목록의 이름, 점수 0~1, 매칭 방식)을 반환합니다. min_score 이상인 후보가 없으면 None입니다.
+        """
+        if name not in self._cache:
+            self._cache[name] = self._match(name)
+        return self._cache[name]
+
+    def _match(self, name):
+        key, boundaries = normalize_with_boundaries(name)
+        if not key:
+            return None
+        if key in self._names:
+            return self._names[key], 1.0, MATCH_EXACT
+        if key in self._aliases:
+            return self._aliases[key], 1.0, MATCH_ALIAS
+
+        candidates = []
+        subsidiary = self._longest_prefix(key, boundaries)
+        if subsidiary is not None:
+            candidates.append(subsidiary)
+        fuzzy = self._best_fuzzy(key)
+        if fuzzy is not None:
+            candidates.append(fuzzy)
+        candidates = [c for c in candidates if c[1] >= self.min_score]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda c: c[1])
+
+    def _longest_prefix(self, key, boundaries):
+        """
+        key가 목록 이름(또는 별칭)으로 시작하면 가장 긴 것을 (회사, 점수, MATCH_SUBSIDIARY)로 반환합니다.
+        원래 이름에서 단어 경계가 아닌 곳에서 끝나는 짧은 영문 이름("SK" → "SKIN")은 점수를 낮추고,
+        띄어쓰기 없이 이어지는 MIN_HANGUL_PREFIX_LENGTH보다 짧은 한글 이름("한국" → "한국타이어")은
+        별칭 표의 이름이 아니면 min_score보다 낮게 줍니다.
+        """
+        node = self._trie
+        best = None
+        for position, ch in enumerate(key, 1):
+            node = node.get(ch)
+            if node is None:
+                break
+            if None in node and position < len(key):
+                best = position, *node[None]
+        if best is None:
+            return None
+        length, prefix, company = best
+        if length < 2:
+            return None
+        ascii_end = _is_ascii_letter(key[length - 1])
+        if length in boundaries or ascii_end != _is_ascii_letter(key[length]):
+            # 단어 경계나 영문/한글이 바뀌는 곳에서 끝남
+            score = 0.9
+        elif ascii_end:
+            # 목록 이름이 길수록(우연히 겹칠 가능성이 낮을수록) 높게
+            score = min(0.85, 0.5 + 0.07 * length)
+        elif length >= MIN_HANGUL_PREFIX_LENGTH or prefix in self._aliases:
+            score = 0.9
+        else:
+            score = 0.5
+        return company, score, MATCH_SUBSIDIARY
+
+    def _best_fuzzy(self, key):
+        """
+        n-gram이 가장 많이 겹치는 목록 이름을 (회사, 가중 Dice 점수, MATCH_FUZZY)로 반환합니다.
+
+        드문 n-gram부터 역색인을 따라가다가, 남은 n-gram만 겹치는 이름은 min_score에 닿을 수 없게 되면
+        멈춥니다 (prefix filtering). 흔한 n-gram의 긴 목록은 대부분 읽지 않습니다.
+        """
+        grams = set(ngrams(key, self.ngram_size))
+        if not grams:
+            return None
+        weights = {gram: self._weights.get(gram, self._unseen_weight) for gram in grams}
+        query_weight = sum(weights.values())
+        # 남은 가중치 w만 겹치는 후보의 점수 상한은 2w / (query_weight + w)
+        stop_weight = self.min_score * query_weight / (2 - self.min_score)
+        remaining = query_weight
+        candidates = set()
+        for gram in sorted(grams, key=lambda g: -weights[g]):
+            if remaining < stop_weight:
+                break
+            candidates.update(self._index.get(gram, ()))
+            remaining -= weights[gram]
+
+        best_key, best_score = None, 0.0
+        for candidate in candidates:
+            shared = sum(weights[gram] for gram in grams & self._grams[candidate])
+            score = 2 * shared / (query_weight + self._name_weights[candidate])
+            if score > best_score or (score == best_score and candidate < best_key):
+                best_key, best_score = candidate, score
+        if best_key is None:
+            return None
+        company = self._names.get(best_key) or self._aliases[best_key]
+        return company, best_score, MATCH_FUZZY
+
+    def match_series(self, names):
+        """
+        회사 이름 Series를 받아 '매칭 회사', '매칭 점수', '매칭 방식' 열의 DataFrame을 같은 인덱스로 반환합니다.
+        서로 다른 이름만 한 번씩 매칭합니다.
+        """
+        unique = pd.unique(names)
+        matches = {name: self.match(name) or (None, 0.0, None) for name in unique}
+        rows = [matches[name] for name in names]
+        return pd.DataFrame(rows, index=names.index, columns=["매칭 회사", "매칭 점수", "매칭 방식"])
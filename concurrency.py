@@ -0,0 +1,122 @@
+import statistics
+import threading
+import time
+
+
+class AdaptiveConcurrencyController:
+    """
+    LLM 서버로 동시에 보내는 요청 수를 관찰된 지연시간/처리량/오류율에 따라 조절합니다 (AIMD).
+
+    - 한 라운드(현재 한도만큼의 요청 완료) 동안 오류가 없고, 지연시간이 기준치의
+      latency_tolerance배 이내이면 한도를 1 늘립니다.
+    - 한도를 늘렸는데 다음 라운드의 처리량이 오히려 떨어졌으면 다시 1 줄입니다.
+    - 타임아웃/오류가 나면 한도를 decrease_factor배로 즉시 줄입니다. 한 번의 과부하로 동시에 실패한
+      요청들이 한도를 거듭 줄이지 않도록, 마지막으로 줄인 뒤에 시작된 요청의 실패만 다시 줄입니다.
+    - 지연시간만 기준보다 크게 늘었으면(서버에서 대기열이 생김) 한도를 1 줄입니다.
+    기준 지연시간은 지금까지의 최솟값을 따르되 라운드마다 baseline_decay만큼 최근 중앙값 쪽으로 옮겨서,
+    긴 프롬프트가 이어지는 것만으로 계속 "느림"으로 판단하지 않게 합니다.
+    한도는 항상 min_limit ~ max_limit 사이로 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit=5,
+        min_limit=1,
+        max_limit=16,
+        latency_tolerance=1.5,
+        decrease_factor=0.5,
+        baseline_decay=0.1,
+        verbose=True,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = max(min_limit, min(initial_limit, max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.baseline_decay = baseline_decay
+        self.verbose = verbose
+
+        self.in_flight = 0
+        self.baseline_latency = None
+        self._round_latencies = []
+        self._round_started = time.time()
+        self._last_throughput = None
+        self._increased = False
+        self._last_decrease_at = 0.0
+        self._condition = threading.Condition()
+
+    def _log(self, message):
+        if self.verbose:
+            print(f"  [동시성 조절] {message}")
+
+    def acquire(self):
+        """
+        현재 한도보다 요청이 적어질 때까지 기다린 뒤 요청 슬롯 하나를 차지합니다.
+        """
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency, success=True):
+        """
+        요청 슬롯을 반납하며 요청의 지연시간(초)과 성공 여부를 기록합니다.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if success:
+                self._round_latencies.append(latency)
+                if len(self._round_latencies) >= self.limit:
+                    self._end_round()
+            elif time.time() - latency >= self._last_decrease_at:
+                # 마지막으로 줄이기 전에 시작된 요청의 실패는 같은 과부하의 결과이므로 다시 줄이지 않음
+                self._decrease(
+                    max(self.min_limit, int(self.limit * self.decrease_factor)),
+                    "타임아웃/오류 발생",
+                )
+                self._last_decrease_at = time.time()
+            self._condition.notify_all()
+
+    def _decrease(self, new_limit, reason):
+        if new_limit < self.limit:
+            self._log(f"{reason} → 동시 요청 {self.limit} → {new_limit}")
+            self.limit = new_limit
+        self._increased = False
+        self._reset_round()
+
+    def _reset_round(self):
+        self._round_latencies = []
+        self._round_started = time.time()
+
+    def _end_round(self):
+        latencies = self._round_latencies
+        elapsed = max(time.time() - self._round_started, 1e-6)
+        throughput = len(latencies) / elapsed
+        median_latency = statistics.median(latencies)
+        if self.baseline_latency is None or median_latency < self.baseline_latency:
+            self.baseline_latency = median_latency
+        else:
+            self.baseline_latency += (median_latency - self.baseline_latency) * self.baseline_decay
+
+        if median_latency > self.baseline_latency * self.latency_tolerance:
+            self._decrease(
+                max(self.min_limit, self.limit - 1),
+                f"지연시간 증가 ({median_latency:.1f}s, 기준 {self.baseline_latency:.1f}s)",
+            )
+        elif self._increased and throughput < self._last_throughput * 0.9:
+            self._decrease(
+                max(self.min_limit, self.limit - 1),
+                f"처리량 감소 ({throughput:.2f}건/s, 이전 {self._last_throughput:.2f}건/s)",
+            )
+        elif self.limit < self.max_limit:
+            self._log(
+                f"처리량 {throughput:.2f}건/s, 지연시간 {median_latency:.1f}s "
+                f"→ 동시 요청 {self.limit} → {self.limit + 1}"
+            )
+            self.limit += 1
+            self._increased = True
+            self._reset_round()
+        else:
+            self._increased = False
+            self._reset_round()
+        self._last_throughput = throughput
@@ -0,0 +1,224 @@
+import math
+import re
+import threading
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+# 본문과 무관해서 통째로 버리는 태그
+DROP_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "svg",
+    "iframe",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "form",
+    "button",
+]
+
+# LLM에 꼭 전달해야 하는 섹션의 제목
+TARGET_HEADINGS = {
+    "자격요건": re.compile(
+        r"^[\W_]*(자격\s*요건|지원\s*자격|필수\s*(요건|사항|역량)|requirements?|qualifications?"
+        r"|minimum qualifications|what you need|who you are)\b",
+        re.IGNORECASE,
+    ),
+    "우대사항": re.compile(
+        r"^[\W_]*(우대\s*(사항|요건|조건)|preferred|nice to have|bonus points)\b",
+        re.IGNORECASE,
+    ),
+}
+
+# 목표 섹션이 어디서 끝나는지 판단하기 위한 다른 섹션의 제목
+OTHER_HEADINGS = re.compile(
+    r"^[\W_]*(주요\s*업무|담당\s*업무|업무\s*내용|복리\s*후생|혜택|채용\s*절차|전형\s*절차"
+    r"|근무\s*(조건|환경|지|장소)|기타|참고\s*사항|회사\s*소개|팀\s*소개|제출\s*서류"
+    r"|responsibilities|what you('ll| will) do|benefits|perks|hiring process|about us)\b",
+    re.IGNORECASE,
+)
+
+# 어느 회사 페이지에나 반복되는 안내 문구
+BOILERPLATE_PATTERNS = re.compile(
+    r"(쿠키|cookie|개인정보\s*처리\s*방침|privacy policy|이용\s*약관|terms of (use|service)"
+    r"|copyright|©|all rights reserved|공유하기)",
+    re.IGNORECASE,
+)
+
+# 이보다 짧은 줄은 반복되어도 남김 (같은 기술이 자격요건과 우대사항에 모두 나올 수 있음)
+MIN_DEDUPE_LENGTH = 20
+
+# 제목 줄로 보기에는 너무 긴 줄은 섹션 제목 후보에서 제외
+MAX_HEADING_LENGTH = 40
+
+BODY_TAG = re.compile(r"<body[\s>/]", re.IGNORECASE)
+# html.parser 트리의 get_text()가 건너뛰는 문자열(template, 루비 주석)은 lxml에서도 제외
+_TEXTS = etree.XPath(".//text()[not(ancestor::template or ancestor::rt or ancestor::rp)]")
+
+_local = threading.local()
+
+
+def estimate_tokens(text):
+    """
+    토크나이저 없이 토큰 수를 대략 추정합니다.
+    영문/숫자는 약 4자당 1토큰, 한글 등 비ASCII 문자는 약 1.5자당 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / 4 + other_chars / 1.5)
+
+
+def _visible_lines_soup(html_source):
+    soup = BeautifulSoup(html_source, "html.parser")
+    for tag in soup.find_all(DROP_TAGS):
+        tag.decompose()
+    root = soup.body or soup
+    return root.get_text(separator="\n").split("\n")
+
+
+def _parser():
+    # lxml 파서는 스레드 간에 공유하면 안 되므로 스레드마다 하나씩 만듦
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = lxml.html.HTMLParser(recover=True)
+    return parser
+
+
+def _visible_lines_lxml(html_source):
+    """
+    _visible_lines_soup과 같은 줄 목록을 lxml(libxml2)로 만듭니다. 트리를 한 번만 만들고
+    텍스트 노드를 바로 모읍니다. libxml2가 태그 짝이 맞지 않는 HTML을 고쳐 읽은 경우처럼
+    결과가 달라질 수 있으면 None을 반환합니다.
+    """
+    if "<![CDATA[" in html_source:
+        # html.parser는 CDATA를 텍스트로, libxml2는 주석으로 읽음
+        return None
+    parser = _parser()
+    try:
+        document = lxml.html.document_fromstring(html_source, parser=parser)
+    except (etree.ParserError, ValueError):
+        # 빈 문서, 또는 인코딩 선언이 들어있는 XHTML 문자열
+        return None
+    if len(parser.error_log):
+        return None
+
+    for element in list(document.iter(*DROP_TAGS)):
+        # drop_tree는 decompose와 같이 뒤따르는 텍스트(tail)는 남김
+        element.drop_tree()
+    root = document.body if BODY_TAG.search(html_source) else document
+    return "\n".join(_TEXTS(root)).split("\n")
+
+
+def _visible_lines(html_source, fast_parser=True):
+    lines = _visible_lines_lxml(html_source) if fast_parser else None
+    if lines is None:
+        lines = _visible_lines_soup(html_source)
+    return lines
+
+
+def _clean_lines(lines):
+    """
+    공백을 정리하고, 빈 줄/안내 문구/이미 나온 긴 줄(반복 블록)을 제거합니다.
+    """
+    seen = set()
+    cleaned = []
+    for line in lines:
+        line = " ".join(line.split())
+        if not line or line in seen:
+            continue
+        if len(line) < 80 and BOILERPLATE_PATTERNS.search(line):
+            continue
+        if len(line) >= MIN_DEDUPE_LENGTH:
+            seen.add(line)
+        cleaned.append(line)
+    return cleaned
+
+
+def heading_kind(line):
+    """
+    줄이 섹션 제목이면 "자격요건"/"우대사항"/"기타"를, 아니면 None을 반환합니다.
+    """
+    if len(line) > MAX_HEADING_LENGTH:
+        return None
+    for kind, pattern in TARGET_HEADINGS.items():
+        if pattern.search(line):
+            return kind
+    if OTHER_HEADINGS.search(line):
+        return "기타"
+    return None
+
+
+def _target_sections(lines):
+    """
+    자격요건/우대사항 제목부터 다음 섹션 제목 직전까지의 줄만 모아 반환합니다.
+    """
+    selected = []
+    sections = []
+    current = None
+    for line in lines:
+        kind = heading_kind(line)
+        if kind is not None:
+            current = kind if kind in TARGET_HEADINGS else None
+            if current:
+                sections.append(current)
+        if current:
+            selected.append(line)
+    return selected, sections
+
+
+def _truncate_to_tokens(text, token_budget):
+    """
+    estimate_tokens 기준으로 token_budget 토큰 안에 들어가는 앞부분을 반환합니다.
+    """
+    used = 0.0
+    for i, ch in enumerate(text):
+        used += 0.25 if ord(ch) < 128 else 1 / 1.5
+        if used > token_budget:
+            return text[:i]
+    return text
+
+
+def _fit_budget(lines, token_budget):
+    kept = []
+    used = 0
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if used + cost > token_budget:
+            # 줄바꿈 없는 긴 문단(한 <p>에 담긴 공고, 압축된 텍스트)도 비지 않도록 남은 예산만큼 잘라 넣음
+            head = _truncate_to_tokens(line, token_budget - used - 1)
+            if head.strip():
+                kept.append(head)
+            break
+        kept.append(line)
+        used += cost
+    return kept
+
+
+def reduce_content(html_source, token_budget=4096, fast_parser=True):
+    """
+    채용 공고 HTML을 LLM에 보낼 짧은 텍스트로 줄입니다.
+
+    네비게이션/스크립트/반복 문구를 제거한 뒤 자격요건·우대사항 섹션을 찾아 그 부분만 남기고,
+    섹션을 찾지 못하면 정리된 전체 텍스트를 사용합니다. 결과는 token_budget 안으로 자릅니다.
+    (텍스트, 통계 딕셔너리)를 반환하며 통계에는 원본/결과 길이와 압축률이 들어있습니다.
+    fast_parser=False이면 lxml 대신 html.parser로만 파싱합니다 (결과는 같음).
+    """
+    lines = _clean_lines(_visible_lines(html_source, fast_parser))
+    selected, sections = _target_sections(lines)
+    if not selected:
+        selected = lines
+
+    text = "\n".join(_fit_budget(selected, token_budget))
+    original_chars = len(html_source)
+    stats = {
+        "original_chars": original_chars,
+        "reduced_chars": len(text),
+        "estimated_tokens": estimate_tokens(text),
+        "compression_ratio": original_chars / len(text) if text else 0.0,
+        "sections": sorted(set(sections)),
+    }
+    return text, stats
@@ -1,89 +1,51 @@
-# pip install pandas openpyxl bs4
+# pip install pandas openpyxl pyarrow bs4 lxml
 
-import pandas as pd
-from bs4 import BeautifulSoup
+import concurrent.futures
+import time
 from datetime import date
 
-today = date.today()
-formatted_date1 = today.strftime("%Y%m%d")
-formatted_date2 = today.strftime("%Y-%m-%d")
+import pandas as pd
+
+from listing_parser import FIELDS, parse_chunk
+from table_store import iter_table, save_table
+
+# --- 사용자 설정 영역 ---
+PARSE_WORKERS = None  # 카드 HTML을 파싱할 프로세스 수 (None이면 CPU 코어 수)
+PARSE_CHUNK_SIZE = 2000  # 한 프로세스에 한 번에 넘길 카드 수
+# -----------------------
 
 
-file_path = f'sheets/SINGLE_{formatted_date1}.xlsx'
-output_filename = f'sheets/ai_jobs_captured_list_{formatted_date2}.xlsx'
+def main():
+    start_time = time.time()
 
-df = pd.read_excel(file_path)
+    today = date.today()
+    formatted_date1 = today.strftime("%Y%m%d")
+    formatted_date2 = today.strftime("%Y-%m-%d")
 
+    # listly에서 받은 sheets/SINGLE_*.xlsx는 처음 읽을 때 parquet으로 변환됨
+    input_name = f'SINGLE_{formatted_date1}'
+    output_name = f'ai_jobs_captured_list_{formatted_date2}'
 
-htmls = df.iloc[:, 0]
-extracted_data = []
+    # 첫 번째 열(HTML 조각)을 청크 단위로 읽어 프로세스 풀에서 나눠 파싱 (결과 순서는 입력 순서 유지)
+    extracted_data = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+        futures = [
+            executor.submit(parse_chunk, list(chunk.iloc[:, 0]))
+            for chunk in iter_table(input_name, batch_size=PARSE_CHUNK_SIZE)
+        ]
+        for future in futures:
+            extracted_data.extend(future.result())
 
-def get_job_info(html):
-    soup = BeautifulSoup(html, "html.parser")
-    job_info = {
-        "회사": "N/A",
-        "제목": "N/A",
-        "경력": "N/A",
-        "근무형태": "N/A",
-        "학력": "N/A",
-        "근무지역": "N/A",
-        "링크": "N/A",
-    }
-    link_tag = soup.find('a', href=True)
-    
-    if link_tag: # 링크 태그가 존재하는 경우
-        job_info["링크"] = link_tag['href']
-        
-    company_tag = soup.select_one('div section span')
-    if company_tag:
-        job_info["회사"] = company_tag.get_text(strip=True)
-    else:
-        company_container = soup.select_one('div.ds-web-summary')
-        if company_container:
-            company_tag = company_container.find('span')
-            if company_tag:
-                job_info["회사"] = company_tag.get_text(strip=True)
-    
-    title_tag = soup.select_one('div div p')
-    if title_tag: 
-        job_info["제목"] = title_tag.get_text(strip=True)
-    
-    other_containers = soup.select_one('div.ds-web-summary:last-of-type')
-    if other_containers:
-        items = other_containers.find_all(recursive=False)
-        others = []
-        for item in items:
-            if item.name == 'span':
-                text = item.get_text(strip=True)
-                if text and text != "·":
-                    others.append(text)
-        if len(others) > 0:
-            job_info['경력'] = others[0] if len(others) > 0 else "N/A"
-            job_info['근무형태'] = others[1] if len(others) > 1 else "N/A"
-            job_info['학력'] = others[2] if len(others) > 2 else "N/A"
-            job_info['근무지역'] = others[3] if len(others) > 3 else "N/A"
+    if extracted_data:
+        processed_df = pd.DataFrame(extracted_data, columns=FIELDS)
+        output_filename = save_table(processed_df, output_name)
 
-    return job_info
+        print(
+            f"데이터 처리가 완료되었습니다. 결과는 '{output_filename}' 파일에 저장되었습니다."
+        )
+        print(processed_df.head().to_string())  # 데이터프레임의 상위 5개 행 출력
+        print(f"공고 {len(processed_df):,}건, 소요 시간: {time.time() - start_time:.2f}초")
 
-for html in htmls:
-    job_info = get_job_info(html)
-    extracted_data.append(job_info)
 
-if extracted_data:
-    processed_df = pd.DataFrame(extracted_data)
-    cols = [
-        "회사",
-        "제목",
-        "경력",
-        "근무형태",
-        "학력",
-        "근무지역",
-        "링크"
-    ]
-    processed_df = processed_df[cols]
-    processed_df.to_excel(output_filename, index=False)
-    
-    print(
-        f"데이터 처리가 완료되었습니다. 결과는 '{output_filename}' 파일에 저장되었습니다."
-    )
-    print(processed_df.head().to_string())  # 데이터프레임의 상위 5개 행 출력
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import threading
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+FIELDS = ["회사", "제목", "경력", "근무형태", "학력", "근무지역", "링크"]
+SUMMARY_FIELDS = ["경력", "근무형태", "학력", "근무지역"]  # 마지막 요약줄의 span 순서
+
+# CSS 선택자를 미리 XPath로 컴파일해 둠 (카드마다 선택자를 해석하지 않도록)
+_HAS_SUMMARY_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' ds-web-summary ')"
+_FIRST_LINK = etree.XPath("(//a[@href])[1]/@href")  # find('a', href=True)
+_COMPANY = etree.XPath("(//div//section//span)[1]")  # select_one('div section span')
+_SUMMARY = etree.XPath(f"(//div[{_HAS_SUMMARY_CLASS}])[1]")  # select_one('div.ds-web-summary')
+_TITLE = etree.XPath("(//div//div//p)[1]")  # select_one('div div p')
+_LAST_SUMMARY = etree.XPath(  # select_one('div.ds-web-summary:last-of-type')
+    f"(//div[{_HAS_SUMMARY_CLASS}][not(following-sibling::div)])[1]"
+)
+_FIRST_SPAN = etree.XPath("(.//span)[1]")
+_TEXTS = etree.XPath(".//text()[not(parent::script) and not(parent::style)]")
+
+# 닫는 태그가 없는 빈 요소
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+_local = threading.local()
+
+
+def _text(element):
+    """
+    BeautifulSoup의 get_text(strip=True)와 같이 하위 텍스트를 각각 strip해 이어 붙입니다.
+    """
+    return "".join(text.strip() for text in _TEXTS(element))
+
+
+def _parser():
+    # lxml 파서는 스레드 간에 공유하면 안 되므로 스레드마다 하나씩 만듦
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = lxml.html.HTMLParser(recover=True)
+    return parser
+
+
+def _same_tree_as_source(root, html):
+    """
+    libxml2가 닫는 태그를 임의로 보충하지 않았는지 확인합니다.
+    (예: <p>a<p>b 를 html.parser는 중첩으로, libxml2는 형제로 읽음)
+    body 안의 빈 요소가 아닌 요소 수가 원본의 닫는 태그 수와 같으면 같은 트리로 봅니다.
+    """
+    body = root.find("body")
+    if body is None:
+        return False
+    elements = sum(1 for element in body.iter(etree.Element) if element.tag not in VOID_TAGS)
+    return elements - 1 == html.count("</")
+
+
+def get_job_info(html):
+    """
+    직행 공고 카드 HTML에서 회사/제목/경력/근무형태/학력/근무지역/링크를 추출합니다 (BeautifulSoup 기준 구현).
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    job_info = dict.fromkeys(FIELDS, "N/A")
+    link_tag = soup.find('a', href=True)
+
+    if link_tag: # 링크 태그가 존재하는 경우
+        job_info["링크"] = link_tag['href']
+
+    company_tag = soup.select_one('div section span')
+    if company_tag:
+        job_info["회사"] = company_tag.get_text(strip=True)
+    else:
+        company_container = soup.select_one('div.ds-web-summary')
+        if company_container:
+            company_tag = company_container.find('span')
+            if company_tag:
+                job_info["회사"] = company_tag.get_text(strip=True)
+
+    title_tag = soup.select_one('div div p')
+    if title_tag:
+        job_info["제목"] = title_tag.get_text(strip=True)
+
+    other_containers = soup.select_one('div.ds-web-summary:last-of-type')
+    if other_containers:
+        items = other_containers.find_all(recursive=False)
+        others = []
+        for item in items:
+            if item.name == 'span':
+                text = item.get_text(strip=True)
+                if text and text != "·":
+                    others.append(text)
+        for field, text in zip(SUMMARY_FIELDS, others):
+            job_info[field] = text
+
+    return job_info
+
+
+def get_job_info_fast(html):
+    """
+    get_job_info와 같은 결과를 lxml(libxml2)과 미리 컴파일한 XPath로 빠르게 추출합니다.
+
+    libxml2가 태그 짝이 맞지 않는 HTML을 고쳐서 읽은 경우에는 트리 모양이 html.parser와
+    달라질 수 있으므로, 이때는 get_job_info로 다시 추출합니다. listly가 저장하는 카드는 브라우저가
+    직렬화한 HTML이라 거의 항상 빠른 경로로 처리됩니다.
+    """
+    if not isinstance(html, str) or not html.strip():
+        return get_job_info(html)
+
+    parser = _parser()
+    root = lxml.html.document_fromstring(html, parser=parser)
+    if len(parser.error_log) or not _same_tree_as_source(root, html):
+        return get_job_info(html)
+
+    job_info = dict.fromkeys(FIELDS, "N/A")
+    links = _FIRST_LINK(root)
+    if links:
+        job_info["링크"] = links[0]
+
+    company_tags = _COMPANY(root)
+    if company_tags:
+        job_info["회사"] = _text(company_tags[0])
+    else:
+        summaries = _SUMMARY(root)
+        company_tags = _FIRST_SPAN(summaries[0]) if summaries else []
+        if company_tags:
+            job_info["회사"] = _text(company_tags[0])
+
+    title_tags = _TITLE(root)
+    if title_tags:
+        job_info["제목"] = _text(title_tags[0])
+
+    last_summaries = _LAST_SUMMARY(root)
+    if last_summaries:
+        others = []
+        for item in last_summaries[0]:
+            if item.tag == "span":
+                text = _text(item)
+                if text and text != "·":
+                    others.append(text)
+        for field, text in zip(SUMMARY_FIELDS, others):
+            job_info[field] = text
+
+    return job_info
+
+
+def parse_chunk(htmls):
+    """
+    카드 HTML 목록을 순서대로 추출합니다. 프로세스 풀에 청크 단위로 넘기기 위한 함수입니다.
+    """
+    return [get_job_info_fast(html) for html in htmls]
@@ -0,0 +1,204 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from llm_client import StreamingLLMClient, summarize_metrics
+
+
+class LLMEndpoint:
+    """
+    부하 분산 대상 추론 서버 하나의 상태입니다.
+    weight는 다른 서버 대비 동시 처리 능력의 비율이고, model을 주면 요청의 모델 이름을 바꿔 보냅니다.
+    """
+
+    def __init__(self, url, weight=1.0, model=None, pool_size=16, timeout=300):
+        self.url = url
+        self.weight = weight
+        self.model = model
+        self.client = StreamingLLMClient(url, pool_size=pool_size, timeout=timeout)
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0  # 이 시각 전까지는 요청을 보내지 않음 (0이면 정상)
+
+    @property
+    def health_url(self):
+        parsed = urlparse(self.url)
+        return f"{parsed.scheme}://{parsed.netloc}/v1/models"
+
+    def is_up(self, now):
+        return self.down_until <= now
+
+
+class LLMBalancer:
+    """
+    여러 OpenAI 호환 추론 서버(Ollama, vLLM 등)에 LLM 요청을 나눠 보냅니다.
+
+    - 진행 중인 요청 수를 weight로 나눈 값이 가장 작은 서버로 보냅니다 (least outstanding requests).
+    - 타임아웃/연결 오류/5xx가 난 요청은 아직 시도하지 않은 다른 서버로 옮겨 다시 보냅니다.
+    - 연속으로 failure_threshold번 실패한 서버는 cooldown초 동안 빼고, 헬스 체크(/v1/models)가
+      성공하면 다시 넣습니다. 모든 서버가 빠져 있으면 가장 먼저 복귀할 서버로 보냅니다.
+
+    StreamingLLMClient와 같은 complete_json/summary/metrics/take_thread_metrics를 제공하므로
+    그 자리에 그대로 쓸 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        endpoints,
+        pool_size=16,
+        timeout=300,
+        failure_threshold=2,
+        cooldown=60,
+        health_timeout=5,
+    ):
+        if not endpoints:
+            raise ValueError("LLM 엔드포인트가 하나 이상 필요합니다.")
+        self.endpoints = [
+            LLMEndpoint(
+                e["url"],
+                weight=e.get("weight", 1.0),
+                model=e.get("model"),
+                pool_size=pool_size,
+                timeout=timeout,
+            )
+            for e in endpoints
+        ]
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.health_timeout = health_timeout
+        self.failovers = 0
+        self._lock = threading.Lock()
+        self._stop = None
+        self._health_thread = None
+
+    def _acquire(self, tried):
+        """
+        아직 시도하지 않은 서버 중 부하가 가장 적은 서버를 골라 진행 중 요청 수를 1 늘립니다.
+        """
+        with self._lock:
+            now = time.time()
+            candidates = [e for e in self.endpoints if e not in tried]
+            if not candidates:
+                return None
+            up = [e for e in candidates if e.is_up(now)]
+            if up:
+                endpoint = min(
+                    up, key=lambda e: ((e.outstanding + 1) / e.weight, e.requests / e.weight)
+                )
+            else:
+                endpoint = min(candidates, key=lambda e: e.down_until)
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def _release(self, endpoint, success):
+        with self._lock:
+            endpoint.outstanding -= 1
+            if success:
+                endpoint.consecutive_failures = 0
+                endpoint.down_until = 0.0
+                return
+            endpoint.errors += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.failure_threshold:
+                endpoint.down_until = time.time() + self.cooldown
+
+    def complete_json(self, data):
+        """
+        StreamingLLMClient.complete_json과 같지만, 실패하면 다른 서버로 옮겨 다시 시도합니다.
+        모든 서버에서 실패하면 마지막 오류를 그대로 발생시킵니다.
+        """
+        tried = []
+        last_error = None
+        while True:
+            endpoint = self._acquire(tried)
+            if endpoint is None:
+                raise last_error
+            tried.append(endpoint)
+            payload = dict(data, model=endpoint.model) if endpoint.model else data
+            success = False
+            # 어떤 예외가 나도 진행 중 요청 수를 되돌림 (안 그러면 이 서버로는 요청이 가지 않게 됨)
+            try:
+                result = endpoint.client.complete_json(payload)
+                success = True
+            except requests.exceptions.RequestException as e:
+                response = getattr(e, "response", None)
+                # 4xx는 요청 자체의 문제이므로 다른 서버로 옮겨도 소용없음
+                if response is not None and 400 <= response.status_code < 500:
+                    success = True
+                    raise
+                last_error = e
+                if len(tried) < len(self.endpoints):
+                    with self._lock:
+                        self.failovers += 1
+                continue
+            finally:
+                self._release(endpoint, success=success)
+            return result
+
+    def check_health(self):
+        """
+        모든 서버에 /v1/models를 요청해 응답하는 서버는 복귀시키고 응답 없는 서버는 뺍니다.
+        {url: 정상 여부}를 반환합니다.
+        """
+        status = {}
+        for endpoint in self.endpoints:
+            try:
+                response = requests.get(endpoint.health_url, timeout=self.health_timeout)
+                healthy = response.ok
+            except requests.exceptions.RequestException:
+                healthy = False
+            with self._lock:
+                if healthy:
+                    endpoint.consecutive_failures = 0
+                    endpoint.down_until = 0.0
+                else:
+                    endpoint.down_until = max(endpoint.down_until, time.time() + self.cooldown)
+            status[endpoint.url] = healthy
+        return status
+
+    def start_health_checks(self, interval=30):
+        """
+        interval초마다 백그라운드에서 check_health()를 실행합니다. close()로 멈춥니다.
+        """
+        if self._health_thread is not None or len(self.endpoints) < 2:
+            return
+        stop = self._stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.check_health()
+
+        self._health_thread = threading.Thread(target=run, daemon=True)
+        self._health_thread.start()
+
+    @property
+    def metrics(self):
+        return [m for e in self.endpoints for m in e.client.metrics]
+
+    def take_thread_metrics(self):
+        return [m for e in self.endpoints for m in e.client.take_thread_metrics()]
+
+    def summary(self):
+        """
+        StreamingLLMClient.summary()와 같은 형식으로 모든 서버의 요청을 합쳐 반환합니다.
+        """
+        return summarize_metrics(self.metrics)
+
+    def endpoint_summary(self):
+        """
+        서버별 (url, 요청 수, 오류 수, 현재 정상 여부) 목록을 반환합니다.
+        """
+        now = time.time()
+        with self._lock:
+            return [(e.url, e.requests, e.errors, e.is_up(now)) for e in self.endpoints]
+
+    def close(self):
+        if self._health_thread is not None:
+            self._stop.set()
+            self._health_thread.join()
+            self._health_thread = None
@@ -0,0 +1,119 @@
+import hashlib
+import threading
+from collections import defaultdict
+
+from content_reducer import estimate_tokens
+from structured_output import normalize_extraction
+
+BATCH_PROMPT_TEMPLATE = """
+    다음은 여러 채용 공고 페이지의 내용입니다. 각 공고는 [공고 ID: ...] 로 구분되어 있습니다.
+    각 공고에서 '자격요건'과 '우대사항'을 찾아서 정리하라.
+    결과는 반드시 공고 ID를 키로 하는 아래와 같은 JSON 형식으로만 응답하라.
+    모든 공고 ID를 빠짐없이 포함하고, 내용이 없다면 빈 리스트([])로 응답하라.
+
+    {{
+      "공고 ID": {{
+        "자격요건": ["자격요건1", "자격요건2", ....],
+        "우대사항": ["우대사항1", "우대사항2", ....]
+      }},
+      ....
+    }}
+
+{postings}
+    """
+
+POSTING_TEMPLATE = """    [공고 ID: {posting_id}]
+    --- 공고 내용 시작 ---
+    {text_content}
+    --- 공고 내용 끝 ---
+"""
+
+# 지시문 등 공고 내용 외에 프롬프트가 차지하는 토큰 수 (대략)
+PROMPT_OVERHEAD_TOKENS = estimate_tokens(BATCH_PROMPT_TEMPLATE)
+POSTING_OVERHEAD_TOKENS = estimate_tokens(POSTING_TEMPLATE)
+
+
+def make_posting_id(text_content):
+    """
+    공고 내용의 해시로 배치 안에서 쓸 짧고 안정적인 ID를 만듭니다.
+    """
+    return hashlib.sha1(text_content.encode("utf-8")).hexdigest()[:8]
+
+
+def pack_batches(items, token_budget, max_postings):
+    """
+    (공고 ID, 텍스트) 목록을 프롬프트 전체가 token_budget을 넘지 않도록 배치로 묶습니다.
+    예산보다 큰 공고는 단독 배치가 됩니다.
+    """
+    batches = []
+    current = []
+    used = PROMPT_OVERHEAD_TOKENS
+    for posting_id, text_content in items:
+        cost = estimate_tokens(text_content) + POSTING_OVERHEAD_TOKENS
+        if current and (used + cost > token_budget or len(current) >= max_postings):
+            batches.append(current)
+            current = []
+            used = PROMPT_OVERHEAD_TOKENS
+        current.append((posting_id, text_content))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_batch_prompt(items):
+    postings = "\n".join(
+        POSTING_TEMPLATE.format(posting_id=posting_id, text_content=text_content)
+        for posting_id, text_content in items
+    )
+    return BATCH_PROMPT_TEMPLATE.format(postings=postings)
+
+
+def split_batch_response(parsed, posting_ids):
+    """
+    LLM이 돌려준 {공고 ID: 결과} 맵을 공고별로 나누고, (결과 딕셔너리, 누락된 ID 목록)을 반환합니다.
+    형식이 맞지 않는 항목(normalize_extraction 참고)은 누락으로 취급해 단독으로 다시 요청하도록 합니다.
+    """
+    results = {}
+    missing = []
+    for posting_id in posting_ids:
+        info = normalize_extraction(parsed.get(posting_id) if isinstance(parsed, dict) else None)
+        if info is not None:
+            results[posting_id] = info
+        else:
+            missing.append(posting_id)
+    return results, missing
+
+
+class BatchStats:
+    """
+    배치 크기별로 처리한 공고 수와 걸린 시간을 모아 처리량(건/초)을 비교합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = defaultdict(int)
+        self._elapsed = defaultdict(float)
+        self._batches = defaultdict(int)
+
+    def record(self, batch_size, elapsed):
+        with self._lock:
+            self._batches[batch_size] += 1
+            self._postings[batch_size] += batch_size
+            self._elapsed[batch_size] += elapsed
+
+    def report(self):
+        """
+        배치 크기별 [(배치 크기, 배치 수, 공고당 평균 시간, 단일 요청 대비 처리량 배율)]을 반환합니다.
+        """
+        with self._lock:
+            sizes = sorted(self._batches)
+            per_posting = {
+                size: self._elapsed[size] / self._postings[size] for size in sizes
+            }
+        baseline = per_posting.get(1)
+        rows = []
+        for size in sizes:
+            speedup = baseline / per_posting[size] if baseline and per_posting[size] else None
+            rows.append((size, self._batches[size], per_posting[size], speedup))
+        return rows
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class LLMCache:
+    """
+    call_local_llm의 추출 결과를 디스크(SQLite)에 저장하는 내용 기반 캐시입니다.
+
+    키는 (정제된 공고 텍스트, 프롬프트 템플릿, 모델 이름)의 SHA-256 해시이므로
+    어제와 동일한 공고는 LLM을 다시 호출하지 않고 저장된 결과를 재사용합니다.
+    오래된 항목(max_age_days)과 개수 초과분(max_entries)은 오래 사용되지 않은 순서로 삭제됩니다.
+    """
+
+    def __init__(self, path, max_entries=10000, max_age_days=30):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # call_local_llm은 여러 스레드에서 호출되므로 하나의 연결을 lock으로 보호해 공유합니다.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def make_key(text, prompt_template, model_name):
+        """
+        캐시 키를 생성합니다. 텍스트, 프롬프트, 모델 중 하나라도 바뀌면 다른 키가 됩니다.
+        """
+        hasher = hashlib.sha256()
+        for part in (model_name, prompt_template, text):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def get(self, key):
+        """
+        캐시된 결과를 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        """
+        추출 결과를 저장합니다. 개수 한도를 넘으면 오래 사용되지 않은 항목부터 삭제합니다.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            self._conn.commit()
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        if count > self.max_entries:
+            self.evict()
+
+    def evict(self):
+        """
+        만료된 항목과 max_entries를 초과하는 항목을 삭제하고, 삭제한 개수를 반환합니다.
+        """
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (cutoff,)
+            ).rowcount
+            removed += self._conn.execute(
+                """
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY accessed_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            ).rowcount
+            self._conn.commit()
+        return removed
+
+    def stats(self):
+        """
+        적중/실패 횟수와 적중률을 딕셔너리로 반환합니다.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
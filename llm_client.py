@@ -0,0 +1,258 @@
+import json
+import statistics
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from content_reducer import estimate_tokens
+from perf_trace import ESTIMATED_TOKEN_FIELDS
+
+NANOSECONDS = 1e9
+# JSON 객체가 완성된 뒤 마지막 사용량 조각(usage)을 받으려고 스트림을 더 읽는 최대 시간(초)
+# (0이면 바로 끊고 사용량은 추정치로 기록)
+USAGE_DRAIN_SECONDS = 0.5
+
+
+def _read_usage(chunk, usage):
+    """
+    응답 조각에서 토큰 사용량을 읽어 usage에 채웁니다.
+    OpenAI 형식의 usage와 Ollama 고유 필드(prompt_eval_count, eval_duration 등, 시간은 나노초)를 모두 읽습니다.
+    """
+    reported = chunk.get("usage") or {}
+    if reported.get("prompt_tokens") is not None:
+        usage["prompt_tokens"] = reported["prompt_tokens"]
+    if reported.get("completion_tokens") is not None:
+        usage["eval_tokens"] = reported["completion_tokens"]
+    if chunk.get("prompt_eval_count") is not None:
+        usage["prompt_tokens"] = chunk["prompt_eval_count"]
+    if chunk.get("eval_count") is not None:
+        usage["eval_tokens"] = chunk["eval_count"]
+    for field, key in (
+        ("prompt_eval_duration", "prefill_seconds"),
+        ("eval_duration", "decode_seconds"),
+        ("load_duration", "load_seconds"),
+    ):
+        if chunk.get(field) is not None:
+            usage[key] = chunk[field] / NANOSECONDS
+
+
+class JsonObjectTracker:
+    """
+    스트리밍으로 들어오는 텍스트 조각을 받아, 첫 번째 최상위 JSON 객체가
+    닫히는 순간(중괄호 짝이 맞는 순간)을 찾아냅니다. 문자열 안의 중괄호와 이스케이프는 무시합니다.
+    짝은 맞지만 JSON으로 읽히지 않는 객체(추론 모델의 메모, {"a": tru} 등)는 버리고 다음 객체를 기다립니다.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.buffer = []
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk):
+        """
+        텍스트 조각을 추가합니다. 객체가 완성되면 그 JSON 문자열을, 아니면 None을 반환합니다.
+        """
+        for ch in chunk:
+            if not self.started:
+                if ch != "{":
+                    continue
+                self.started = True
+
+            self.buffer.append(ch)
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+                continue
+
+            if ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    candidate = "".join(self.buffer)
+                    try:
+                        json.loads(candidate)
+                    except json.JSONDecodeError:
+                        self._reset()
+                        continue
+                    return candidate
+        return None
+
+
+class StreamingLLMClient:
+    """
+    OpenAI 호환 chat/completions 엔드포인트에 스트리밍으로 요청하는 클라이언트입니다.
+
+    keep-alive 연결 풀(requests.Session)을 모든 스레드가 공유하고, 응답 토큰을 받는 대로
+    JSON 객체의 짝을 맞춰 보다가 객체가 완성되면 연결을 끊어 나머지 생성을 중단시킵니다.
+    요청마다 첫 토큰까지의 시간(TTFT)과 전체 시간, 프롬프트/생성 토큰 수와
+    prefill/decode 시간을 기록합니다. JSON이 완성된 뒤에도 usage_drain_seconds 동안은 스트림을 더 읽어
+    마지막 사용량 조각을 기다리고, 그래도 오지 않은 항목은 TTFT와 스트리밍 조각 수로 추정한 뒤
+    estimated_fields에 이름을 남깁니다.
+    """
+
+    def __init__(
+        self, api_url, pool_size=16, timeout=300, usage_drain_seconds=USAGE_DRAIN_SECONDS
+    ):
+        self.api_url = api_url
+        self.timeout = timeout
+        self.usage_drain_seconds = usage_drain_seconds
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.metrics = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _iter_deltas(self, response, usage):
+        """
+        SSE 응답에서 (본문 텍스트, 추론 텍스트) 조각을 순서대로 꺼냅니다.
+        마지막 조각에 토큰 사용량이 있으면 usage 딕셔너리에 채웁니다.
+        """
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            payload = line[len("data:"):].strip()
+            if payload == "[DONE]":
+                break
+            try:
+                chunk = json.loads(payload)
+            except json.JSONDecodeError:
+                # 깨진 줄이나 keep-alive 같은 JSON이 아닌 줄은 건너뜀
+                continue
+            _read_usage(chunk, usage)
+            choices = chunk.get("choices") or []
+            if not choices:
+                continue
+            delta = choices[0].get("delta") or {}
+            reasoning = delta.get("reasoning") or delta.get("reasoning_content") or ""
+            yield delta.get("content") or "", reasoning
+
+    def complete_json(self, data):
+        """
+        요청을 스트리밍으로 보내고 (전체 본문 텍스트, 완성된 JSON 문자열 또는 None)을 반환합니다.
+        JSON 객체가 완성되면 그 뒤의 생성은 기다리지 않습니다.
+        """
+        payload = dict(data, stream=True, stream_options={"include_usage": True})
+        start = time.time()
+        first_token_at = None
+        early_stop = False
+        parts = []
+        usage = {}
+        eval_tokens = 0
+        reasoning_tokens = 0
+        tracker = JsonObjectTracker()
+        json_str = None
+
+        with self.session.post(
+            self.api_url,
+            headers={"Content-Type": "application/json"},
+            data=json.dumps(payload),
+            timeout=self.timeout,
+            stream=True,
+        ) as response:
+            if not response.ok:
+                # 연결을 닫은 뒤에도 호출한 쪽이 오류 내용(e.response.text)을 볼 수 있도록 미리 읽어 둠
+                response.content
+            response.raise_for_status()
+            # SSE는 항상 UTF-8이지만, charset이 없는 text/event-stream을 requests는 ISO-8859-1로 해석함
+            response.encoding = "utf-8"
+            deltas = self._iter_deltas(response, usage)
+            for content, reasoning in deltas:
+                if first_token_at is None and (content or reasoning):
+                    first_token_at = time.time()
+                # 스트리밍 조각 하나가 대체로 토큰 하나
+                eval_tokens += bool(content)
+                reasoning_tokens += bool(reasoning)
+                if not content:
+                    continue
+                parts.append(content)
+                json_str = tracker.feed(content)
+                if json_str is not None:
+                    early_stop = True
+                    break
+
+            elapsed = time.time() - start
+            if early_stop:
+                # 끝나가는 생성이면 곧 사용량 조각이 오므로 잠깐만 더 읽고,
+                # 그 뒤 응답을 닫으면 서버가 연결 종료를 감지하고 남은 생성을 멈춤
+                drain_until = time.time() + self.usage_drain_seconds
+                while self.usage_drain_seconds > 0 and time.time() < drain_until:
+                    if next(deltas, None) is None:
+                        break
+
+        ttft = first_token_at - start if first_token_at else None
+        estimated = {
+            "prompt_tokens": sum(
+                estimate_tokens(m.get("content") or "") for m in data["messages"]
+            ),
+            "eval_tokens": eval_tokens,
+            "prefill_seconds": ttft or 0.0,
+            "decode_seconds": elapsed - ttft if ttft is not None else 0.0,
+        }
+        if "eval_tokens" in usage:
+            # 서버가 보고한 생성 토큰 수에는 추론 토큰도 들어 있음
+            usage["eval_tokens"] = max(usage["eval_tokens"] - reasoning_tokens, 0)
+        entry = {
+            "ttft": ttft,
+            "elapsed": elapsed,
+            "early_stop": early_stop,
+            "reasoning_tokens": reasoning_tokens,
+            "load_seconds": usage.get("load_seconds", 0.0),
+            "usage_reported": bool(usage),
+            # 서버가 보고하지 않아 추정치로 채운 항목 (보고된 값과 따로 합산하기 위함)
+            "estimated_fields": tuple(f for f in ESTIMATED_TOKEN_FIELDS if f not in usage),
+        }
+        for field in ESTIMATED_TOKEN_FIELDS:
+            entry[field] = usage[field] if field in usage else estimated[field]
+        with self._lock:
+            self.metrics.append(entry)
+        if not hasattr(self._local, "metrics"):
+            self._local.metrics = []
+        self._local.metrics.append(entry)
+        return "".join(parts), json_str
+
+    def take_thread_metrics(self):
+        """
+        이 스레드에서 지난 호출 이후 보낸 요청들의 지표를 반환하고 비웁니다.
+        """
+        metrics = getattr(self._local, "metrics", [])
+        self._local.metrics = []
+        return metrics
+
+    def summary(self):
+        """
+        지금까지의 요청에 대한 TTFT/전체 시간 중앙값과 조기 종료 건수를 반환합니다.
+        """
+        with self._lock:
+            metrics = list(self.metrics)
+        return summarize_metrics(metrics)
+
+
+def summarize_metrics(metrics):
+    """
+    요청 지표 목록의 TTFT/전체 시간 중앙값과 조기 종료 건수를 반환합니다.
+    """
+    ttfts = [m["ttft"] for m in metrics if m["ttft"] is not None]
+    return {
+        "requests": len(metrics),
+        "median_ttft": statistics.median(ttfts) if ttfts else None,
+        "median_elapsed": (
+            statistics.median(m["elapsed"] for m in metrics) if metrics else None
+        ),
+        "early_stops": sum(1 for m in metrics if m["early_stop"]),
+    }
@@ -1,14 +1,63 @@
 import pandas as pd
 import requests
-import json
-import re
-from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
-from bs4 import BeautifulSoup, Tag
 from datetime import date
 import concurrent.futures
+import functools
+import threading
 import time
 
+from browser_pool import BrowserPool, wait_for_content
+from chunked_extraction import merge_extractions, split_into_chunks
+from concurrency import AdaptiveConcurrencyController
+from content_reducer import estimate_tokens
+from llm_batch import (
+    BatchStats,
+    build_batch_prompt,
+    make_posting_id,
+    pack_batches,
+    split_batch_response,
+)
+from llm_cache import LLMCache
+from llm_balancer import LLMBalancer
+from near_duplicate import NearDuplicateIndex
+from perf_trace import (
+    STAGE_EXTRACT as TRACE_EXTRACT,
+    STAGE_FETCH,
+    STAGE_QUEUE_WAIT,
+    STAGE_READY_WAIT,
+    PerfTrace,
+    llm_fields,
+)
+from reducer_pool import ReducerPool
+from retry_engine import (
+    FAILURE_EMPTY,
+    FAILURE_FETCH,
+    FAILURE_LLM_TIMEOUT,
+    FAILURE_PARSE,
+    RetryEngine,
+    print_failure_report,
+)
+from rule_extractor import extract_by_rules
+from snapshot_store import SOURCE_BROWSER, SnapshotStore
+from state_store import STAGE_COLLECT, STAGE_EXTRACT, PipelineStateStore
+from static_fetcher import (
+    KEY_SECTION_KEYWORDS,
+    FetchModeStore,
+    StaticFetcher,
+    has_key_sections,
+)
+from structured_output import (
+    EXTRACTION_SCHEMA,
+    PARSE_TRUNCATED,
+    ParseStats,
+    batch_schema,
+    normalize_extraction,
+    parse_llm_json,
+    rejects_response_format,
+    response_format,
+)
+from table_store import excel_path, load_table, save_table, table_path
+
 today = date.today()
 formatted_date = today.strftime("%Y-%m-%d")
 
@@ -16,53 +65,51 @@ formatted_date = today.strftime("%Y-%m-%d")
 # 로컬에서 실행 중인 gpt-oss 모델의 API 엔드포인트 주소를 입력하세요.
 # (예: Ollama, vLLM 등이 제공하는 OpenAI 호환 엔드포인트)
 API_URL = "http://localhost:11434/v1/chat/completions"  # 실제 환경에 맞게 수정하세요.
+# 여러 추론 서버(Ollama, vLLM 등)에 나눠 보낼 때 서버를 추가하세요.
+# weight: 다른 서버 대비 동시 처리 능력 비율, model: 서버마다 모델 이름이 다르면 지정 (없으면 MODEL_NAME)
+LLM_ENDPOINTS = [
+    {"url": API_URL, "weight": 1},
+]
+LLM_HEALTH_CHECK_INTERVAL = 30  # 응답 없는 서버를 다시 확인하는 간격(초)
+LLM_STRUCTURED_OUTPUT = True  # JSON 스키마로 응답 형식을 강제 (서버가 지원하지 않으면 자동으로 끔)
 MODEL_NAME = "gpt-oss"  # 사용 중인 로컬 모델의 이름을 입력하세요.
-MAX_WORKERS = 5  # 병렬로 처리할 스레드 수 (컴퓨터 및 로컬 LLM 서버 사양에 맞게 조절)
+# LLM 동시 요청 수는 지연시간/처리량/오류율을 보고 아래 범위 안에서 자동으로 조절됩니다.
+LLM_INITIAL_CONCURRENCY = 5  # 시작 시 동시 요청 수
+LLM_MIN_CONCURRENCY = 1  # 최소 동시 요청 수
+LLM_MAX_CONCURRENCY = 16  # 최대 동시 요청 수 (LLM 서버의 병렬 처리 슬롯 수보다 약간 크게)
+BROWSER_POOL_SIZE = 3  # HTML 수집에 동시에 사용할 headless Chrome 개수
+BROWSER_PAGE_BUDGET = 50  # 드라이버 하나가 처리할 최대 페이지 수 (초과 시 재시작)
+BROWSER_FAST_PROFILE = True  # 이미지/폰트/CSS/분석 스크립트를 막고 DOMContentLoaded까지만 기다림 (False면 전체 로드)
+STATIC_MAX_CONNECTIONS = 20  # 브라우저 없이 HTTP로 수집할 때의 최대 동시 연결 수
+STATIC_PER_HOST_LIMIT = 4  # 같은 사이트에 동시에 보낼 최대 HTTP 요청 수
+FETCH_MODE_PATH = "cache/fetch_modes.json"  # 도메인별로 통했던 수집 방식(HTTP/브라우저) 기록
+SNAPSHOT_DIR = "cache/snapshots"  # 수집한 원본 HTML을 압축해 보관하는 위치
+SNAPSHOT_RENDER_MAX_AGE = 7 * 24 * 3600  # 정적 HTML이 그대로여도 이보다 오래된 렌더링 결과는 다시 렌더링 (초, None이면 제한 없음)
+NEAR_DUPLICATE_MAX_DISTANCE = 3  # SimHash(64비트) 차이가 이 비트 수 이하이면 같은 공고로 묶음 (None이면 사용 안 함)
+OFFLINE_MODE = False  # True이면 크롤링 없이 보관된 HTML만으로 다시 분석 (정리 로직/프롬프트 변경 후)
+REDUCER_WORKERS = None  # HTML 정리에 쓸 프로세스 수 (None이면 CPU 코어 수)
+TOKEN_BUDGET = 32768  # 정리된 공고 텍스트에서 남길 최대 토큰 수 (추정치, CHUNK_TOKENS를 넘으면 나눠서 추출)
+CHUNK_TOKENS = 4096  # LLM 요청 하나에 넣을 공고 텍스트의 최대 토큰 수 (모델 컨텍스트에서 지시문/응답 몫을 뺀 크기)
+CHUNK_OVERLAP_TOKENS = 256  # 나눈 조각끼리 겹치게 넣을 토큰 수 (경계에서 잘리는 항목 방지)
+RULE_CONFIDENCE_THRESHOLD = 0.8  # 규칙 기반 추출 신뢰도가 이 값 이상이면 LLM을 호출하지 않음
+LLM_BATCH_MODE = False  # True이면 짧은 공고 여러 개를 한 번의 LLM 요청으로 묶어 보냄
+BATCH_TOKEN_BUDGET = 8192  # 배치 요청 하나의 최대 프롬프트 토큰 수 (추정치, 모델 컨텍스트보다 작게)
+BATCH_MAX_POSTINGS = 8  # 배치 요청 하나에 넣을 최대 공고 수
+QUEUE_SIZE = 10  # LLM 처리를 기다리며 쌓아둘 수 있는 최대 페이지 수 (초과 시 수집 일시 정지)
+STATE_DB_PATH = "cache/pipeline_state.sqlite3"  # 공고별 단계 완료 기록 (중단 후 재실행 시 이어서 처리)
+STATE_MAX_AGE = 7 * 24 * 3600  # 이보다 오래된(초) 이전 실행의 수집/추출 결과는 다시 처리 (SNAPSHOT_RENDER_MAX_AGE, 캐시 기간 이하로, None이면 제한 없음)
+EXPORT_EXCEL = True  # 최종 결과를 parquet과 함께 엑셀(.xlsx)로도 저장할지 여부
+RETRY_MAX_ATTEMPTS = 5  # 실패한 공고의 최대 재시도 횟수
+RETRY_BASE_DELAY = 2.0  # 재시도 대기 시간의 기준값(초), 시도마다 2배씩 늘어남 (jitter 적용)
+RETRY_MAX_DELAY = 60.0  # 재시도 대기 시간의 최대값(초)
+TRACE_DIR = "cache/traces"  # 공고별/단계별 소요 시간 기록(JSON-lines)을 남길 위치 (None이면 남기지 않음)
+PROMETHEUS_PATH = None  # 단계별 지표를 Prometheus 텍스트 형식으로 쓸 파일 경로 (예: node_exporter textfile 디렉터리)
+CACHE_PATH = "cache/llm_cache.sqlite3"  # LLM 추출 결과 캐시 파일 경로
+CACHE_MAX_ENTRIES = 10000  # 캐시에 보관할 최대 공고 수
+CACHE_MAX_AGE_DAYS = 30  # 이 기간이 지난 캐시 항목은 다시 추출
 # -----------------------
 
-
-def extract_main_content(html_source):
-    """
-    BeautifulSoup을 사용하여 HTML의 header와 footer 사이의 내용만 추출합니다.
-    """
-    original_soup = BeautifulSoup(html_source, "html.parser")
-
-    header = original_soup.find("header")
-    footer = original_soup.find("footer")
-
-    content_tags = []
-
-    if header:
-        for element in header.next_siblings:
-            if element is footer:
-                break
-            if isinstance(element, Tag):
-                content_tags.append(element)
-    else:
-        body_content = original_soup.find_all("body")
-        if body_content:
-            for element in body_content:
-                if element is not footer:
-                    content_tags.append(element)
-
-    new_soup = BeautifulSoup("<body></body>", "html.parser")
-    body = new_soup.body
-    for tag in content_tags:
-        body.append(tag)
-
-    return new_soup.get_text(separator=" ", strip=True)
-
-
-def call_local_llm(text_content):
-    """
-    로컬 LLM에 정제된 텍스트를 보내 자격요건과 우대사항을 추출합니다.
-    """
-    if not text_content or not text_content.strip():
-        return None
-
-    headers = {"Content-Type": "application/json"}
-
-    prompt = f"""
+PROMPT_TEMPLATE = """
     다음은 채용 공고 페이지의 내용입니다. 이 내용에서 '자격요건'과 '우대사항'을 찾아서 각각 정리하라.
     결과는 반드시 아래와 같은 JSON 형식으로만 응답하라. 만약 내용이 없다면 빈 리스트([])로 응답하라.
 
@@ -84,6 +131,62 @@ def call_local_llm(text_content):
     --- 공고 내용 끝 ---
     """
 
+llm_cache = LLMCache(
+    CACHE_PATH, max_entries=CACHE_MAX_ENTRIES, max_age_days=CACHE_MAX_AGE_DAYS
+)
+llm_client = LLMBalancer(LLM_ENDPOINTS, pool_size=LLM_MAX_CONCURRENCY, timeout=300)
+batch_stats = BatchStats()
+llm_failure = threading.local()
+llm_slot_wait = threading.local()  # 동시 요청 한도 때문에 기다린 시간 (호출한 스레드 기준 누적)
+parse_stats = ParseStats()
+# 긴 공고의 조각들을 동시에 보내는 스레드 (공고 작업자 스레드가 조각을 기다리는 동안 따로 돌아야 함)
+chunk_executor = concurrent.futures.ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY)
+chunk_metrics = threading.local()  # 조각 스레드에서 보낸 LLM 요청 지표 (공고 작업자 스레드 기준)
+structured_output_enabled = LLM_STRUCTURED_OUTPUT
+llm_concurrency = AdaptiveConcurrencyController(
+    initial_limit=LLM_INITIAL_CONCURRENCY,
+    min_limit=LLM_MIN_CONCURRENCY,
+    max_limit=LLM_MAX_CONCURRENCY,
+)
+
+
+def complete_llm_request(data, schema):
+    """
+    스키마 제약 출력(response_format)을 붙여 요청하고 (본문, 완성된 JSON 문자열, 제약 사용 여부)를 반환합니다.
+    서버가 response_format을 거부하면(400/422이고 오류 내용에 response_format/json_schema가 있음)
+    이후로는 끄고, 다른 이유의 400/422이면 이 요청만 제약 없이 다시 보냅니다.
+    """
+    global structured_output_enabled
+    if structured_output_enabled and schema is not None:
+        try:
+            content_str, json_str = llm_client.complete_json(
+                dict(data, response_format=response_format(schema))
+            )
+            return content_str, json_str, True
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code not in (400, 422):
+                raise
+            if rejects_response_format(e.response.text):
+                structured_output_enabled = False
+                print("  -> LLM 서버가 스키마 제약 출력을 지원하지 않아 끄고 다시 요청합니다.")
+            else:
+                print(
+                    f"  -> 스키마 제약 요청이 거부되어(HTTP {e.response.status_code}) "
+                    "이 요청만 제약 없이 다시 보냅니다."
+                )
+    content_str, json_str = llm_client.complete_json(data)
+    return content_str, json_str, False
+
+
+def request_llm_json(prompt, schema=EXTRACTION_SCHEMA, validate=normalize_extraction):
+    """
+    로컬 LLM에 프롬프트를 보내고 응답에서 JSON 객체를 파싱해 반환합니다.
+    서버가 지원하면 schema(JSON 스키마)로 응답 형식을 강제하고, 아니면 코드 블록/설명 문장을 고쳐 읽습니다.
+    읽은 값은 validate로 형식을 확인합니다 (기본은 자격요건/우대사항 목록, None이면 JSON 객체이기만 하면 됨).
+    형식이 다르거나 중간에 잘린 응답이면 None을 반환하고, 실패 종류를 llm_failure.kind에 남깁니다
+    (호출한 스레드 기준). 잘린 응답은 항목이 빠졌을 수 있으므로 캐시/완료 기록 없이 다시 시도하게 합니다.
+    """
+    llm_failure.kind = None
     data = {
         "model": MODEL_NAME,
         "messages": [{"role": "user", "content": prompt}],
@@ -91,139 +194,816 @@ def call_local_llm(text_content):
     }
 
     try:
-        response = requests.post(
-            API_URL, headers=headers, data=json.dumps(data), timeout=300
-        )
-        response.raise_for_status()
-        response_json = response.json()
-        content_str = response_json["choices"][0]["message"]["content"]
-
-        json_match = re.search(
-            r"```json\s*(\{[\s\S]*?\})\s*```", content_str, re.DOTALL
-        )
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            start = content_str.find("{")
-            end = content_str.rfind("}")
-            if start != -1 and end != -1 and start < end:
-                json_str = content_str[start : end + 1]
-            else:
-                json_str = content_str
-
-        parsed_content = json.loads(json_str)
-        return parsed_content
+        wait_start = time.time()
+        llm_concurrency.acquire()
+        request_start = time.time()
+        waited = request_start - wait_start
+        llm_slot_wait.seconds = getattr(llm_slot_wait, "seconds", 0.0) + waited
+        success = False
+        try:
+            content_str, json_str, constrained = complete_llm_request(data, schema)
+            success = True
+        finally:
+            # 타임아웃/HTTP 오류는 서버 과부하 신호이므로 동시 요청 수를 줄이는 데 사용
+            llm_concurrency.release(time.time() - request_start, success=success)
     except requests.exceptions.RequestException as e:
         print(f"  -> LLM API 호출 오류: {e}")
+        llm_failure.kind = FAILURE_LLM_TIMEOUT
         return None
-    except (json.JSONDecodeError, KeyError, IndexError) as e:
-        print(f"  -> LLM 응답 파싱 오류: {e}")
+
+    # 스트리밍 중 JSON 객체가 완성되었으면 그대로, 아니면 응답 전체에서 찾아 고쳐 읽음
+    parsed_content, outcome = parse_llm_json(content_str, json_str, validate)
+    parse_stats.record(outcome, constrained)
+    if outcome == PARSE_TRUNCATED:
+        print("  -> LLM 응답이 중간에 잘려 있어 실패로 처리합니다.")
+        llm_failure.kind = FAILURE_PARSE
+        return None
+    if parsed_content is None:
+        print("  -> LLM 응답 파싱 오류: 형식에 맞는 JSON 객체를 찾을 수 없음")
         print(f"  -> 받은 내용: {content_str[:300]}")
+        llm_failure.kind = FAILURE_PARSE
         return None
+    return parsed_content
 
 
-def main():
-    start_time = time.time()
+def call_local_llm(text_content):
+    """
+    로컬 LLM에 정제된 텍스트를 보내 자격요건과 우대사항을 추출합니다.
+    """
+    if not text_content or not text_content.strip():
+        return None
 
-    today = date.today()
-    formatted_date = today.strftime("%Y-%m-%d")
+    return request_llm_json(PROMPT_TEMPLATE.format(text_content=text_content))
 
-    input_filename = f"sheets/list_with_applyLink_{formatted_date}.xlsx"
 
-    try:
-        df = pd.read_excel(input_filename)
-    except FileNotFoundError:
-        print(f"'{input_filename}' 파일을 찾을 수 없습니다.")
+def call_local_llm_batch(items):
+    """
+    여러 공고 [(공고 ID, 텍스트), ...]를 한 번의 요청으로 보내고,
+    ({공고 ID: 추출 결과}, 응답에서 빠진 공고 ID 목록)을 반환합니다.
+    """
+    posting_ids = [posting_id for posting_id, _ in items]
+    # 공고별 형식은 split_batch_response에서 확인함
+    parsed = request_llm_json(
+        build_batch_prompt(items), schema=batch_schema(posting_ids), validate=None
+    )
+    if parsed is None:
+        return {}, posting_ids
+    return split_batch_response(parsed, posting_ids)
+
+
+def extract_without_llm(text_content):
+    """
+    규칙 기반 추출 → 캐시 순서로 시도해 (추출 결과, 처리 경로)를 반환합니다.
+    둘 다 실패하면 None을 반환하며, 이 경우 LLM을 호출해야 합니다.
+    """
+    rule_info, confidence = extract_by_rules(text_content)
+    if confidence >= RULE_CONFIDENCE_THRESHOLD:
+        return rule_info, "규칙"
+
+    # 동일한 공고/프롬프트/모델 조합이면 LLM을 호출하지 않고 캐시된 결과를 사용
+    # (형식 확인 전에 저장된 잘못된 결과는 쓰지 않음)
+    cached = normalize_extraction(
+        llm_cache.get(LLMCache.make_key(text_content, PROMPT_TEMPLATE, MODEL_NAME))
+    )
+    if cached is not None:
+        return cached, "캐시"
+    return None
+
+
+def call_local_llm_chunk(chunk):
+    """
+    조각 하나를 추출하고 (추출 결과, 실패 종류, LLM 요청 지표, 슬롯 대기 시간)을 반환합니다.
+    실패 종류와 지표는 조각을 처리한 스레드에 남으므로 공고 작업자 스레드로 함께 돌려줍니다.
+    """
+    llm_failure.kind = None
+    llm_slot_wait.seconds = 0.0
+    llm_client.take_thread_metrics()
+    extracted_info = call_local_llm(chunk)
+    return (
+        extracted_info,
+        getattr(llm_failure, "kind", None) or FAILURE_PARSE,
+        llm_client.take_thread_metrics(),
+        llm_slot_wait.seconds,
+    )
+
+
+def call_local_llm_chunked(text_content):
+    """
+    CHUNK_TOKENS보다 긴 공고를 겹치는 조각으로 나눠 동시에 추출하고 결과를 합칩니다 (map-reduce).
+    동시 요청 수는 다른 LLM 요청과 같이 llm_concurrency가 제한합니다.
+    한 조각이라도 실패하면 불완전한 결과를 캐시하지 않도록 None을 반환하고
+    실패 종류를 llm_failure.kind에 남깁니다.
+    """
+    chunks = split_into_chunks(text_content, CHUNK_TOKENS, CHUNK_OVERLAP_TOKENS)
+    results = list(chunk_executor.map(call_local_llm_chunk, chunks))
+    # 조각들은 동시에 보내므로 슬롯 대기는 가장 오래 기다린 조각 기준
+    llm_slot_wait.seconds = getattr(llm_slot_wait, "seconds", 0.0) + max(
+        slot_wait for *_, slot_wait in results
+    )
+    chunk_metrics.entries = getattr(chunk_metrics, "entries", []) + [
+        entry for _, _, metrics, _ in results for entry in metrics
+    ]
+    for extracted_info, kind, _, _ in results:
+        if not extracted_info:
+            llm_failure.kind = kind
+            return None
+    return merge_extractions([result[0] for result in results])
+
+
+def take_llm_metrics():
+    """
+    이 스레드에서 지난 호출 이후 보낸 LLM 요청(나눠 보낸 조각 포함)의 지표를 반환하고 비웁니다.
+    """
+    metrics = llm_client.take_thread_metrics() + getattr(chunk_metrics, "entries", [])
+    chunk_metrics.entries = []
+    return metrics
+
+
+def extract_with_llm(text_content, path="LLM"):
+    """
+    LLM으로 추출해 성공하면 (추출 결과, 처리 경로)를, 실패하면 (None, 실패 종류)를 반환합니다.
+    """
+    llm_failure.kind = None
+    if estimate_tokens(text_content) > CHUNK_TOKENS:
+        extracted_info = call_local_llm_chunked(text_content)
+        path = f"{path}(분할)"
+    else:
+        extracted_info = call_local_llm(text_content)
+    if not extracted_info:
+        return None, getattr(llm_failure, "kind", None) or FAILURE_PARSE
+    llm_cache.set(
+        LLMCache.make_key(text_content, PROMPT_TEMPLATE, MODEL_NAME), extracted_info
+    )
+    return extracted_info, path
+
+
+def extract_job_info(text_content):
+    """
+    규칙 기반 추출 → 캐시 → LLM 순서로 자격요건/우대사항을 추출하고,
+    (추출 결과, 처리 경로)를 반환합니다. 처리 경로는 "규칙", "캐시", "LLM" 중 하나입니다.
+    LLM 추출에 실패하면 (None, 실패 종류)를 반환합니다.
+    """
+    return extract_without_llm(text_content) or extract_with_llm(text_content)
+
+
+def extract_job_info_batch(items):
+    """
+    [(공고 ID, 텍스트), ...]를 한 번의 배치 요청으로 추출하고 {공고 ID: (추출 결과, 처리 경로)}를 반환합니다.
+    배치 응답에서 빠진 공고는 단독 요청으로 다시 추출합니다.
+    """
+    request_start = time.time()
+    extracted, missing = call_local_llm_batch(items)
+    batch_stats.record(len(items), time.time() - request_start)
+
+    texts = dict(items)
+    results = {}
+    for posting_id, extracted_info in extracted.items():
+        llm_cache.set(
+            LLMCache.make_key(texts[posting_id], PROMPT_TEMPLATE, MODEL_NAME),
+            extracted_info,
+        )
+        results[posting_id] = (extracted_info, "LLM(배치)")
+    for posting_id in missing:
+        request_start = time.time()
+        results[posting_id] = extract_with_llm(texts[posting_id], path="LLM(단독 재요청)")
+        batch_stats.record(1, time.time() - request_start)
+    return results
+
+
+def stored_job_data(apply_link, output, path=None):
+    """
+    상태 저장소에 저장된 추출 결과({"info": ..., "path": ...})를 결과 시트의 한 행으로 변환합니다.
+    형식이 맞지 않으면(형식 확인 전에 저장된 결과 등) None을 반환하며, 이때는 다시 추출해야 합니다.
+    """
+    info = normalize_extraction(output.get("info")) if isinstance(output, dict) else None
+    if info is None:
+        return None
+    return to_job_data(apply_link, info, path or output.get("path"))
+
+
+def to_job_data(apply_link, extracted_info, path):
+    """
+    추출 결과를 결과 시트의 한 행(딕셔너리)으로 변환합니다.
+    """
+    job_data = {
+        "지원 링크": apply_link,
+        "자격요건": "추출 실패",
+        "우대사항": "추출 실패",
+        "추출 경로": path,
+    }
+    if extracted_info:
+        job_data["자격요건"] = "\n".join(extracted_info.get("자격요건", []))
+        job_data["우대사항"] = "\n".join(extracted_info.get("우대사항", []))
+    return job_data
+
+
+def collect_page_html(driver, apply_link, trace=None, profile=None):
+    """
+    브라우저 풀의 드라이버로 지원 페이지를 열고 렌더링된 HTML을 반환합니다.
+    (HTML 정리는 수집 스레드를 막지 않도록 ReducerPool에서 따로 진행)
+    자격요건/우대사항 제목이 화면에 나오거나 페이지 로드가 끝나면 바로 HTML을 가져옵니다.
+    trace(PerfTrace)를 주면 페이지 로딩 시간과 본문 대기 시간을 profile(BrowserPool.profile_name)과 함께
+    기록합니다.
+    """
+    start = time.time()
+    driver.get(apply_link)
+    loaded = time.time()
+    wait_for_content(driver, KEY_SECTION_KEYWORDS, timeout=10)
+    if trace is not None:
+        trace.record(apply_link, STAGE_FETCH, loaded - start, mode="browser", profile=profile)
+        trace.record(apply_link, STAGE_READY_WAIT, time.time() - loaded, profile=profile)
+    return driver.page_source
+
+
+def archive_rendered(snapshots, pages):
+    """
+    브라우저 풀의 (링크, html, 오류) 출력을 그대로 넘기면서 렌더링된 HTML을 보관합니다.
+    """
+    for apply_link, html, error in pages:
+        if html is not None:
+            snapshots.put(apply_link, html, SOURCE_BROWSER)
+        yield apply_link, html, error
+
+
+def archived_pages(snapshots, links):
+    """
+    보관된 HTML(렌더링 결과 우선)을 수집기와 같은 (링크, html, 오류) 형태로 꺼냅니다.
+    """
+    for apply_link in links:
+        html = snapshots.get(apply_link)
+        if html is None:
+            yield apply_link, None, LookupError("보관된 HTML 없음")
+        else:
+            yield apply_link, html, None
+
+
+def print_reduction(stats):
+    print(
+        f"    -> 텍스트 축약: {stats['original_chars']:,}자 → {stats['reduced_chars']:,}자 "
+        f"(약 {stats['estimated_tokens']:,}토큰, {stats['compression_ratio']:.1f}배 압축, "
+        f"섹션: {', '.join(stats['sections']) or '없음'})"
+    )
+
+
+def print_parse_report():
+    report = parse_stats.report()
+    if not report["requests"]:
         return
+    print(
+        f"  -> LLM 응답 {report['requests']}건: 바로 읽음 {report['strict']}건, "
+        f"고쳐 읽음 {report['repaired']}건 (재요청 절약), 잘림 {report['truncated']}건, "
+        f"실패 {report['failed']}건 "
+        f"→ 첫 시도 성공률 {report['success_rate']:.1%} "
+        f"(스키마 제약 출력 {report['constrained']}건)"
+    )
 
-    # 1. 모든 링크에서 HTML 컨텐츠 수집
-    print("--- 1. HTML 컨텐츠 수집 시작 ---")
-    driver = webdriver.Chrome()
-    pages_to_process = []
-    for index, row in df.iterrows():
-        apply_link = row["지원 링크"]
-        print(f"  - 수집 중 ({index + 1}/{len(df)}): {apply_link}")
 
-        page_info = {"지원 링크": apply_link, "text": None}
-        try:
-            driver.get(apply_link)
-            WebDriverWait(driver, 10).until(
-                lambda d: d.execute_script("return document.readyState === 'complete'")
-            )
-            main_text = extract_main_content(driver.page_source)
-            if main_text and main_text.strip():
-                page_info["text"] = main_text
-            else:
-                print("    -> 내용 없음.")
-        except Exception as e:
-            print(f"    -> 오류 발생: {type(e).__name__} - {e}")
-        pages_to_process.append(page_info)
-    driver.quit()
-    print("--- HTML 컨텐츠 수집 완료 ---")
-
-    # 2. LLM 병렬 호출로 정보 추출
-    print(f"--- 2. LLM 병렬 호출 시작 (Worker: {MAX_WORKERS}개) ---")
-    results = []
+def is_failed_row(result_df):
+    """
+    자격요건 또는 우대사항이 실패로 표시되었거나, 둘 다 비어 있는 행을 True로 표시한 Series를 반환합니다.
+    (우대사항 섹션이 없는 공고가 많으므로 한쪽만 빈 행은 실패로 보지 않음)
+    """
+    failure_markers = ["추출 실패", "HTML 수집 실패 또는 내용 없음"]
+
+    def is_empty(column):
+        return result_df[column].isnull() | (result_df[column] == "")
+
+    return (
+        result_df["자격요건"].isin(failure_markers)
+        | result_df["우대사항"].isin(failure_markers)
+        | (is_empty("자격요건") & is_empty("우대사항"))
+    )
+
 
-    processable_pages = [p for p in pages_to_process if p["text"]]
+def retry_failed_postings(result_df, max_attempts=RETRY_MAX_ATTEMPTS):
+    """
+    결과 시트에서 실패한 공고만 실패한 단계부터 다시 시도하고, 갱신된 결과 시트를 반환합니다.
+
+    본문이 이미 저장된 공고는 다시 크롤링하지 않고 LLM 단계만 재시도합니다.
+    """
+    failed_links = list(result_df.loc[is_failed_row(result_df), "지원 링크"])
+    if not failed_links:
+        print("재시도할 공고가 없습니다.")
+        return result_df
+
+    state = PipelineStateStore(STATE_DB_PATH)
+    pool = BrowserPool(
+        size=BROWSER_POOL_SIZE,
+        page_budget=BROWSER_PAGE_BUDGET,
+        fast_profile=BROWSER_FAST_PROFILE,
+    )
+    reducer = ReducerPool(workers=REDUCER_WORKERS, token_budget=TOKEN_BUDGET)
+    snapshots = SnapshotStore(SNAPSHOT_DIR)
+
+    def collect_many(links):
+        pages = archive_rendered(
+            snapshots, pool.imap_unordered(collect_page_html, links)
+        )
+        for apply_link, reduced, error in reducer.imap_unordered(pages):
+            if error is not None:
+                yield apply_link, None, FAILURE_FETCH
+            elif not reduced[0].strip():
+                yield apply_link, None, FAILURE_EMPTY
+            else:
+                yield apply_link, reduced[0], None
+
+    engine = RetryEngine(
+        state,
+        collect_many,
+        extract_job_info,
+        max_attempts=max_attempts,
+        base_delay=RETRY_BASE_DELAY,
+        max_delay=RETRY_MAX_DELAY,
+        workers=LLM_MAX_CONCURRENCY,
+        max_age=STATE_MAX_AGE,
+    )
+    recovered, report = engine.run(failed_links)
+    reducer.close()
+    snapshots.close()
+    print_failure_report(report)
+    print_parse_report()
+
+    # 이전 실행에서 이미 추출된 공고도 함께 반영
+    extracted = state.get_many(failed_links, STAGE_EXTRACT, max_age=STATE_MAX_AGE)
+    state.close()
+
+    # 지원 링크 → 새 행을 dict로 만들어 한 번에 반영 (행마다 전체를 검색하지 않음)
+    rows = {}
+    for apply_link, output in extracted.items():
+        row = stored_job_data(apply_link, output)
+        if row is not None:
+            rows[apply_link] = row
+    updated = result_df["지원 링크"].map(rows)
+    has_update = updated.notna()
+    for column in ("자격요건", "우대사항", "추출 경로"):
+        if column in result_df.columns:
+            result_df.loc[has_update, column] = updated[has_update].map(
+                lambda row: row[column]
+            )
+    print(f"재시도로 복구한 공고: {len(recovered)}건")
+    return result_df
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_page = {
-            executor.submit(call_local_llm, page["text"]): page
-            for page in processable_pages
-        }
 
-        total_pages = len(future_to_page)
-        print(f"  -> LLM에 정보 추출 요청... (총 {total_pages}개)")
+def main(df=None):
+    """
+    오늘 날짜의 list_with_applyLink 시트(또는 df)의 공고를 수집/추출해 결과 시트를 저장하고,
+    원본과 병합한 결과 DataFrame을 반환합니다. 공고별 단계 결과는 상태 저장소에 기록되므로
+    반환된 결과로 retry_failed_postings를 부르면 실패한 단계부터만 다시 시도합니다.
+    """
+    start_time = time.time()
 
-        for i, future in enumerate(concurrent.futures.as_completed(future_to_page)):
-            page = future_to_page[future]
-            apply_link = page["지원 링크"]
-            print(f"  - 처리 완료 ({i + 1}/{total_pages}): {apply_link}")
+    today = date.today()
+    formatted_date = today.strftime("%Y-%m-%d")
 
-            job_data = {
-                "지원 링크": apply_link,
-                "자격요건": "추출 실패",
-                "우대사항": "추출 실패",
-            }
+    input_name = f"list_with_applyLink_{formatted_date}"
 
+    if df is None:
+        try:
+            df = load_table(input_name)
+        except FileNotFoundError:
+            print(f"'{table_path(input_name)}' 파일을 찾을 수 없습니다.")
+            return None
+
+    # 1. HTML 수집과 LLM 호출을 동시에 진행
+    # 수집된 페이지는 즉시 LLM 작업자에게 전달되고, 대기 중인 작업이 가득 차면
+    # 수집을 잠시 멈춰(backpressure) 크롤링이 LLM보다 지나치게 앞서 나가지 않도록 합니다.
+    print(
+        f"--- 1. HTML 수집 및 LLM 병렬 호출 시작 "
+        f"(동시 요청: {LLM_MIN_CONCURRENCY}~{LLM_MAX_CONCURRENCY}개 자동 조절, "
+        f"대기열: {QUEUE_SIZE}개) ---"
+    )
+    if len(llm_client.endpoints) > 1:
+        # 응답하지 않는 추론 서버는 처음부터 빼고, 실행 중에도 주기적으로 다시 확인
+        for url, healthy in llm_client.check_health().items():
+            print(f"  -> LLM 서버 {url}: {'정상' if healthy else '응답 없음 (일시 제외)'}")
+        llm_client.start_health_checks(LLM_HEALTH_CHECK_INTERVAL)
+    results = []
+    in_flight = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY + QUEUE_SIZE)
+    future_to_page = {}
+
+    # 공고별 단계 소요 시간 (수집/readyState 대기/정리/LLM 대기열/추출)
+    trace = PerfTrace(
+        f"{TRACE_DIR}/trace_{time.strftime('%Y%m%d_%H%M%S')}.jsonl" if TRACE_DIR else None
+    )
+    pool = BrowserPool(
+        size=BROWSER_POOL_SIZE,
+        page_budget=BROWSER_PAGE_BUDGET,
+        fast_profile=BROWSER_FAST_PROFILE,
+    )
+    snapshots = SnapshotStore(SNAPSHOT_DIR)
+    fetcher = StaticFetcher(
+        max_connections=STATIC_MAX_CONNECTIONS,
+        per_host_limit=STATIC_PER_HOST_LIMIT,
+        snapshots=snapshots,
+        trace=trace,
+    )
+    fetch_modes = FetchModeStore(FETCH_MODE_PATH)
+    reducer = ReducerPool(workers=REDUCER_WORKERS, token_budget=TOKEN_BUDGET, trace=trace)
+
+    # 이전 실행에서 추출까지 끝난 공고는 저장된 결과를 그대로 사용하고,
+    # 수집까지만 끝난 공고는 다시 크롤링하지 않고 LLM 단계부터 진행
+    state = PipelineStateStore(STATE_DB_PATH)
+    all_links = list(dict.fromkeys(df["지원 링크"]))
+    if OFFLINE_MODE:
+        # 보관된 HTML로 처음부터 다시 분석하므로 이전 실행의 결과는 쓰지 않음
+        extracted_before, collected_before = {}, {}
+    else:
+        # 결과 시트의 행으로 바꿀 수 없는 결과는 쓰지 않고 추출부터 다시 함
+        extracted_before = {}
+        for apply_link, output in state.get_many(
+            all_links, STAGE_EXTRACT, max_age=STATE_MAX_AGE
+        ).items():
+            row = stored_job_data(apply_link, output, "이전 실행")
+            if row is not None:
+                extracted_before[apply_link] = row
+        collected_before = state.get_many(
+            [link for link in all_links if link not in extracted_before],
+            STAGE_COLLECT,
+            max_age=STATE_MAX_AGE,
+        )
+    results.extend(extracted_before.values())
+    print(
+        f"  -> 이전 실행 결과 사용: 추출 완료 {len(extracted_before)}건, "
+        f"수집 완료 {len(collected_before)}건"
+    )
+
+    # 이전 실행에서 정적 수집이 통하지 않았던 도메인은 바로 브라우저로 보냄.
+    # 단, 렌더링 결과가 보관된 페이지는 조건부 HTTP 요청으로 바뀌었는지부터 확인
+    apply_links = [
+        link
+        for link in all_links
+        if link not in extracted_before and link not in collected_before
+    ]
+    if OFFLINE_MODE:
+        static_links = []
+    else:
+        static_links = [
+            link
+            for link in apply_links
+            if fetch_modes.get(link) != "browser"
+            or snapshots.latest(link, SOURCE_BROWSER) is not None
+        ]
+    tried_static = set(static_links)
+    browser_links = [link for link in apply_links if link not in tried_static]
+    static_ok = set()
+    reused_renders = 0
+
+    # 거의 같은 공고는 대표 하나만 LLM에 보내고 결과를 나눠 씀 {대표 공고 ID: [지원 링크]}
+    near_duplicates = (
+        NearDuplicateIndex(max_distance=NEAR_DUPLICATE_MAX_DISTANCE)
+        if NEAR_DUPLICATE_MAX_DISTANCE is not None
+        else None
+    )
+    duplicate_links = {}
+    # 추출이 끝난 공고 {공고 ID: (추출 정보, 경로)} (늦게 들어온 유사 공고에 결과를 바로 나눠 주기 위함)
+    finished_postings = {}
+    finished_tasks = 0
+    results_lock = threading.Lock()
+    collected = 0
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) as executor:
+
+        # 배치 모드에서 LLM 요청을 기다리는 공고 {공고 ID: 텍스트}와 공고 ID별 지원 링크
+        pending_batch = {}
+        batch_links = {}
+
+        def traced(task, links_by_id):
+            # 대기열에서 기다린 시간과 추출 시간, 이 작업이 보낸 LLM 요청의 토큰 정보를 공고마다 기록
+            queued_at = time.time()
+            postings = sum(len(links) for links in links_by_id.values())
+
+            def run():
+                started = time.time()
+                take_llm_metrics()
+                llm_slot_wait.seconds = 0.0
+                extracted = {}
+                try:
+                    extracted = task()
+                    return extracted
+                finally:
+                    # 작업자를 기다린 시간 + LLM 동시 요청 슬롯을 기다린 시간은 대기열 시간으로 봄
+                    slot_wait = llm_slot_wait.seconds
+                    elapsed = time.time() - started - slot_wait
+                    fields = llm_fields(take_llm_metrics(), postings)
+                    for posting_id, links in links_by_id.items():
+                        path = extracted.get(posting_id, (None, None))[1]
+                        for apply_link in links:
+                            trace.record(
+                                apply_link,
+                                STAGE_QUEUE_WAIT,
+                                started - queued_at + slot_wait,
+                                slot_wait=slot_wait,
+                            )
+                            trace.record(
+                                apply_link, TRACE_EXTRACT, elapsed, path=path, **fields
+                            )
+
+            return run
+
+        def submit(task, links_by_id):
+            in_flight.acquire()
+            future = executor.submit(traced(task, links_by_id))
+            future.add_done_callback(lambda _: in_flight.release())
+            future_to_page[future] = links_by_id
+            # 수집이 끝나기를 기다리지 않고 추출이 끝나는 즉시 상태 저장소에 기록
+            future.add_done_callback(finish_extraction)
+
+        def flush_batches(final=False):
+            batches = pack_batches(
+                list(pending_batch.items()), BATCH_TOKEN_BUDGET, BATCH_MAX_POSTINGS
+            )
+            # 마지막 배치는 더 채울 수 있으므로 수집이 끝날 때까지 남겨둠
+            ready = batches if final else batches[:-1]
+            for batch in ready:
+                links_by_id = {pid: batch_links.pop(pid) for pid, _ in batch}
+                for pid, _ in batch:
+                    del pending_batch[pid]
+                submit(lambda batch=batch: extract_job_info_batch(batch), links_by_id)
+
+        def record_result(apply_link, extracted_info, path):
+            # 결과 시트의 행을 먼저 만들어, 행으로 바꿀 수 없는 결과가 완료로 기록되지 않게 함
+            if extracted_info:
+                extracted_info = normalize_extraction(extracted_info)
+                if extracted_info is None:
+                    path = FAILURE_PARSE
+            row = to_job_data(apply_link, extracted_info, path)
+            if extracted_info:
+                state.mark_done(
+                    apply_link, STAGE_EXTRACT, {"info": extracted_info, "path": path}
+                )
+            else:
+                # 실패한 경우 path에는 실패 종류가 들어있음
+                state.mark_failed(apply_link, STAGE_EXTRACT, path, kind=path)
+            with results_lock:
+                results.append(row)
+
+        def record_duplicate(apply_link, extracted_info, path):
+            # 거의 같은 공고에게 대표 공고의 결과를 그대로 전달
+            print(f"  - 처리 완료 (유사 공고): {apply_link}")
+            record_result(apply_link, extracted_info, "유사 공고" if extracted_info else path)
+
+        def finish_extraction(future):
+            # 작업 스레드에서 불림 (이미 끝난 작업이면 submit을 부른 스레드에서 불림)
+            # 콜백에서 난 예외는 concurrent.futures가 로그만 남기고 삼키므로,
+            # 기록하지 못한 공고는 실패로 남겨 결과 시트와 상태 저장소에서 빠지지 않게 함
+            links_by_id = future_to_page[future]
+            recorded = set()
             try:
-                extracted_info = future.result()
-                if extracted_info:
-                    job_data["자격요건"] = "\n".join(extracted_info.get("자격요건", []))
-                    job_data["우대사항"] = "\n".join(extracted_info.get("우대사항", []))
+                record_extraction(future, links_by_id, recorded)
+            except Exception as e:
+                print(f"    -> 추출 결과 기록 중 오류: {type(e).__name__} - {e}")
+                for posting_id, links in links_by_id.items():
+                    with results_lock:
+                        finished_postings.setdefault(posting_id, (None, FAILURE_PARSE))
+                        duplicates = duplicate_links.pop(posting_id, [])
+                    for apply_link in [*links, *duplicates]:
+                        if apply_link not in recorded:
+                            record_result(apply_link, None, FAILURE_PARSE)
+
+        def record_extraction(future, links_by_id, recorded):
+            nonlocal finished_tasks
+            try:
+                extracted = future.result()
             except Exception as e:
                 print(f"    -> 병렬 처리 중 오류: {type(e).__name__} - {e}")
+                extracted = {}
+
+            with results_lock:
+                finished_tasks += 1
+                done = finished_tasks
+            for posting_id, links in links_by_id.items():
+                extracted_info, path = extracted.get(posting_id, (None, None))
+                for apply_link in links:
+                    print(f"  - 처리 완료 ({done}/{len(future_to_page)}): {apply_link}")
+                    record_result(apply_link, extracted_info, path)
+                    recorded.add(apply_link)
+                with results_lock:
+                    finished_postings[posting_id] = extracted_info, path
+                    duplicates = duplicate_links.pop(posting_id, [])
+                for apply_link in duplicates:
+                    record_duplicate(apply_link, extracted_info, path)
+                    recorded.add(apply_link)
+
+        def is_near_duplicate(apply_link, posting_id, main_text):
+            # 이미 보낸 공고와 거의 같은 텍스트이면 대표 공고의 결과를 나눠 받도록 등록만 함
+            if near_duplicates is None:
+                return False
+            representative = near_duplicates.representative(posting_id, main_text)
+            if representative is None:
+                return False
+            with results_lock:
+                finished = finished_postings.get(representative)
+                if finished is None:
+                    duplicate_links.setdefault(representative, []).append(apply_link)
+            if finished is not None:
+                # 대표 공고의 추출이 이미 끝났으면 바로 기록
+                record_duplicate(apply_link, *finished)
+            return True
+
+        def submit_to_llm(apply_link, main_text):
+            posting_id = make_posting_id(main_text)
+            if not LLM_BATCH_MODE:
+                if is_near_duplicate(apply_link, posting_id, main_text):
+                    return
+                submit(
+                    lambda: {posting_id: extract_job_info(main_text)},
+                    {posting_id: [apply_link]},
+                )
+                return
+
+            # 규칙/캐시로 처리되는 공고는 배치에 넣지 않고 바로 결과에 기록
+            resolved = extract_without_llm(main_text)
+            if resolved is not None:
+                record_result(apply_link, *resolved)
+                return
+            if is_near_duplicate(apply_link, posting_id, main_text):
+                return
+            if estimate_tokens(main_text) > CHUNK_TOKENS:
+                # 조각으로 나눠야 하는 긴 공고는 배치에 넣지 않고 따로 보냄
+                submit(
+                    lambda: {posting_id: extract_with_llm(main_text)},
+                    {posting_id: [apply_link]},
+                )
+                return
+            pending_batch[posting_id] = main_text
+            batch_links.setdefault(posting_id, []).append(apply_link)
+            flush_batches()
+
+        for apply_link, main_text in collected_before.items():
+            submit_to_llm(apply_link, main_text)
+
+        # 1-1. 브라우저 없이 HTTP로 먼저 시도
+        for apply_link, reduced, error in reducer.imap_unordered(
+            fetcher.imap_unordered(static_links)
+        ):
+            main_text, stats = reduced or (None, None)
+            if error is None:
+                static_ok.add(apply_link)
+            if error is None and has_key_sections(main_text):
+                collected += 1
+                print(f"  - 수집 완료 ({collected}/{len(df)}, HTTP): {apply_link}")
+                print_reduction(stats)
+                fetch_modes.record(apply_link, "static")
+                state.mark_done(apply_link, STAGE_COLLECT, main_text)
+                submit_to_llm(apply_link, main_text)
+            else:
+                # 정적 HTML로는 부족한 페이지만 브라우저로 다시 수집
+                browser_links.append(apply_link)
+
+        # 1-2. 나머지는 브라우저 풀로 수집
+        # 이번 실행에서 받은 정적 HTML이 렌더링 이후 바뀌지 않았다면(304 또는 같은 내용)
+        # 보관된 렌더링 결과를 그대로 쓰고 브라우저로 다시 열지 않음
+        def browser_pages():
+            nonlocal reused_renders
+            to_render = []
+            for apply_link in browser_links:
+                html = (
+                    snapshots.rendered_if_unchanged(apply_link, SNAPSHOT_RENDER_MAX_AGE)
+                    if apply_link in static_ok
+                    else None
+                )
+                if html is None:
+                    to_render.append(apply_link)
+                    continue
+                reused_renders += 1
+                yield apply_link, html, None
+            yield from archive_rendered(
+                snapshots,
+                pool.imap_unordered(
+                    functools.partial(
+                        collect_page_html, trace=trace, profile=pool.profile_name
+                    ),
+                    to_render,
+                ),
+            )
 
-            results.append(job_data)
-
-    # HTML 수집에 실패했거나 내용이 없던 페이지들 처리
-    failed_pages = [p for p in pages_to_process if not p["text"]]
-    for page in failed_pages:
-        results.append(
-            {
-                "지원 링크": page["지원 링크"],
-                "자격요건": "HTML 수집 실패 또는 내용 없음",
-                "우대사항": "HTML 수집 실패 또는 내용 없음",
-            }
-        )
+        if OFFLINE_MODE:
+            pages, source_label = archived_pages(snapshots, browser_links), "보관본"
+        else:
+            pages, source_label = browser_pages(), "브라우저"
+        for apply_link, reduced, error in reducer.imap_unordered(pages):
+            collected += 1
+            print(f"  - 수집 완료 ({collected}/{len(df)}, {source_label}): {apply_link}")
+
+            main_text = None
+            if error is not None:
+                print(f"    -> 오류 발생: {type(error).__name__} - {error}")
+            else:
+                main_text, stats = reduced
+                print_reduction(stats)
+                if not main_text.strip():
+                    print("    -> 내용 없음.")
+                    main_text = None
+
+            if not main_text:
+                # HTML 수집에 실패했거나 내용이 없던 페이지
+                kind = FAILURE_FETCH if error is not None else FAILURE_EMPTY
+                state.mark_failed(apply_link, STAGE_COLLECT, error or kind, kind=kind)
+                results.append(
+                    {
+                        "지원 링크": apply_link,
+                        "자격요건": "HTML 수집 실패 또는 내용 없음",
+                        "우대사항": "HTML 수집 실패 또는 내용 없음",
+                        "추출 경로": kind,
+                    }
+                )
+                continue
+
+            if apply_link in tried_static:
+                fetch_modes.record(apply_link, "browser")
+            state.mark_done(apply_link, STAGE_COLLECT, main_text)
+            submit_to_llm(apply_link, main_text)
+        if LLM_BATCH_MODE:
+            flush_batches(final=True)
+        fetch_modes.save()
+        reducer.close()
+        snapshots.close()
+        print("--- HTML 컨텐츠 수집 완료 ---")
+        if not OFFLINE_MODE:
+            print(
+                f"  -> 변경 없음(304) {len(fetcher.not_modified)}건, "
+                f"보관된 렌더링 결과 재사용 {reused_renders}건"
+            )
+        # 남은 추출 작업은 executor를 닫을 때 기다리며, 결과는 finish_extraction이 기록함
 
     print("--- LLM 병렬 호출 완료 ---")
+    path_counts = pd.Series([r.get("추출 경로") for r in results]).value_counts()
+    print(
+        "  -> 처리 경로: "
+        + ", ".join(f"{path} {count}건" for path, count in path_counts.items())
+    )
+    skipped = sum(
+        path_counts.get(path, 0) for path in ("규칙", "캐시", "이전 실행", "유사 공고")
+    )
+    print(f"  -> LLM 호출 생략: {skipped}건 / {path_counts.sum()}건")
+    if near_duplicates is not None and near_duplicates.duplicates:
+        print(
+            f"  -> 유사 공고 묶음: 공고 {near_duplicates.groups + near_duplicates.duplicates}건 → "
+            f"대표 {near_duplicates.groups}건 (LLM 호출 {near_duplicates.duplicates}건 절약)"
+        )
+    for size, batches, per_posting, speedup in batch_stats.report():
+        speedup_text = f", 단일 요청 대비 {speedup:.1f}배" if speedup else ""
+        print(
+            f"  -> 배치 크기 {size}: {batches}회, 공고당 {per_posting:.1f}초{speedup_text}"
+        )
+    print(f"  -> 최종 LLM 동시 요청 수: {llm_concurrency.limit}")
+    client_stats = llm_client.summary()
+    if client_stats["requests"]:
+        median_ttft = client_stats["median_ttft"]
+        ttft_text = f"{median_ttft:.1f}초" if median_ttft is not None else "측정 불가"
+        print(
+            f"  -> LLM 요청 {client_stats['requests']}건: 첫 토큰 중앙값 {ttft_text}, "
+            f"전체 중앙값 {client_stats['median_elapsed']:.1f}초, "
+            f"JSON 완성 후 조기 종료 {client_stats['early_stops']}건"
+        )
+    if len(llm_client.endpoints) > 1:
+        for url, requests_sent, errors, healthy in llm_client.endpoint_summary():
+            print(
+                f"  -> LLM 서버 {url}: 요청 {requests_sent}건, 오류 {errors}건"
+                f"{'' if healthy else ' (현재 제외됨)'}"
+            )
+        print(f"  -> 다른 서버로 옮겨 다시 보낸 요청: {llm_client.failovers}건")
+    llm_client.close()
+    print_parse_report()
+    cache_stats = llm_cache.stats()
+    print(
+        f"  -> 캐시 적중 {cache_stats['hits']}건 / 미적중 {cache_stats['misses']}건 "
+        f"(적중률 {cache_stats['hit_rate']:.1%})"
+    )
+    reducer_stats = reducer.summary()
+    if reducer_stats["pages"]:
+        print(
+            f"  -> HTML 정리 {reducer_stats['pages']}건: 페이지당 중앙값 "
+            f"{reducer_stats['median'] * 1000:.0f}ms, p95 {reducer_stats['p95'] * 1000:.0f}ms"
+        )
 
     # 3. 결과 저장
+    final_df = None
     if results:
         print("--- 3. 결과 병합 및 저장 시작 ---")
         result_df = pd.DataFrame(results)
         final_df = pd.merge(df, result_df, on="지원 링크", how="left")
 
-        output_filename = f"sheets/ai_jobs_final_results_{formatted_date}.xlsx"
-        final_df.to_excel(output_filename, index=False)
+        output_name = f"ai_jobs_final_results_{formatted_date}"
+        output_filename = save_table(final_df, output_name, export_excel=EXPORT_EXCEL)
         print(f"  -> 작업 완료! 결과가 '{output_filename}' 파일에 저장되었습니다.")
+        if EXPORT_EXCEL:
+            print(f"  -> 엑셀 파일: '{excel_path(output_name)}'")
     else:
         print("처리된 결과가 없어 파일을 저장하지 않았습니다.")
 
     end_time = time.time()
+    trace.record(None, "total", end_time - start_time, postings=len(all_links))
+    print("--- 단계별 소요 시간 (공고 한 건 기준, 초) ---")
+    trace.print_summary()
+    if trace.path:
+        print(f"  -> 공고별 기록: '{trace.path}'")
+    if PROMETHEUS_PATH:
+        trace.write_prometheus(PROMETHEUS_PATH)
+        print(f"  -> Prometheus 지표: '{PROMETHEUS_PATH}'")
+    trace.close()
     print(f"\n총 소요 시간: {end_time - start_time:.2f}초")
+    return final_df
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import hashlib
+import re
+
+FINGERPRINT_BITS = 64
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text, size=3):
+    """
+    텍스트를 단어 단위 size-gram(shingle) 목록으로 나눕니다. 단어가 size개보다 적으면 단어 전체를 하나로 봅니다.
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= size:
+        return [" ".join(tokens)]
+    return [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
+
+
+def simhash(text, size=3):
+    """
+    shingle들의 64비트 해시를 비트별로 투표해 만든 SimHash 지문을 반환합니다.
+    내용이 거의 같은 텍스트는 지문의 다른 비트 수(해밍 거리)가 작습니다.
+    """
+    votes = [0] * FINGERPRINT_BITS
+    for shingle in shingles(text, size):
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(FINGERPRINT_BITS):
+            votes[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, vote in enumerate(votes) if vote > 0)
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+
+class NearDuplicateIndex:
+    """
+    SimHash 지문으로 거의 같은 공고 텍스트를 찾는 색인입니다.
+
+    지문을 (max_distance + 1)개의 구간으로 나눠 구간별로 색인합니다. 해밍 거리가 max_distance 이하인
+    두 지문은 적어도 한 구간이 완전히 같으므로(비둘기집 원리), 같은 구간 값을 가진 후보만 비교하면 됩니다.
+    """
+
+    def __init__(self, max_distance=3, shingle_size=3):
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+        self.bands = max_distance + 1
+        self.band_bits = FINGERPRINT_BITS // self.bands
+        self._buckets = [{} for _ in range(self.bands)]
+        self._fingerprints = {}
+        self.duplicates = 0
+
+    def _band_values(self, fingerprint):
+        mask = (1 << self.band_bits) - 1
+        for band in range(self.bands):
+            # 마지막 구간은 나누어떨어지지 않고 남는 비트까지 포함
+            if band == self.bands - 1:
+                yield fingerprint >> (band * self.band_bits)
+            else:
+                yield fingerprint >> (band * self.band_bits) & mask
+
+    def find(self, fingerprint):
+        """
+        fingerprint와 해밍 거리가 max_distance 이하인 대표 키 중 가장 가까운 것을 반환합니다. 없으면 None.
+        """
+        best_key, best_distance = None, None
+        for buckets, value in zip(self._buckets, self._band_values(fingerprint)):
+            for key in buckets.get(value, ()):
+                distance = hamming_distance(fingerprint, self._fingerprints[key])
+                if distance <= self.max_distance and (
+                    best_distance is None or distance < best_distance
+                ):
+                    best_key, best_distance = key, distance
+        return best_key
+
+    def add(self, key, fingerprint):
+        self._fingerprints[key] = fingerprint
+        for buckets, value in zip(self._buckets, self._band_values(fingerprint)):
+            buckets.setdefault(value, []).append(key)
+
+    def representative(self, key, text):
+        """
+        text와 거의 같은 텍스트가 이미 있으면 그 대표 키를 반환하고,
+        없으면 key를 새 대표로 등록한 뒤 None을 반환합니다.
+        """
+        fingerprint = simhash(text, self.shingle_size)
+        found = self.find(fingerprint)
+        if found is None:
+            self.add(key, fingerprint)
+        else:
+            self.duplicates += 1
+        return found
+
+    @property
+    def groups(self):
+        return len(self._fingerprints)
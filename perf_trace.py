@@ -0,0 +1,211 @@
+import json
+import os
+import statistics
+import threading
+import time
+
+# 파이프라인 단계 이름
+STAGE_FETCH = "fetch"  # HTTP 또는 브라우저로 페이지를 받는 시간
+STAGE_READY_WAIT = "ready_wait"  # 브라우저가 필요한 내용(본문 섹션, '지원하기' 버튼)을 그릴 때까지 기다린 시간
+STAGE_APPLY_CLICK = "apply_click"  # '지원하기'를 누른 뒤 새 창에 원본 공고 주소가 열릴 때까지의 시간
+STAGE_CLEAN = "clean"  # HTML 정리(reduce_content) 시간
+STAGE_QUEUE_WAIT = "queue_wait"  # 수집이 끝난 뒤 LLM 작업자가 잡을 때까지 기다린 시간
+STAGE_EXTRACT = "extract"  # 규칙/캐시/LLM 추출 시간 (LLM 요청의 토큰 정보 포함)
+
+# LLM 요청에서 합산하는 토큰/시간 항목
+TOKEN_FIELDS = (
+    "prompt_tokens",
+    "eval_tokens",
+    "reasoning_tokens",
+    "prefill_seconds",
+    "decode_seconds",
+    "load_seconds",
+)
+# 서버가 사용량을 보고하지 않으면 StreamingLLMClient가 추정치로 채우는 항목
+ESTIMATED_TOKEN_FIELDS = ("prompt_tokens", "eval_tokens", "prefill_seconds", "decode_seconds")
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def llm_fields(metrics, parts=1):
+    """
+    StreamingLLMClient가 남긴 요청 지표들을 합산해 parts개 공고에 똑같이 나눈 값을 반환합니다.
+    (배치 요청 하나에 공고 여러 개가 들어간 경우 공고마다 몫을 기록하면 전체 합계가 맞음)
+    estimated_<항목>에는 그중 서버가 보고하지 않아 추정한 값의 합을 따로 담습니다.
+    """
+    fields = {"llm_requests": len(metrics) / parts}
+    for field in TOKEN_FIELDS:
+        fields[field] = sum(m.get(field) or 0 for m in metrics) / parts
+    for field in ESTIMATED_TOKEN_FIELDS:
+        fields[f"estimated_{field}"] = (
+            sum(m.get(field) or 0 for m in metrics if field in m.get("estimated_fields", ()))
+            / parts
+        )
+    return fields
+
+
+class PerfTrace:
+    """
+    공고(링크)별, 단계별 소요 시간을 기록합니다.
+
+    record()로 남긴 이벤트는 메모리에 모아 summary()/print_summary()로 단계별 분포를 보여주고,
+    path를 주면 한 줄에 하나씩 JSON(JSON-lines)으로 바로 파일에 씁니다.
+    여러 수집/LLM 스레드에서 동시에 불러도 됩니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._events = []
+        self._lock = threading.Lock()
+        self._file = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+
+    def record(self, link, stage, seconds, **fields):
+        event = {"ts": time.time(), "link": link, "stage": stage, "seconds": seconds}
+        event.update(fields)
+        with self._lock:
+            self._events.append(event)
+            if self._file is not None:
+                self._file.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+                self._file.flush()
+
+    def events(self, stage=None):
+        with self._lock:
+            events = list(self._events)
+        return [e for e in events if stage is None or e["stage"] == stage]
+
+    def summary(self):
+        """
+        단계별 {건수, 합계, 중앙값, p95, 최댓값}(초)을 기록된 순서대로 반환합니다.
+        """
+        by_stage = {}
+        for event in self.events():
+            by_stage.setdefault(event["stage"], []).append(event["seconds"])
+        summary = {}
+        for stage, values in by_stage.items():
+            values.sort()
+            summary[stage] = {
+                "count": len(values),
+                "total": sum(values),
+                "median": statistics.median(values),
+                "p95": _percentile(values, 0.95),
+                "max": values[-1],
+            }
+        return summary
+
+    def token_summary(self):
+        """
+        LLM 요청의 토큰 수와 prefill(프롬프트 처리)/decode(생성) 시간 합계, 초당 토큰 수를 반환합니다.
+        estimated_<항목>은 합계 중 서버가 보고하지 않아 추정한 부분입니다.
+        """
+        estimated_fields = [f"estimated_{field}" for field in ESTIMATED_TOKEN_FIELDS]
+        totals = {field: 0 for field in (*TOKEN_FIELDS, *estimated_fields)}
+        requests = 0
+        for event in self.events(STAGE_EXTRACT):
+            if not event.get("llm_requests"):
+                continue
+            requests += event["llm_requests"]
+            for field in totals:
+                totals[field] += event.get(field) or 0
+        totals["requests"] = round(requests)
+        for field in ("prompt_tokens", "eval_tokens", "reasoning_tokens"):
+            totals[field] = round(totals[field])
+        for field in ("estimated_prompt_tokens", "estimated_eval_tokens"):
+            totals[field] = round(totals[field])
+        totals["prefill_tokens_per_second"] = (
+            totals["prompt_tokens"] / totals["prefill_seconds"]
+            if totals["prefill_seconds"]
+            else None
+        )
+        generated = totals["eval_tokens"] + totals["reasoning_tokens"]
+        totals["decode_tokens_per_second"] = (
+            generated / totals["decode_seconds"] if totals["decode_seconds"] else None
+        )
+        return totals
+
+    def print_summary(self):
+        summary = self.summary()
+        if not summary:
+            return
+        print(f"  {'단계':<12}{'건수':>6}{'합계(초)':>10}{'중앙값':>10}{'p95':>10}{'최대':>10}")
+        for stage, s in summary.items():
+            print(
+                f"  {stage:<12}{s['count']:>6}{s['total']:>10.1f}"
+                f"{s['median']:>10.2f}{s['p95']:>10.2f}{s['max']:>10.2f}"
+            )
+
+        tokens = self.token_summary()
+        if not tokens["requests"]:
+            return
+        prefill_rate = tokens["prefill_tokens_per_second"]
+        decode_rate = tokens["decode_tokens_per_second"]
+        print(
+            f"  -> LLM 요청 {tokens['requests']}건: 프롬프트 {tokens['prompt_tokens']:,}토큰 "
+            f"(prefill {tokens['prefill_seconds']:.1f}초"
+            + (f", {prefill_rate:,.0f}토큰/초" if prefill_rate else "")
+            + f"), 생성 {tokens['eval_tokens']:,}토큰 + 추론 {tokens['reasoning_tokens']:,}토큰 "
+            f"(decode {tokens['decode_seconds']:.1f}초"
+            + (f", {decode_rate:,.1f}토큰/초" if decode_rate else "")
+            + ")"
+        )
+        if any(tokens[f"estimated_{field}"] for field in ESTIMATED_TOKEN_FIELDS):
+            print(
+                "  -> 그중 서버가 보고하지 않아 추정한 값: "
+                f"프롬프트 {tokens['estimated_prompt_tokens']:,}토큰, "
+                f"생성 {tokens['estimated_eval_tokens']:,}토큰, "
+                f"prefill {tokens['estimated_prefill_seconds']:.1f}초, "
+                f"decode {tokens['estimated_decode_seconds']:.1f}초"
+            )
+        if tokens["load_seconds"]:
+            print(f"  -> 모델 로딩 시간 합계: {tokens['load_seconds']:.1f}초")
+
+    def write_prometheus(self, path, prefix="ai_jobs"):
+        """
+        단계별 시간 분포와 토큰 합계를 Prometheus 텍스트 형식으로 씁니다.
+        (node_exporter의 textfile collector 디렉터리에 두면 수집됩니다.)
+        """
+        lines = [
+            f"# HELP {prefix}_stage_seconds 공고 한 건의 단계별 소요 시간",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for stage, s in self.summary().items():
+            label = f'stage="{stage}"'
+            lines.append(f'{prefix}_stage_seconds{{{label},quantile="0.5"}} {s["median"]}')
+            lines.append(f'{prefix}_stage_seconds{{{label},quantile="0.95"}} {s["p95"]}')
+            lines.append(f"{prefix}_stage_seconds_sum{{{label}}} {s['total']}")
+            lines.append(f"{prefix}_stage_seconds_count{{{label}}} {s['count']}")
+
+        tokens = self.token_summary()
+        lines.append(f"# TYPE {prefix}_llm_requests_total counter")
+        lines.append(f"{prefix}_llm_requests_total {tokens['requests']}")
+        for field in TOKEN_FIELDS:
+            lines.append(f"# TYPE {prefix}_llm_{field}_total counter")
+            if field not in ESTIMATED_TOKEN_FIELDS:
+                lines.append(f"{prefix}_llm_{field}_total {tokens[field]}")
+                continue
+            # 서버가 보고한 값과 추정한 값을 source 레이블로 나눔
+            estimated = tokens[f"estimated_{field}"]
+            reported = tokens[field] - estimated
+            lines.append(f'{prefix}_llm_{field}_total{{source="reported"}} {reported}')
+            lines.append(f'{prefix}_llm_{field}_total{{source="estimated"}} {estimated}')
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, path)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
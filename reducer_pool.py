@@ -0,0 +1,91 @@
+import concurrent.futures
+import os
+import statistics
+import time
+
+from content_reducer import reduce_content
+from perf_trace import STAGE_CLEAN
+
+
+def _reduce_timed(html_source, token_budget, fast_parser):
+    start = time.perf_counter()
+    reduced = reduce_content(html_source, token_budget, fast_parser)
+    return reduced, time.perf_counter() - start
+
+
+class ReducerPool:
+    """
+    페이지 HTML 정리(reduce_content)를 별도 프로세스들에서 실행합니다.
+
+    HTML 파싱은 CPU를 많이 쓰므로 수집 스레드에서 돌리면 GIL 때문에 다음 페이지 수집이 늦어집니다.
+    수집기가 넘겨주는 (항목, html, 오류)를 받아 정리 작업을 프로세스 풀에 넘기고,
+    끝나는 순서대로 (항목, (텍스트, 통계), 오류)를 돌려줍니다. 페이지별 정리 시간을 기록하며,
+    trace(PerfTrace)를 주면 항목별로도 남깁니다.
+    """
+
+    def __init__(
+        self, workers=None, token_budget=4096, fast_parser=True, max_pending=None, trace=None
+    ):
+        self.token_budget = token_budget
+        self.trace = trace
+        self.fast_parser = fast_parser
+        workers = workers or os.cpu_count() or 1
+        self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        self.max_pending = max_pending or workers * 4
+        self.latencies = []
+
+    def _collect(self, future, item):
+        try:
+            reduced, elapsed = future.result()
+        except Exception as e:
+            return item, None, e
+        self.latencies.append(elapsed)
+        if self.trace is not None:
+            self.trace.record(item, STAGE_CLEAN, elapsed, chars=reduced[1]["original_chars"])
+        return item, reduced, None
+
+    def imap_unordered(self, entries):
+        """
+        (항목, html, 오류)를 yield하는 수집기 출력을 받아 (항목, (텍스트, 통계), 오류)를 yield합니다.
+
+        수집에 실패한 항목은 그대로 넘기고, 정리 대기 중인 페이지가 max_pending개를 넘으면
+        하나가 끝날 때까지 다음 페이지를 받지 않습니다 (수집기에도 backpressure가 전달됨).
+        """
+        pending = {}
+        for item, html, error in entries:
+            if error is not None or html is None:
+                yield item, None, error
+                continue
+
+            future = self._executor.submit(
+                _reduce_timed, html, self.token_budget, self.fast_parser
+            )
+            pending[future] = item
+            if len(pending) < self.max_pending:
+                # 이미 끝난 것만 바로 넘기고 다음 페이지를 받음
+                done = [f for f in pending if f.done()]
+            else:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+            for future in done:
+                yield self._collect(future, pending.pop(future))
+
+        for future in concurrent.futures.as_completed(pending):
+            yield self._collect(future, pending[future])
+
+    def summary(self):
+        """
+        정리한 페이지 수와 페이지당 정리 시간의 중앙값/p95(초)를 반환합니다.
+        """
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return {"pages": 0, "median": None, "p95": None}
+        return {
+            "pages": len(latencies),
+            "median": statistics.median(latencies),
+            "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        }
+
+    def close(self):
+        self._executor.shutdown()
@@ -0,0 +1,162 @@
+import concurrent.futures
+import random
+import time
+from collections import Counter
+
+from state_store import STAGE_COLLECT, STAGE_EXTRACT
+from structured_output import normalize_extraction
+
+# 실패 종류 (어느 단계부터 다시 해야 하는지를 결정)
+FAILURE_FETCH = "수집 실패"  # 페이지를 열지 못함 → 수집부터 다시
+FAILURE_EMPTY = "내용 없음"  # 페이지는 열었지만 본문이 비어 있음 → 수집부터 다시
+FAILURE_LLM_TIMEOUT = "LLM 시간 초과"  # LLM 요청 실패 → 저장된 본문으로 LLM만 다시
+FAILURE_PARSE = "응답 파싱 오류"  # LLM 응답이 JSON이 아님 → 저장된 본문으로 LLM만 다시
+
+COLLECT_FAILURES = (FAILURE_FETCH, FAILURE_EMPTY)
+
+
+def backoff_delay(attempt, base_delay=2.0, max_delay=60.0):
+    """
+    지수 백오프에 full jitter를 적용한 대기 시간(초)을 반환합니다.
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class RetryEngine:
+    """
+    실패한 공고를 실패한 단계부터만 다시 시도합니다.
+
+    상태 저장소에 본문(collect 결과)이 있는 공고는 다시 크롤링하지 않고 LLM 단계만 재시도하며,
+    본문이 없는 공고만 collect_many로 다시 수집합니다. 라운드 사이에는 지수 백오프 + jitter만큼 기다립니다.
+
+    - collect_many(links): (링크, 본문 또는 None, 실패 종류 또는 None)을 yield하는 함수
+    - extract_one(text): 성공 시 (추출 결과, 처리 경로), 실패 시 (None, 실패 종류)를 반환하는 함수
+    - max_age: 이보다 오래전에(초) 저장된 본문/추출 결과는 없는 것으로 보고 다시 처리
+    """
+
+    def __init__(
+        self,
+        state,
+        collect_many,
+        extract_one,
+        max_attempts=5,
+        base_delay=2.0,
+        max_delay=60.0,
+        workers=4,
+        max_age=None,
+    ):
+        self.state = state
+        self.collect_many = collect_many
+        self.extract_one = extract_one
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.workers = workers
+        self.max_age = max_age
+
+    def _extracted(self, links):
+        """
+        추출이 끝난 링크 중 결과 형식이 올바른 것만 {링크: 저장된 결과}로 반환합니다.
+        (형식 확인 전에 완료로 기록된 잘못된 결과는 다시 추출하도록 뺌)
+        """
+        return {
+            link: output
+            for link, output in self.state.get_many(
+                links, STAGE_EXTRACT, max_age=self.max_age
+            ).items()
+            if normalize_extraction(output.get("info")) is not None
+        }
+
+    def _pending(self, links):
+        """
+        아직 추출이 끝나지 않은 링크를 (본문이 있는 링크 → 본문, 다시 수집할 링크 목록)으로 나눕니다.
+        """
+        extracted = self._extracted(links)
+        remaining = [link for link in links if link not in extracted]
+        texts = self.state.get_many(remaining, STAGE_COLLECT, max_age=self.max_age)
+        to_collect = [link for link in remaining if link not in texts]
+        return texts, to_collect
+
+    def run(self, links):
+        """
+        links 중 실패한 공고를 재시도하고, {링크: (추출 결과, 처리 경로)}와 실패 보고서를 반환합니다.
+        """
+        links = list(dict.fromkeys(links))
+        recovered = {}
+
+        for attempt in range(self.max_attempts):
+            texts, to_collect = self._pending(links)
+            if not texts and not to_collect:
+                break
+            if attempt > 0:
+                delay = backoff_delay(attempt - 1, self.base_delay, self.max_delay)
+                print(f"  -> {delay:.1f}초 대기 후 재시도")
+                time.sleep(delay)
+            print(
+                f"\n=== 재시도 {attempt + 1}/{self.max_attempts}: "
+                f"LLM만 재시도 {len(texts)}건, 다시 수집 {len(to_collect)}건 ==="
+            )
+
+            for link, text, kind in self.collect_many(to_collect):
+                if text:
+                    self.state.mark_done(link, STAGE_COLLECT, text)
+                    texts[link] = text
+                else:
+                    self.state.mark_failed(link, STAGE_COLLECT, kind, kind=kind)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(self.extract_one, text): link
+                    for link, text in texts.items()
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    link = futures[future]
+                    try:
+                        info, path_or_kind = future.result()
+                    except Exception as e:
+                        info, path_or_kind = None, f"{type(e).__name__}: {e}"
+                    if info:
+                        self.state.mark_done(
+                            link, STAGE_EXTRACT, {"info": info, "path": path_or_kind}
+                        )
+                        recovered[link] = (info, path_or_kind)
+                    else:
+                        self.state.mark_failed(
+                            link, STAGE_EXTRACT, path_or_kind, kind=path_or_kind
+                        )
+
+        return recovered, self.failure_report(links)
+
+    def failure_report(self, links):
+        """
+        끝내 성공하지 못한 공고를 {링크: (실패 단계, 실패 종류, 시도 횟수)}로 정리합니다.
+        """
+        extracted = self._extracted(links)
+        collect_failures = self.state.failures(links, STAGE_COLLECT)
+        extract_failures = self.state.failures(links, STAGE_EXTRACT)
+        report = {}
+        for link in links:
+            if link in extracted:
+                continue
+            if link in extract_failures:
+                kind, attempts = extract_failures[link]
+                report[link] = (STAGE_EXTRACT, kind, attempts)
+            elif link in collect_failures:
+                kind, attempts = collect_failures[link]
+                report[link] = (STAGE_COLLECT, kind, attempts)
+            else:
+                report[link] = (STAGE_COLLECT, "미처리", 0)
+        return report
+
+
+def print_failure_report(report):
+    if not report:
+        print("\n모든 공고 추출 성공.")
+        return
+    print(f"\n--- 최종 실패 {len(report)}건 ---")
+    for (stage, kind), count in Counter(
+        (stage, kind) for stage, kind, _ in report.values()
+    ).most_common():
+        print(f"  - [{stage}] {kind}: {count}건")
+    for link, (stage, kind, attempts) in report.items():
+        print(f"    {link} ({stage}, {kind}, {attempts}회 시도)")
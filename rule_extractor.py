@@ -0,0 +1,81 @@
+import re
+
+from content_reducer import TARGET_HEADINGS, heading_kind
+
+# 줄 앞의 글머리 기호: •, ·, -, *, ▪, ■, □, ◦, ✓, 1. 1) (1) ① 등
+BULLET_PATTERN = re.compile(
+    r"^\s*(?:[•·\-\*▪■□◦●○►▶✓✔→]|\(?\d{1,2}[\.\)](?!\d)|[①-⑳])\s*"
+)
+
+# 제목 뒤에 내용이 붙은 경우("자격요건: Python 3년 이상")의 구분자
+HEADING_SEPARATOR = re.compile(r"[:：]\s*")
+
+MAX_ITEMS_PER_SECTION = 25  # 이보다 항목이 많으면 섹션 경계를 잘못 잡았을 가능성이 큼
+MAX_ITEM_LENGTH = 200  # 이보다 긴 항목은 목록이 아니라 문단일 가능성이 큼
+LIST_LINE_LENGTH = 100  # 글머리 기호가 없어도 이보다 짧은 줄은 목록 항목으로 봄
+
+
+def _strip_bullet(line):
+    return BULLET_PATTERN.sub("", line, count=1).strip()
+
+
+def _inline_content(line):
+    """
+    제목 줄에 붙어 있는 내용을 반환합니다. ("자격요건: Python" → "Python")
+    """
+    parts = HEADING_SEPARATOR.split(line, maxsplit=1)
+    return parts[1].strip() if len(parts) == 2 else ""
+
+
+def extract_by_rules(text):
+    """
+    자격요건/우대사항 제목과 글머리 목록으로 된 공고를 LLM 없이 추출합니다.
+
+    call_local_llm과 같은 {"자격요건": [...], "우대사항": [...]} 형태와
+    0~1 사이의 신뢰도를 (결과, 신뢰도)로 반환합니다.
+    신뢰도가 낮은 공고는 LLM으로 다시 보내야 합니다.
+    """
+    result = {kind: [] for kind in TARGET_HEADINGS}
+    heading_counts = {kind: 0 for kind in TARGET_HEADINGS}
+    list_lines = 0
+    item_lines = 0
+    current = None
+
+    for line in (text or "").split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        kind = heading_kind(line)
+        if kind is not None:
+            current = kind if kind in result else None
+            if current:
+                heading_counts[current] += 1
+                inline = _inline_content(line)
+                if inline:
+                    result[current].append(inline)
+            continue
+
+        if current is None:
+            continue
+        item_lines += 1
+        # <li>로 된 목록은 글머리 기호 없이 한 줄씩 들어오므로 짧은 줄도 목록 항목으로 셈
+        if BULLET_PATTERN.match(line) or len(line) <= LIST_LINE_LENGTH:
+            list_lines += 1
+        item = _strip_bullet(line)
+        if item:
+            result[current].append(item)
+
+    confidence = 0.0
+    for kind, weight in (("자격요건", 0.4), ("우대사항", 0.3)):
+        items = result[kind]
+        if 0 < len(items) <= MAX_ITEMS_PER_SECTION and all(
+            len(item) <= MAX_ITEM_LENGTH for item in items
+        ):
+            confidence += weight
+    if item_lines and list_lines / item_lines >= 0.8:
+        confidence += 0.2
+    if all(count == 1 for count in heading_counts.values()):
+        confidence += 0.1
+
+    return result, round(confidence, 2)
@@ -0,0 +1,523 @@
+import glob
+import hashlib
+import itertools
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, deque
+from functools import lru_cache
+
+import table_store
+from table_store import iter_table
+
+# --- 사용자 설정 영역 ---
+AGGREGATE_DB_PATH = "cache/skill_analytics.sqlite3"  # 기술별 집계를 쌓아 두는 SQLite 파일
+RESULT_TABLE_PATTERN = "ai_jobs_final_results_*"  # 분석할 결과 시트 이름 (sheets/ 아래)
+TOP_N = 30  # 출력할 상위 기술 수
+# --- 사용자 설정 영역 끝 ---
+
+SECTIONS = ("자격요건", "우대사항")
+SECTION_ANY = "전체"  # 자격요건/우대사항 중 어디든 나온 경우
+FAILED_VALUES = {"추출 실패", "HTML 수집 실패 또는 내용 없음", ""}
+LINE_CACHE_SIZE = 200_000  # 기술을 찾은 결과를 기억해 둘 서로 다른 줄 수
+RESULT_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# 기술 이름 → 공고에서 쓰이는 별칭 (대소문자 무시, 한글/영문 표기 모두, 기술 이름 자체도 별칭에 넣어야 함)
+# 영문/숫자로 시작하거나 끝나는 별칭은 앞뒤가 영문/숫자가 아닐 때만 찾으므로
+# "R"이 "React" 안에서, "Go"가 "Google" 안에서 잡히지 않습니다. 한글 별칭은 조사가 붙어도 찾습니다.
+SKILL_TAXONOMY = {
+    # 언어
+    "Python": ["python", "파이썬"],
+    "C++": ["c++", "cpp"],
+    "C": ["c언어", "c 언어"],
+    "Java": ["java", "자바"],
+    "Scala": ["scala", "스칼라"],
+    "Go": ["golang", "go언어", "go 언어"],
+    "Rust": ["rust"],
+    "R": ["r언어", "r 언어", "rstudio"],  # "R&D"와 구분하기 위해 "R" 단독은 찾지 않음
+    "SQL": ["sql"],
+    "JavaScript": ["javascript", "자바스크립트"],
+    "TypeScript": ["typescript", "타입스크립트"],
+    "CUDA": ["cuda"],
+    # 딥러닝/머신러닝 프레임워크
+    "PyTorch": ["pytorch", "파이토치", "torch"],
+    "TensorFlow": ["tensorflow", "텐서플로", "텐서플로우"],
+    "JAX": ["jax"],
+    "Keras": ["keras", "케라스"],
+    "scikit-learn": ["scikit-learn", "sklearn", "사이킷런"],
+    "XGBoost": ["xgboost"],
+    "LightGBM": ["lightgbm"],
+    "Hugging Face": ["hugging face", "huggingface", "허깅페이스", "transformers"],
+    "LangChain": ["langchain", "랭체인"],
+    "LlamaIndex": ["llamaindex", "llama index"],
+    "OpenCV": ["opencv"],
+    "Pandas": ["pandas", "판다스"],
+    "NumPy": ["numpy", "넘파이"],
+    # 분야
+    "LLM": ["llm", "대규모 언어 모델", "대규모 언어모델", "거대 언어 모델", "거대언어모델", "large language model"],
+    "RAG": ["rag", "검색 증강 생성", "retrieval-augmented generation", "retrieval augmented generation"],
+    "자연어 처리": ["nlp", "자연어 처리", "자연어처리", "natural language processing"],
+    "컴퓨터 비전": ["computer vision", "컴퓨터 비전", "컴퓨터비전", "영상 처리", "이미지 처리"],
+    "음성 인식": ["speech recognition", "asr", "음성 인식", "음성인식", "stt"],
+    "추천 시스템": ["recommender system", "recommendation system", "추천 시스템", "추천시스템"],
+    "강화학습": ["reinforcement learning", "강화학습", "강화 학습", "rlhf"],
+    "생성형 AI": ["generative ai", "생성형 ai", "생성 ai", "diffusion", "디퓨전"],
+    "멀티모달": ["multimodal", "multi-modal", "멀티모달", "멀티 모달"],
+    "파인튜닝": ["fine-tuning", "fine tuning", "finetuning", "파인튜닝", "파인 튜닝", "미세 조정", "lora"],
+    "프롬프트 엔지니어링": ["prompt engineering", "프롬프트 엔지니어링", "프롬프트 설계"],
+    "모델 경량화": ["양자화", "quantization", "경량화", "distillation", "증류", "pruning"],
+    "모델 서빙": ["model serving", "모델 서빙", "triton", "vllm", "tensorrt", "onnx"],
+    "MLOps": ["mlops", "ml ops", "mlflow", "kubeflow", "airflow"],
+    "분산 학습": ["분산 학습", "distributed training", "deepspeed", "megatron", "fsdp"],
+    "데이터 엔지니어링": ["데이터 엔지니어링", "data engineering", "데이터 파이프라인", "data pipeline", "etl"],
+    "Spark": ["spark", "pyspark", "스파크"],
+    "Kafka": ["kafka", "카프카"],
+    # 인프라/도구
+    "Docker": ["docker", "도커", "컨테이너"],
+    "Kubernetes": ["kubernetes", "k8s", "쿠버네티스"],
+    "AWS": ["aws", "amazon web services", "sagemaker"],
+    "GCP": ["gcp", "google cloud", "vertex ai"],
+    "Azure": ["azure", "애저"],
+    "Linux": ["linux", "리눅스"],
+    "Git": ["git", "github", "gitlab", "깃허브"],
+    "벡터 DB": ["vector db", "vector database", "벡터 db", "벡터 데이터베이스", "faiss", "milvus", "pinecone", "elasticsearch"],
+    # 학력/경험
+    "석사": ["석사", "master's", "ms degree"],
+    "박사": ["박사", "ph.d", "phd"],
+    "논문": ["논문", "publication", "top-tier conference", "학회"],
+    "영어": ["영어", "english", "비즈니스 영어"],
+}
+
+
+def _is_word_char(ch):
+    return ch.isascii() and ch.isalnum()
+
+
+class SkillMatcher:
+    """
+    기술 별칭 전체를 Aho-Corasick 오토마톤 하나로 만들어, 텍스트를 한 번 훑으면서 모든 별칭을 찾습니다.
+    (별칭마다 텍스트를 다시 검색하지 않으므로 별칭 수가 늘어도 속도가 거의 같음)
+    """
+
+    def __init__(self, taxonomy=SKILL_TAXONOMY):
+        self.taxonomy = taxonomy
+        # 상태별 {글자: 다음 상태}, 실패 링크, 이 상태에서 끝나는 (별칭 길이, 기술, 경계 검사 여부) 목록
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for skill, aliases in taxonomy.items():
+            for alias in {alias.lower() for alias in aliases}:
+                self._add(alias, skill)
+        self._build_failure_links()
+        # 공고마다 같은 문구(템플릿, 흔한 자격요건)가 반복되므로 줄 단위로 결과를 캐시함
+        self._find_line = lru_cache(maxsize=LINE_CACHE_SIZE)(self._scan)
+
+    @property
+    def version(self):
+        """
+        분류표가 바뀌면 달라지는 값입니다. (집계를 처음부터 다시 해야 하는지 판단)
+        """
+        payload = json.dumps(self.taxonomy, ensure_ascii=False, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _add(self, alias, skill):
+        state = 0
+        for ch in alias:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        bounded = (_is_word_char(alias[0]), _is_word_char(alias[-1]))
+        self._output[state].append((len(alias), skill, bounded))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                # 실패 링크 쪽에서 끝나는 별칭도 이 상태에서 함께 끝남
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find(self, text):
+        """
+        텍스트에 나온 기술 이름의 집합을 반환합니다.
+        """
+        if not isinstance(text, str):
+            return set()
+        return set().union(*(self._find_line(line) for line in text.split("\n")))
+
+    def _scan(self, line):
+        text = line.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, skill, (bounded_start, bounded_end) in output[state]:
+                if skill in found:
+                    continue
+                start = end - length
+                if bounded_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if bounded_end and end < len(text) and _is_word_char(text[end]):
+                    continue
+                found.add(skill)
+        return frozenset(found)
+
+
+class SkillAggregateStore:
+    """
+    날짜(공고를 처음 수집한 날)별, 회사별 기술 언급 수와 날짜별 기술 쌍의 동시 등장 수를 SQLite에 쌓습니다.
+
+    이미 집계한 공고 링크와 결과 시트(이름, 수정 시각, 크기)를 기록해 두므로, 다시 실행하면
+    새 결과 시트의 새 공고만 읽어 기존 집계에 더합니다. 분류표가 바뀌면 집계를 비우고 다시 만듭니다.
+    """
+
+    def __init__(self, path, matcher=None):
+        self.path = path
+        self.matcher = matcher or SkillMatcher()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS seen_posting (
+                link TEXT PRIMARY KEY,
+                day TEXT NOT NULL,
+                company TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS ingested_table (
+                name TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                postings INTEGER NOT NULL,
+                ingested_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS posting_count (
+                day TEXT NOT NULL,
+                company TEXT NOT NULL,
+                postings INTEGER NOT NULL,
+                PRIMARY KEY (day, company)
+            );
+            CREATE TABLE IF NOT EXISTS skill_count (
+                day TEXT NOT NULL,
+                company TEXT NOT NULL,
+                section TEXT NOT NULL,
+                skill TEXT NOT NULL,
+                postings INTEGER NOT NULL,
+                PRIMARY KEY (day, company, section, skill)
+            );
+            CREATE INDEX IF NOT EXISTS skill_count_by_section
+                ON skill_count (section, skill, postings);
+            CREATE TABLE IF NOT EXISTS skill_pair (
+                day TEXT NOT NULL,
+                skill_a TEXT NOT NULL,
+                skill_b TEXT NOT NULL,
+                postings INTEGER NOT NULL,
+                PRIMARY KEY (day, skill_a, skill_b)
+            );
+            """
+        )
+        self._reset_if_taxonomy_changed()
+
+    def _reset_if_taxonomy_changed(self):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'taxonomy_version'"
+            ).fetchone()
+            version = self.matcher.version
+            if row is not None and row[0] == version:
+                return
+            if row is not None:
+                print("  -> 기술 분류표가 바뀌어 집계를 처음부터 다시 만듭니다.")
+            for table in (
+                "seen_posting",
+                "ingested_table",
+                "posting_count",
+                "skill_count",
+                "skill_pair",
+            ):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('taxonomy_version', ?)",
+                (version,),
+            )
+            self._conn.commit()
+
+    def ingest_table(self, name, day=None, batch_size=table_store.ROW_GROUP_SIZE):
+        """
+        결과 시트(sheets/<name>.parquet)의 아직 집계하지 않은 공고를 집계에 더하고, 더한 공고 수를 반환합니다.
+        day를 주지 않으면 시트 이름의 날짜(YYYY-MM-DD)를 씁니다. 지난번 이후 바뀌지 않은 시트는 읽지 않습니다.
+        """
+        path = table_store.table_path(name)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime, size FROM ingested_table WHERE name = ?", (name,)
+            ).fetchone()
+        if row is not None and row == (stat.st_mtime, stat.st_size):
+            return 0
+
+        if day is None:
+            match = RESULT_DATE_PATTERN.search(name)
+            day = match.group(1) if match else time.strftime("%Y-%m-%d")
+        columns = ["지원 링크", "회사", *SECTIONS]
+        added = 0
+        for batch in iter_table(name, batch_size=batch_size, columns=columns):
+            postings = (
+                (row["지원 링크"], row["회사"], {section: row[section] for section in SECTIONS})
+                for row in batch.to_dict("records")
+            )
+            added += self.ingest_postings(postings, day)
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO ingested_table (name, mtime, size, postings, ingested_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (name, stat.st_mtime, stat.st_size, added, time.time()),
+            )
+            self._conn.commit()
+        return added
+
+    def ingest_postings(self, postings, day):
+        """
+        (링크, 회사, {"자격요건": 텍스트, "우대사항": 텍스트}) 목록 중 처음 보는 공고만 day 날짜로 집계에 더합니다.
+        추출에 실패한 공고는 건너뛰고(다음에 재시도된 결과로 집계됨), 더한 공고 수를 반환합니다.
+        """
+        postings = [
+            (link, company if isinstance(company, str) else "", sections)
+            for link, company, sections in postings
+            if isinstance(link, str) and not _is_failed(sections)
+        ]
+        if not postings:
+            return 0
+
+        with self._lock:
+            known = self._known_links([link for link, _, _ in postings])
+            posting_counts = Counter()
+            skill_counts = Counter()
+            pair_counts = Counter()
+            new_postings = []
+            for link, company, sections in postings:
+                if link in known:
+                    continue
+                known.add(link)
+                new_postings.append((link, day, company))
+                posting_counts[company] += 1
+                found_any = set()
+                for section in SECTIONS:
+                    found = self.matcher.find(sections[section])
+                    found_any |= found
+                    for skill in found:
+                        skill_counts[company, section, skill] += 1
+                for skill in found_any:
+                    skill_counts[company, SECTION_ANY, skill] += 1
+                for pair in itertools.combinations(sorted(found_any), 2):
+                    pair_counts[pair] += 1
+
+            # 배치 하나를 트랜잭션 하나로 더함
+            self._conn.executemany(
+                "INSERT INTO seen_posting (link, day, company) VALUES (?, ?, ?)", new_postings
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO posting_count (day, company, postings) VALUES (?, ?, ?)
+                ON CONFLICT (day, company) DO UPDATE SET postings = postings + excluded.postings
+                """,
+                [(day, company, count) for company, count in posting_counts.items()],
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO skill_count (day, company, section, skill, postings) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (day, company, section, skill)
+                DO UPDATE SET postings = postings + excluded.postings
+                """,
+                [(day, *key, count) for key, count in skill_counts.items()],
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO skill_pair (day, skill_a, skill_b, postings) VALUES (?, ?, ?, ?)
+                ON CONFLICT (day, skill_a, skill_b) DO UPDATE SET postings = postings + excluded.postings
+                """,
+                [(day, a, b, count) for (a, b), count in pair_counts.items()],
+            )
+            self._conn.commit()
+        return len(new_postings)
+
+    def _known_links(self, links):
+        known = set()
+        # SQLite의 변수 개수 제한(기본 999)에 맞춰 나눠 조회
+        for i in range(0, len(links), 900):
+            chunk = links[i : i + 900]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0]
+                for row in self._conn.execute(
+                    f"SELECT link FROM seen_posting WHERE link IN ({placeholders})", chunk
+                )
+            )
+        return known
+
+    @staticmethod
+    def _filters(since=None, until=None, company=None):
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("day >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("day <= ?")
+            params.append(until)
+        if company is not None:
+            clauses.append("company = ?")
+            params.append(company)
+        return clauses, params
+
+    def posting_total(self, since=None, until=None, company=None):
+        clauses, params = self._filters(since, until, company)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COALESCE(SUM(postings), 0) FROM posting_count {where}", params
+            ).fetchone()
+        return row[0]
+
+    def top_skills(self, section=SECTION_ANY, limit=30, since=None, until=None, company=None):
+        """
+        [(기술, 언급한 공고 수, 전체 공고 대비 비율)]을 많이 나온 순서로 반환합니다.
+        section은 "자격요건", "우대사항", "전체" 중 하나입니다.
+        """
+        clauses, params = self._filters(since, until, company)
+        clauses.insert(0, "section = ?")
+        params.insert(0, section)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT skill, SUM(postings) AS total FROM skill_count
+                WHERE {' AND '.join(clauses)}
+                GROUP BY skill ORDER BY total DESC, skill LIMIT ?
+                """,
+                (*params, limit),
+            ).fetchall()
+        total = self.posting_total(since, until, company)
+        return [(skill, count, count / total if total else 0.0) for skill, count in rows]
+
+    def co_occurring(self, skill, limit=10, since=None, until=None):
+        """
+        skill과 같은 공고에 함께 나온 기술을 [(기술, 함께 나온 공고 수)]로 많은 순서대로 반환합니다.
+        """
+        clauses, params = self._filters(since, until)
+        where = "".join(f" AND {clause}" for clause in clauses)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT CASE WHEN skill_a = ? THEN skill_b ELSE skill_a END AS other,
+                       SUM(postings) AS total
+                FROM skill_pair
+                WHERE (skill_a = ? OR skill_b = ?){where}
+                GROUP BY other ORDER BY total DESC, other LIMIT ?
+                """,
+                (skill, skill, skill, *params, limit),
+            ).fetchall()
+        return rows
+
+    def daily_trend(self, skill, section=SECTION_ANY, company=None):
+        """
+        [(날짜, 언급한 공고 수, 그날 새로 수집한 공고 수)]를 날짜순으로 반환합니다.
+        """
+        company_clause = " AND p.company = ?" if company is not None else ""
+        company_params = [company] if company is not None else []
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT p.day, COALESCE(SUM(s.postings), 0), SUM(p.postings)
+                FROM posting_count p
+                LEFT JOIN skill_count s
+                  ON s.day = p.day AND s.company = p.company AND s.section = ? AND s.skill = ?
+                WHERE 1 = 1{company_clause}
+                GROUP BY p.day ORDER BY p.day
+                """,
+                (section, skill, *company_params),
+            ).fetchall()
+        return rows
+
+    def company_skills(self, company, section=SECTION_ANY, limit=10):
+        return self.top_skills(section=section, limit=limit, company=company)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _is_failed(sections):
+    values = [sections.get(section) for section in SECTIONS]
+    if all(not isinstance(value, str) or value in FAILED_VALUES for value in values):
+        return True
+    return any(isinstance(value, str) and value in FAILED_VALUES - {""} for value in values)
+
+
+def result_table_names():
+    """
+    sheets/ 아래의 결과 시트 이름을 날짜순으로 반환합니다.
+    """
+    pattern = os.path.join(table_store.SHEETS_DIR, f"{RESULT_TABLE_PATTERN}.parquet")
+    return sorted(os.path.splitext(os.path.basename(path))[0] for path in glob.glob(pattern))
+
+
+def main():
+    start_time = time.time()
+    store = SkillAggregateStore(AGGREGATE_DB_PATH)
+
+    print("--- 1. 결과 시트 집계 ---")
+    names = result_table_names()
+    if not names:
+        print(f"'{table_store.SHEETS_DIR}'에 결과 시트({RESULT_TABLE_PATTERN})가 없습니다.")
+        return
+    for name in names:
+        added = store.ingest_table(name)
+        if added:
+            print(f"  -> '{name}': 새 공고 {added}건 집계")
+    print(f"  -> 누적 공고 {store.posting_total()}건 (집계 시간 {time.time() - start_time:.1f}초)")
+
+    total = store.posting_total()
+    if not total:
+        return
+    for section in (SECTION_ANY, *SECTIONS):
+        print(f"--- 많이 요구하는 기술 ({section}) ---")
+        for rank, (skill, count, share) in enumerate(store.top_skills(section, TOP_N), 1):
+            print(f"  {rank:>3}. {skill:<20} {count:>7}건 ({share:.1%})")
+
+    print("--- 함께 요구하는 기술 ---")
+    for skill, _, _ in store.top_skills(limit=10):
+        partners = ", ".join(f"{other} {count}" for other, count in store.co_occurring(skill, 5))
+        print(f"  {skill}: {partners}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+SOURCE_STATIC = "static"  # 브라우저 없이 HTTP로 받은 원본 HTML
+SOURCE_BROWSER = "browser"  # 브라우저가 렌더링한 뒤의 page_source
+
+
+class SnapshotStore:
+    """
+    지원 페이지의 원본 HTML을 압축해 보관하는 내용 주소 기반(content-addressed) 저장소입니다.
+
+    HTML 본문은 SHA-256 해시를 이름으로 하는 zlib 압축 파일(objects/ab/abcd....html.z)로 한 번만 저장하고,
+    SQLite 색인에 (URL, 수집 방식, 해시, 수집 시각, 확인 시각, ETag, Last-Modified)를 기록합니다.
+    수집 시각은 그 내용을 처음 받은 시각이고, 확인 시각은 같은 내용임을 마지막으로 확인한 시각입니다.
+    같은 URL의 내용이 바뀌면 새 해시로 한 줄이 추가되므로 이전 버전도 남아 있습니다.
+    정리 로직이나 프롬프트가 바뀌어도 이 저장소만으로 다시 크롤링하지 않고 재분석할 수 있습니다.
+    """
+
+    def __init__(self, directory, compress_level=6):
+        self.directory = directory
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "index.sqlite3"), check_same_thread=False
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                url TEXT NOT NULL,
+                source TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                checked_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                PRIMARY KEY (url, source, content_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _object_path(self, content_hash):
+        return os.path.join(
+            self.directory, "objects", content_hash[:2], f"{content_hash}.html.z"
+        )
+
+    def put(self, url, html, source=SOURCE_STATIC, etag=None, last_modified=None):
+        """
+        HTML을 저장하고 내용 해시를 반환합니다. 같은 내용은 파일을 다시 쓰지 않습니다.
+        """
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._object_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 쓰는 도중 중단되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(zlib.compress(data, self.compress_level))
+            os.replace(temp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO snapshots
+                    (url, source, content_hash, fetched_at, checked_at, etag, last_modified)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url, source, content_hash) DO UPDATE SET
+                    checked_at = excluded.checked_at,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified
+                """,
+                (url, source, content_hash, now, now, etag, last_modified),
+            )
+            self._conn.commit()
+        return content_hash
+
+    def latest(self, url, source=None):
+        """
+        URL에서 가장 최근에 확인된 스냅샷 정보를 딕셔너리로 반환합니다. 없으면 None을 반환합니다.
+        source를 주지 않으면 렌더링된 스냅샷을 우선합니다.
+        """
+        query = (
+            "SELECT source, content_hash, fetched_at, checked_at, etag, last_modified "
+            "FROM snapshots WHERE url = ?"
+        )
+        params = [url]
+        if source is not None:
+            query += " AND source = ?"
+            params.append(source)
+        query += " ORDER BY source = ? DESC, checked_at DESC LIMIT 1"
+        params.append(SOURCE_BROWSER)
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        if row is None:
+            return None
+        keys = ("source", "content_hash", "fetched_at", "checked_at", "etag", "last_modified")
+        return dict(zip(keys, row))
+
+    def load(self, content_hash):
+        """
+        해시에 해당하는 HTML을 반환합니다. 파일이 없으면 None을 반환합니다.
+        """
+        try:
+            with open(self._object_path(content_hash), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+
+    def get(self, url, source=None):
+        """
+        URL의 가장 최근 HTML을 반환합니다. 없으면 None을 반환합니다.
+        """
+        snapshot = self.latest(url, source)
+        return self.load(snapshot["content_hash"]) if snapshot else None
+
+    def conditional_headers(self, url, source=SOURCE_STATIC):
+        """
+        저장된 ETag/Last-Modified로 조건부 요청 헤더(If-None-Match/If-Modified-Since)를 만듭니다.
+        """
+        snapshot = self.latest(url, source)
+        headers = {}
+        if snapshot:
+            if snapshot["etag"]:
+                headers["If-None-Match"] = snapshot["etag"]
+            if snapshot["last_modified"]:
+                headers["If-Modified-Since"] = snapshot["last_modified"]
+        return headers
+
+    def mark_checked(self, url, source=SOURCE_STATIC):
+        """
+        서버가 304(변경 없음)로 답한 경우, 가장 최근 스냅샷의 확인 시각만 갱신합니다.
+        """
+        snapshot = self.latest(url, source)
+        if snapshot is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "UPDATE snapshots SET checked_at = ? "
+                "WHERE url = ? AND source = ? AND content_hash = ?",
+                (time.time(), url, source, snapshot["content_hash"]),
+            )
+            self._conn.commit()
+
+    def rendered_if_unchanged(self, url, max_age=None):
+        """
+        렌더링한 뒤로 정적 HTML이 바뀌지 않았으면(304 또는 같은 해시) 저장된 렌더링 결과를 반환합니다.
+        그렇지 않으면 None을 반환하며, 이때는 브라우저로 다시 렌더링해야 합니다.
+        정적 HTML이 그대로여도 JS가 API로 불러오는 내용은 바뀔 수 있으므로, max_age(초)를 주면
+        마지막으로 렌더링한 지 그보다 오래된 결과도 None으로 봅니다.
+        """
+        rendered = self.latest(url, SOURCE_BROWSER)
+        static = self.latest(url, SOURCE_STATIC)
+        if rendered is None or static is None:
+            return None
+        if static["fetched_at"] > rendered["fetched_at"]:
+            return None
+        if max_age is not None and time.time() - rendered["checked_at"] > max_age:
+            return None
+        return self.load(rendered["content_hash"])
+
+    def urls(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT url FROM snapshots").fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
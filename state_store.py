@@ -0,0 +1,150 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# 파이프라인 단계 이름
+STAGE_APPLY_LINK = "apply_link"  # 직행 공고 → 원본 공고 주소 (add_applyLink.py)
+STAGE_COLLECT = "collect"  # 원본 공고 → 축약된 본문 텍스트 (llm_qual_spec_par.py)
+STAGE_EXTRACT = "extract"  # 본문 텍스트 → 자격요건/우대사항 (llm_qual_spec_par.py)
+
+
+class PipelineStateStore:
+    """
+    공고(링크)별로 어떤 단계가 끝났는지와 그 결과를 SQLite에 기록하는 체크포인트 저장소입니다.
+
+    각 단계가 끝나는 즉시 커밋하므로 실행 도중 중단되어도 끝난 작업은 남아 있고,
+    다시 실행하면 완료되지 않았거나 실패한 공고만 처리하면 됩니다.
+    조회할 때 max_age(초)를 주면 그보다 오래전에 기록된 결과는 없는 것으로 보고 다시 처리하게 합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS posting_state (
+                link TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                output TEXT,
+                error TEXT,
+                error_kind TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (link, stage)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _upsert(self, link, stage, status, output, error, error_kind):
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO posting_state
+                    (link, stage, status, output, error, error_kind, attempts, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT (link, stage) DO UPDATE SET
+                    status = excluded.status,
+                    output = excluded.output,
+                    error = excluded.error,
+                    error_kind = excluded.error_kind,
+                    attempts = posting_state.attempts + 1,
+                    updated_at = excluded.updated_at
+                """,
+                (link, stage, status, output, error, error_kind, time.time()),
+            )
+            self._conn.commit()
+
+    def mark_done(self, link, stage, output):
+        """
+        단계를 완료로 기록합니다. output은 JSON으로 직렬화할 수 있는 값이어야 합니다.
+        """
+        self._upsert(
+            link, stage, "done", json.dumps(output, ensure_ascii=False), None, None
+        )
+
+    def mark_failed(self, link, stage, error, kind=None):
+        """
+        단계를 실패로 기록합니다. kind는 재시도 시 실패 원인을 구분하는 데 쓰입니다.
+        """
+        self._upsert(link, stage, "failed", None, str(error), kind)
+
+    @staticmethod
+    def _cutoff(max_age):
+        return time.time() - max_age if max_age is not None else float("-inf")
+
+    def get(self, link, stage, max_age=None):
+        """
+        완료된 단계의 결과를 반환합니다. 완료되지 않았거나 max_age초보다 오래되었으면 None을 반환합니다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output FROM posting_state "
+                "WHERE link = ? AND stage = ? AND status = 'done' AND updated_at >= ?",
+                (link, stage, self._cutoff(max_age)),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, links, stage, max_age=None):
+        """
+        여러 링크의 완료된 결과를 한 번에 조회해 {링크: 결과}로 반환합니다.
+        max_age를 주면 그보다 오래된 결과는 빼고 반환합니다.
+        """
+        links = list(dict.fromkeys(links))
+        outputs = {}
+        cutoff = self._cutoff(max_age)
+        with self._lock:
+            # SQLite의 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for i in range(0, len(links), 500):
+                chunk = links[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT link, output FROM posting_state "
+                    f"WHERE stage = ? AND status = 'done' AND updated_at >= ? "
+                    f"AND link IN ({placeholders})",
+                    (stage, cutoff, *chunk),
+                ).fetchall()
+                outputs.update((link, json.loads(output)) for link, output in rows)
+        return outputs
+
+    def failures(self, links, stage):
+        """
+        여러 링크 중 해당 단계가 실패로 기록된 것을 {링크: (실패 종류, 시도 횟수)}로 반환합니다.
+        """
+        links = list(dict.fromkeys(links))
+        failed = {}
+        with self._lock:
+            for i in range(0, len(links), 500):
+                chunk = links[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT link, error_kind, attempts FROM posting_state "
+                    f"WHERE stage = ? AND status = 'failed' AND link IN ({placeholders})",
+                    (stage, *chunk),
+                ).fetchall()
+                failed.update((link, (kind, attempts)) for link, kind, attempts in rows)
+        return failed
+
+    def summary(self, stage):
+        """
+        단계별 상태 개수를 {"done": n, "failed": m}처럼 반환합니다.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM posting_state WHERE stage = ? GROUP BY status",
+                (stage,),
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,185 @@
+# pip install aiohttp
+
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+from urllib.parse import urlparse
+
+import aiohttp
+
+from perf_trace import STAGE_FETCH
+from snapshot_store import SOURCE_STATIC
+
+# 정적 HTML만으로 충분한지 판단할 때 찾는 섹션 키워드
+KEY_SECTION_KEYWORDS = (
+    "자격요건",
+    "자격 요건",
+    "지원자격",
+    "지원 자격",
+    "우대사항",
+    "우대 사항",
+    "requirements",
+    "qualifications",
+    "preferred",
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+
+def get_domain(url):
+    return urlparse(url).netloc.lower()
+
+
+def has_key_sections(text, min_length=200):
+    """
+    정제된 텍스트에 자격요건/우대사항 섹션이 들어있는지 확인합니다.
+    (JS로 본문을 그리는 페이지는 정적 HTML에 이 내용이 없습니다.)
+    """
+    if not text or len(text) < min_length:
+        return False
+    lowered = text.lower()
+    return any(keyword in lowered for keyword in KEY_SECTION_KEYWORDS)
+
+
+class FetchModeStore:
+    """
+    도메인별로 어떤 수집 방식('static' 또는 'browser')이 통했는지 파일에 기억합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.modes = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.modes = json.load(f)
+
+    def get(self, url):
+        return self.modes.get(get_domain(url))
+
+    def record(self, url, mode):
+        self.modes[get_domain(url)] = mode
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.modes, f, ensure_ascii=False, indent=2)
+
+
+class StaticFetcher:
+    """
+    브라우저 없이 aiohttp로 지원 페이지의 HTML을 가져오는 비동기 수집기입니다.
+
+    하나의 ClientSession(연결 풀)을 모든 요청이 공유하며,
+    전체 동시 요청 수(max_connections)와 호스트별 동시 요청 수(per_host_limit)를 제한합니다.
+    snapshots(SnapshotStore)를 주면 받은 HTML을 보관하고, 다음 실행에서는 ETag/Last-Modified로
+    조건부 요청을 보내 304(변경 없음)이면 본문을 받지 않고 보관된 HTML을 사용합니다.
+    trace(PerfTrace)를 주면 페이지별 수집 시간을 기록합니다.
+    """
+
+    def __init__(
+        self, max_connections=20, per_host_limit=4, timeout=15, snapshots=None, trace=None
+    ):
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.snapshots = snapshots
+        self.trace = trace
+        self.not_modified = set()  # 304(변경 없음)로 응답받아 보관된 HTML을 쓴 URL
+
+    async def _fetch(self, session, url, conditional=True):
+        headers = {}
+        if self.snapshots is not None and conditional:
+            headers = self.snapshots.conditional_headers(url, SOURCE_STATIC)
+
+        html = None
+        async with session.get(url, allow_redirects=True, headers=headers) as response:
+            if response.status == 304 and headers:
+                html = self.snapshots.get(url, SOURCE_STATIC)
+                if html is not None:
+                    self.snapshots.mark_checked(url, SOURCE_STATIC)
+                    self.not_modified.add(url)
+                    return html
+            else:
+                response.raise_for_status()
+                html = await response.text(errors="replace")
+                validators = response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+        if html is None:
+            # 색인에는 있지만 보관 파일이 없어진 경우 조건 없이 다시 받음
+            return await self._fetch(session, url, conditional=False)
+        if self.snapshots is not None:
+            etag, last_modified = validators
+            self.snapshots.put(url, html, SOURCE_STATIC, etag, last_modified)
+        return html
+
+    async def _run(self, urls, emit):
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections, limit_per_host=self.per_host_limit
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=DEFAULT_HEADERS
+        ) as session:
+
+            async def fetch_one(url):
+                start = time.perf_counter()
+                try:
+                    entry = (url, await self._fetch(session, url), None)
+                except Exception as e:
+                    entry = (url, None, e)
+                if self.trace is not None:
+                    self.trace.record(
+                        url,
+                        STAGE_FETCH,
+                        time.perf_counter() - start,
+                        mode="static",
+                        not_modified=url in self.not_modified,
+                        error=type(entry[2]).__name__ if entry[2] else None,
+                    )
+                await emit(entry)
+
+            await asyncio.gather(*(fetch_one(url) for url in urls))
+
+    def imap_unordered(self, urls):
+        """
+        urls를 동시에 가져오며 끝나는 순서대로 (url, html, error)를 yield합니다.
+
+        이벤트 루프는 별도 스레드에서 돌고, 결과 대기열이 가득 차면
+        호출하는 쪽이 소비할 때까지 새 결과 전달을 멈춥니다.
+        """
+        urls = list(urls)
+        if not urls:
+            return
+
+        result_queue = queue.Queue(maxsize=self.max_connections)
+        done = object()
+
+        async def emit(entry):
+            # 동기 대기열에 넣되 이벤트 루프를 막지 않도록 스레드로 넘김
+            await asyncio.to_thread(result_queue.put, entry)
+
+        def run_loop():
+            try:
+                asyncio.run(self._run(urls, emit))
+            finally:
+                result_queue.put(done)
+
+        thread = threading.Thread(target=run_loop, daemon=True)
+        thread.start()
+        while True:
+            entry = result_queue.get()
+            if entry is done:
+                break
+            yield entry
+        thread.join()
@@ -0,0 +1,216 @@
+import json
+import re
+import threading
+
+# 공고 하나의 추출 결과 형식
+EXTRACTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "자격요건": {"type": "array", "items": {"type": "string"}},
+        "우대사항": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["자격요건", "우대사항"],
+    "additionalProperties": False,
+}
+
+# 파싱 결과 종류
+PARSE_STRICT = "strict"  # 응답이 그대로 올바른 JSON
+PARSE_REPAIRED = "repaired"  # 코드 블록/설명 문장/마지막 쉼표 등을 고쳐서 읽음
+PARSE_TRUNCATED = "truncated"  # 중간에 잘린 응답의 괄호를 닫아 읽음 (항목이 빠졌을 수 있어 실패로 취급)
+PARSE_FAILED = "failed"
+
+FENCED_JSON = re.compile(r"```(?:json)?\s*(\{.*?)\s*(?:```|$)", re.DOTALL)
+TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+
+
+def batch_schema(posting_ids):
+    """
+    배치 요청 응답 형식 {공고 ID: 추출 결과}의 JSON 스키마를 만듭니다.
+    """
+    return {
+        "type": "object",
+        "properties": {posting_id: EXTRACTION_SCHEMA for posting_id in posting_ids},
+        "required": list(posting_ids),
+        "additionalProperties": False,
+    }
+
+
+def response_format(schema, name="job_requirements"):
+    """
+    OpenAI 호환 서버(Ollama, vLLM 등)의 스키마 제약 출력 요청 형식을 만듭니다.
+    서버는 스키마에 맞는 토큰만 생성하므로 응답이 항상 올바른 JSON입니다.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema, "strict": True},
+    }
+
+
+def normalize_extraction(info):
+    """
+    추출 결과가 {"자격요건": [문자열, ...], "우대사항": [문자열, ...]} 형태이면 그 형태로 정리해 반환합니다.
+    값이 문자열 하나이면 항목 하나짜리 목록으로 바꾸고, 키가 없거나 다른 형태이면 None을 반환합니다.
+    """
+    if not isinstance(info, dict):
+        return None
+    normalized = {}
+    for kind in EXTRACTION_SCHEMA["required"]:
+        value = info.get(kind)
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            return None
+        normalized[kind] = [item.strip() for item in value if item.strip()]
+    return normalized
+
+
+def rejects_response_format(error_body):
+    """
+    400/422 응답 본문이 response_format(스키마 제약 출력) 자체를 거부한 것인지 봅니다.
+    (프롬프트가 너무 긴 경우처럼 다른 이유의 400이면 False)
+    """
+    body = (error_body or "").lower()
+    return any(word in body for word in ("response_format", "json_schema"))
+
+
+def _loads(text):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    try:
+        # LLM이 자주 남기는 마지막 항목 뒤의 쉼표
+        return json.loads(TRAILING_COMMA.sub(r"\1", text))
+    except json.JSONDecodeError:
+        return None
+
+
+def repair_json(text):
+    """
+    텍스트에서 첫 번째 JSON 객체를 찾아 읽습니다. 앞뒤의 설명 문장은 무시하고,
+    응답이 중간에 잘렸으면 마지막으로 완성된 값까지만 남기고 열린 괄호를 닫습니다.
+    (잘린 목록도 완성된 항목까지는 살림) 읽을 수 없으면 None을 반환합니다.
+    """
+    return _repair(text)[0]
+
+
+def _repair(text):
+    """
+    repair_json과 같고, (결과, 잘린 응답의 괄호를 닫았는지 여부)를 반환합니다.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None, False
+
+    # 열린 컨테이너마다 [닫는 괄호, 객체라면 지금 키를 읽는 중인지("key") 값을 읽는 중인지("value")]
+    stack = []
+    in_string = False
+    escaped = False
+    # 여기서 잘라도 되는 위치와 그때 닫아야 할 괄호들
+    cut, closers = None, ""
+
+    def value_done(end):
+        nonlocal cut, closers
+        if stack and (stack[-1][0] == "]" or stack[-1][1] == "value"):
+            cut, closers = end, "".join(closer for closer, _ in reversed(stack))
+
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+                value_done(i + 1)
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            stack.append(["}", "key"])
+        elif ch == "[":
+            stack.append(["]", None])
+        elif ch in "}]":
+            if not stack or stack[-1][0] != ch:
+                break
+            stack.pop()
+            if not stack:
+                return _loads(text[start : i + 1]), False
+            value_done(i + 1)
+        elif ch == ":" and stack and stack[-1][0] == "}":
+            stack[-1][1] = "value"
+        elif ch == "," and stack:
+            # 숫자/true/null 같은 값은 쉼표에서 끝났음을 알 수 있음
+            value_done(i)
+            if stack[-1][0] == "}":
+                stack[-1][1] = "key"
+
+    if cut is None:
+        return None, False
+    return _loads(text[start:cut] + closers), True
+
+
+def _as_object(parsed):
+    return parsed if isinstance(parsed, dict) else None
+
+
+def parse_llm_json(content, json_str=None, validate=None):
+    """
+    LLM 응답을 JSON으로 읽고 (결과, 파싱 결과 종류)를 반환합니다. 실패하면 (None, PARSE_FAILED).
+    json_str은 스트리밍 중에 완성된 JSON 객체 문자열입니다.
+    validate(예: normalize_extraction)를 주면 읽은 값을 그 함수로 정리하고, None이 나오면(형식이 다름)
+    다음 후보를 봅니다. 주지 않으면 JSON 객체이기만 하면 됩니다.
+    잘린 응답의 괄호를 닫아 읽은 결과는 PARSE_TRUNCATED로 돌려주므로 성공으로 쓰지 않아야 합니다.
+    """
+    validate = validate or _as_object
+    for candidate in (json_str, content.strip()):
+        if candidate:
+            try:
+                parsed = validate(json.loads(candidate))
+            except json.JSONDecodeError:
+                continue
+            if parsed is not None:
+                return parsed, PARSE_STRICT
+
+    fenced = FENCED_JSON.search(content)
+    for candidate in ([fenced.group(1)] if fenced else []) + [content]:
+        parsed, truncated = _repair(candidate)
+        parsed = validate(parsed) if parsed is not None else None
+        if parsed is not None:
+            return parsed, PARSE_TRUNCATED if truncated else PARSE_REPAIRED
+    return None, PARSE_FAILED
+
+
+class ParseStats:
+    """
+    LLM 응답을 첫 시도에 읽을 수 있었는지 모아 재요청을 얼마나 줄였는지 보여줍니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {PARSE_STRICT: 0, PARSE_REPAIRED: 0, PARSE_TRUNCATED: 0, PARSE_FAILED: 0}
+        self.constrained = 0  # 스키마 제약 출력으로 보낸 요청 수
+
+    def record(self, outcome, constrained=False):
+        with self._lock:
+            self.counts[outcome] += 1
+            self.constrained += constrained
+
+    def report(self):
+        """
+        {요청 수, 종류별 건수, 첫 시도 성공률, 스키마 제약 요청 수}를 반환합니다. (잘린 응답은 실패로 셈)
+        """
+        with self._lock:
+            counts = dict(self.counts)
+            constrained = self.constrained
+        total = sum(counts.values())
+        return {
+            "requests": total,
+            **counts,
+            "success_rate": (
+                (counts[PARSE_STRICT] + counts[PARSE_REPAIRED]) / total if total else None
+            ),
+            "constrained": constrained,
+        }
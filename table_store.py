@@ -0,0 +1,85 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SHEETS_DIR = "sheets"
+PARQUET_COMPRESSION = "zstd"
+ROW_GROUP_SIZE = 10_000  # 청크 단위로 읽을 때 한 번에 읽는 행 수의 단위
+
+
+def table_path(name):
+    return os.path.join(SHEETS_DIR, f"{name}.parquet")
+
+
+def excel_path(name):
+    return os.path.join(SHEETS_DIR, f"{name}.xlsx")
+
+
+def _to_arrow(df):
+    """
+    문자열/결측값이 섞인 object 열을 문자열 타입으로 고정해 Arrow 테이블로 변환합니다.
+    (엑셀에서 읽은 열은 숫자와 문자열이 섞여 있는 경우가 있어 그대로는 저장되지 않음)
+    """
+    df = df.copy()
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].astype("string")
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def save_table(df, name, export_excel=False):
+    """
+    단계 사이의 작업 데이터를 sheets/<name>.parquet로 저장합니다.
+    export_excel=True이면 사람이 보기 위한 sheets/<name>.xlsx도 함께 저장합니다.
+    """
+    os.makedirs(SHEETS_DIR, exist_ok=True)
+    path = table_path(name)
+    pq.write_table(
+        _to_arrow(df),
+        path,
+        compression=PARQUET_COMPRESSION,
+        row_group_size=ROW_GROUP_SIZE,
+    )
+    if export_excel:
+        df.to_excel(excel_path(name), index=False)
+        # 내보낸 엑셀이 parquet보다 새것으로 보여 다음 load_table에서 다시 변환되지 않도록
+        # 수정 시각을 parquet과 맞춤 (사람이 엑셀을 고쳐 저장하면 그때는 다시 변환됨)
+        parquet_mtime = os.stat(path).st_mtime_ns
+        os.utime(excel_path(name), ns=(parquet_mtime, parquet_mtime))
+    return path
+
+
+def _ensure_parquet(name):
+    """
+    parquet 파일이 없거나 같은 이름의 엑셀 파일보다 오래됐으면 엑셀을 한 번 변환해 둡니다.
+    (listly에서 받은 SINGLE_*.xlsx나 직접 관리하는 corp_list.xlsx 같은 입력용)
+    """
+    path = table_path(name)
+    source = excel_path(name)
+    if os.path.exists(source) and (
+        not os.path.exists(path) or os.path.getmtime(source) > os.path.getmtime(path)
+    ):
+        print(f"  -> '{source}'를 '{path}'로 변환합니다.")
+        save_table(pd.read_excel(source), name)
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return path
+
+
+def load_table(name, columns=None):
+    """
+    sheets/<name>.parquet을 DataFrame으로 읽습니다. columns를 주면 해당 열만 읽습니다.
+    parquet이 없고 엑셀 파일만 있으면 변환한 뒤 읽습니다. 둘 다 없으면 FileNotFoundError를 냅니다.
+    """
+    return pq.read_table(_ensure_parquet(name), columns=columns).to_pandas()
+
+
+def iter_table(name, batch_size=ROW_GROUP_SIZE, columns=None):
+    """
+    sheets/<name>.parquet을 batch_size행씩 DataFrame으로 나눠 읽습니다.
+    """
+    parquet_file = pq.ParquetFile(_ensure_parquet(name))
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield batch.to_pandas()
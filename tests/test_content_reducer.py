@@ -0,0 +1,22 @@
+from content_reducer import estimate_tokens, reduce_content
+
+
+def test_single_long_paragraph_is_cut_to_budget():
+    # 줄바꿈 없이 한 문단으로 된 공고가 빈 문자열로 줄어들지 않아야 함
+    html = f"<html><body><p>{'가' * 10_000}</p></body></html>"
+
+    text, stats = reduce_content(html, token_budget=4096)
+
+    assert stats["reduced_chars"] > 0
+    assert estimate_tokens(text) <= 4096
+
+
+def test_line_after_budget_is_cut_not_dropped():
+    html = "<html><body><p>짧은 소개</p><p>" + "자격요건 설명 " * 2000 + "</p></body></html>"
+
+    text, _ = reduce_content(html, token_budget=100)
+
+    lines = text.split("\n")
+    assert lines[0] == "짧은 소개"
+    assert len(lines) == 2 and lines[1]
+    assert estimate_tokens(text) <= 100
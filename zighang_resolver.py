@@ -0,0 +1,128 @@
+import json
+import re
+from urllib.parse import urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from static_fetcher import DEFAULT_HEADERS
+
+# 페이지 데이터(__NEXT_DATA__ 등)에서 원본 공고 주소가 들어있을 만한 키
+APPLY_URL_KEYS = (
+    "applyUrl",
+    "apply_url",
+    "applyLink",
+    "originalUrl",
+    "original_url",
+    "originUrl",
+    "sourceUrl",
+    "source_url",
+    "externalUrl",
+    "recruitUrl",
+)
+# 어디에나 쓰이는 "url" 키는 지원/채용 정보를 담은 노드 안에 있을 때만 원본 공고 주소로 봄
+# (로고 CDN, 회사 홈페이지, og:image, 관련 공고의 주소가 섞여 나오지 않도록)
+GENERIC_URL_KEY = "url"
+APPLY_NODE_PATTERN = re.compile(r"apply|application|recruit", re.IGNORECASE)
+# 이미지/정적 리소스 주소는 원본 공고가 아님
+STATIC_ASSET_PATTERN = re.compile(
+    r"\.(png|jpe?g|gif|webp|avif|svg|ico|bmp|css|js|mjs|map|woff2?|ttf|otf|eot|mp4|webm|mp3)$",
+    re.IGNORECASE,
+)
+
+
+def get_posting_id(zighang_link):
+    """
+    직행 공고 링크에서 공고 ID(경로의 마지막 조각)를 반환합니다.
+    """
+    path = urlparse(zighang_link).path.rstrip("/")
+    return path.rsplit("/", 1)[-1] if path else zighang_link
+
+
+def _is_outbound(url):
+    """
+    직행 밖의 주소이고 이미지/정적 리소스가 아니면 True를 반환합니다.
+    """
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    return (
+        bool(host)
+        and "zighang.com" not in host
+        and not STATIC_ASSET_PATTERN.search(parsed.path)
+    )
+
+
+def _find_in_page_data(data):
+    """
+    JSON으로 된 페이지 데이터를 순회하며 외부 공고 주소를 찾습니다.
+    APPLY_URL_KEYS의 앞쪽 키일수록 우선하고, 지원/채용 노드 안의 "url"은 가장 나중에 씁니다.
+    """
+    keys = APPLY_URL_KEYS + (GENERIC_URL_KEY,)
+    found = {}
+    # (노드, 지원/채용 정보를 담은 노드 안인지)
+    stack = [(data, False)]
+    while stack:
+        node, in_apply_node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                accepted = key in APPLY_URL_KEYS or (key == GENERIC_URL_KEY and in_apply_node)
+                if (
+                    accepted
+                    and isinstance(value, str)
+                    and _is_outbound(value)
+                    and key not in found
+                ):
+                    found[key] = value
+                elif isinstance(value, (dict, list)):
+                    stack.append((value, in_apply_node or bool(APPLY_NODE_PATTERN.search(key))))
+        elif isinstance(node, list):
+            stack.extend((item, in_apply_node) for item in node)
+    for key in keys:
+        if key in found:
+            return found[key]
+    return None
+
+
+def extract_apply_url(html, page_url):
+    """
+    직행 공고 페이지의 HTML에서 '지원하기' 버튼이 여는 원본 공고 주소를 찾습니다.
+    찾지 못하면 None을 반환합니다.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # 1. '지원하기' 텍스트를 가진 링크
+    for tag in soup.find_all("a", href=True):
+        if "지원하기" in tag.get_text(strip=True):
+            href = urljoin(page_url, tag["href"])
+            if _is_outbound(href):
+                return href
+
+    # 2. Next.js 페이지 데이터
+    next_data = soup.find("script", id="__NEXT_DATA__")
+    if next_data and next_data.string:
+        try:
+            url = _find_in_page_data(json.loads(next_data.string))
+        except json.JSONDecodeError:
+            url = None
+        if url:
+            return url
+
+    # 3. 그 밖의 인라인 스크립트에 들어있는 "applyUrl":"..." 형태
+    # (RSC 스트림처럼 문자열 안에 이스케이프된 JSON도 처리하도록 먼저 이스케이프를 풂)
+    for script in soup.find_all("script"):
+        text = (script.string or "").replace("\\/", "/").replace('\\"', '"')
+        for key in APPLY_URL_KEYS:
+            match = re.search(rf'"{key}"\s*:\s*"(https?://[^"\s]+)"', text)
+            if match and _is_outbound(match.group(1)):
+                return match.group(1)
+    return None
+
+
+def resolve_without_browser(zighang_link, session=None, timeout=10):
+    """
+    브라우저 없이 직행 공고 페이지를 받아와서 원본 공고 주소를 찾습니다.
+    """
+    session = session or requests.Session()
+    response = session.get(zighang_link, headers=DEFAULT_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    return extract_apply_url(response.text, zighang_link)